@@ -143,7 +143,7 @@ def generate_trading_signals(coin_data: dict) -> dict:
         decision = strategy.analyze(coin_data.get('name', 'UNKNOWN'), market_data, tech_indicators, news_analysis)
         
         return {
-            'signal': decision.signal.value,
+            'signal': decision.signal.name,
             'confidence': decision.confidence,
             'reasoning': decision.reasoning,
             'strategy_name': 'moderate_momentum'
@@ -20,19 +20,47 @@ Version: 1.0
 
 import os
 import sys
+import csv
 import time
 import json
-import schedule
+import bisect
+import asyncio
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
+from datetime import date, datetime, timedelta
+from functools import lru_cache
 from typing import Dict, List
-import requests
+import aiohttp
 from performance_tracker import PerformanceTracker
 from dotenv import load_dotenv
+from collections import namedtuple
 
 # .env Datei laden
 load_dotenv()
 
+# Flacher History-Eintrag: nur die später konsumierten Skalare, keine
+# geteilten Referenzen auf die verschachtelten Metrik-Dicts
+PerformanceSnapshot = namedtuple('PerformanceSnapshot', [
+    'timestamp', 'total_signals', 'success_rate_percent', 'average_roi', 'total_roi'
+])
+
+# Status-Stufen als Tabelle statt if/elif-Leiter; negierte Schwellen,
+# damit bisect auf einer aufsteigenden Liste suchen kann
+_STATUS_THRESHOLDS = (-70, -50, -40)
+_STATUS_TABLE = (('🎉', 'Exzellent'), ('✅', 'Gut'), ('🟡', 'Okay'), ('🔴', 'Schlecht'))
+
+# High-Confidence Buckets für die Alert-Prüfung. Der Label-Raum ist
+# statisch (confidence_labels in performance_tracker.py) — die Menge aus
+# den Live-Keys einzufrieren wäre falsch: Buckets ohne Signale beim
+# ersten Load blieben sonst dauerhaft unüberwacht.
+_HIGH_CONF_KEYS = frozenset({'High (50-70%)', 'Very High (70-100%)'})
+
+
+@lru_cache(maxsize=1)
+def _date_tag(day_ordinal: int) -> str:
+    """Datums-String für Dateinamen, einmal pro Tag formatiert"""
+    return datetime.fromordinal(day_ordinal).strftime('%Y%m%d')
+
 class PerformanceMonitor:
     """Automatisches Performance-Monitoring System"""
     
@@ -45,33 +73,70 @@ class PerformanceMonitor:
             'max_loss_threshold': -20.0,  # Maximum Verlust in %
             'min_signals_for_analysis': 5  # Minimum Anzahl Signale für Analyse
         }
+        # Memoization: (key, metrics) bzw. (key, alerts) der letzten Berechnung
+        self._metrics_cache = None
+        self._alerts_cache = None
+        # (Zeitstempel, Metriken) des letzten erfolgreichen Checks; erlaubt
+        # dem Daily-Report, einen frischen Sheets-Load zu überspringen
+        self._last_metrics = None
+        # Telegram-Credentials einmalig auflösen statt pro Sendung
+        self._tg_token = os.getenv('TELEGRAM_BOT_TOKEN')
+        self._tg_chat = os.getenv('TELEGRAM_CHAT_ID')
+        self._tg_url = f"https://api.telegram.org/bot{self._tg_token}/sendMessage" if self._tg_token else None
+        if not self._tg_token or not self._tg_chat:
+            print("⚠️ Telegram-Credentials nicht konfiguriert - Benachrichtigungen deaktiviert")
+
+    def _signals_cache_key(self, signals: List) -> tuple:
+        """Schneller Fingerprint der analysierten Signale für Cache-Lookups"""
+        return (
+            len(signals),
+            signals[-1].signal_timestamp,
+            hash(tuple((s.coin, s.roi_percent) for s in signals[-5:]))
+        )
+
+    def get_performance_metrics(self, signals: List) -> Dict:
+        """Berechnet Metriken, überspringt die Aggregation bei unverändertem Input"""
+        key = self._signals_cache_key(signals)
+        if self._metrics_cache is not None and self._metrics_cache[0] == key:
+            return self._metrics_cache[1]
+
+        metrics = self.tracker.calculate_performance_metrics()
+        self._metrics_cache = (key, metrics)
+        self._alerts_cache = None  # Alerts hängen von den Metriken ab
+        return metrics
+
+    def invalidate_metrics_cache(self):
+        """Verwirft gecachte Metriken (z.B. nach neuem Sheets-Load-Fehler)"""
+        self._metrics_cache = None
+        self._alerts_cache = None
     
-    def send_telegram_alert(self, message: str) -> bool:
-        """Sendet eine Telegram-Benachrichtigung"""
+    async def send_telegram_alert(self, message: str) -> bool:
+        """Sendet eine Telegram-Benachrichtigung (async, non-blocking)"""
         try:
-            bot_token = os.getenv('TELEGRAM_BOT_TOKEN')
-            chat_id = os.getenv('TELEGRAM_CHAT_ID')
-            
-            if not bot_token or not chat_id:
-                print("⚠️ Telegram-Credentials nicht konfiguriert")
+            if self._tg_url is None or not self._tg_chat:
                 return False
-            
-            url = f"https://api.telegram.org/bot{bot_token}/sendMessage"
+
             data = {
-                'chat_id': chat_id,
+                'chat_id': self._tg_chat,
                 'text': message,
                 'parse_mode': 'HTML'
             }
-            
-            response = requests.post(url, data=data, timeout=10)
-            return response.status_code == 200
-            
+
+            timeout = aiohttp.ClientTimeout(total=10)
+            async with aiohttp.ClientSession(timeout=timeout) as session:
+                async with session.post(self._tg_url, data=data) as response:
+                    return response.status == 200
+
         except Exception as e:
             print(f"❌ Fehler beim Senden der Telegram-Nachricht: {e}")
             return False
     
     def check_performance_alerts(self, metrics: Dict) -> List[str]:
         """Prüft auf Performance-Alerts und gibt Warnungen zurück"""
+        # Reine Funktion der Metriken: bei gecachten Metriken auch Alerts wiederverwenden
+        if self._alerts_cache is not None and self._metrics_cache is not None and metrics is self._metrics_cache[1]:
+            return self._alerts_cache
+
         alerts = []
         
         # Erfolgsrate prüfen
@@ -86,11 +151,18 @@ class PerformanceMonitor:
         
         # Prüfe auf schlechte Performance bei hoher Konfidenz
         by_confidence = metrics.get('by_confidence', {})
-        for conf_level, data in by_confidence.items():
-            if 'High' in conf_level or 'Very High' in conf_level:
-                if data.get('success_rate', 0) < 50:
-                    alerts.append(f"🔴 {conf_level} Konfidenz-Signale haben nur {data['success_rate']:.1f}% Erfolgsrate!")
-        
+
+        high_conf_keys = sorted(_HIGH_CONF_KEYS & by_confidence.keys())
+        if high_conf_keys:
+            success_rates = np.fromiter(
+                (by_confidence[k].get('success_rate', 0) for k in high_conf_keys),
+                dtype=float, count=len(high_conf_keys)
+            )
+            for conf_level, rate in zip(high_conf_keys, success_rates):
+                if rate < 50:
+                    alerts.append(f"🔴 {conf_level} Konfidenz-Signale haben nur {rate:.1f}% Erfolgsrate!")
+
+        self._alerts_cache = alerts
         return alerts
     
     def generate_performance_summary(self, metrics: Dict) -> str:
@@ -103,19 +175,8 @@ class PerformanceMonitor:
         total_roi = metrics.get('total_roi', 0)
         avg_roi = metrics.get('average_roi', 0)
         
-        # Bestimme Performance-Status
-        if success_rate >= 70:
-            status_emoji = "🎉"
-            status_text = "Exzellent"
-        elif success_rate >= 50:
-            status_emoji = "✅"
-            status_text = "Gut"
-        elif success_rate >= 40:
-            status_emoji = "🟡"
-            status_text = "Okay"
-        else:
-            status_emoji = "🔴"
-            status_text = "Schlecht"
+        # Bestimme Performance-Status per Tabellen-Lookup
+        status_emoji, status_text = _STATUS_TABLE[bisect.bisect_left(_STATUS_THRESHOLDS, -success_rate)]
         
         summary = f"""
 📊 <b>Trading Performance Update</b>
@@ -128,14 +189,17 @@ class PerformanceMonitor:
 • ⌀ ROI: {avg_roi:+.2f}%
 
 🎯 <b>Nach Signal-Typ:</b>"""
-        
+
+        # Segmente sammeln und einmal joinen statt quadratischer String-Konkatenation
         by_signal = metrics.get('by_signal_type', {})
-        for signal_type, data in by_signal.items():
-            summary += f"\n• {signal_type}: {data['success_rate']:.1f}% ({data['count']}x)"
-        
-        return summary
+        parts = [summary]
+        parts.extend(
+            f"\n• {signal_type}: {data['success_rate']:.1f}% ({data['count']}x)"
+            for signal_type, data in by_signal.items()
+        )
+        return "".join(parts)
     
-    def run_performance_check(self) -> bool:
+    async def run_performance_check(self) -> bool:
         """Führt eine vollständige Performance-Prüfung durch"""
         try:
             print(f"🔄 Performance-Check gestartet: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
@@ -143,22 +207,27 @@ class PerformanceMonitor:
             # Lade aktuelle Daten
             if not self.tracker.load_data_from_sheets():
                 print("❌ Fehler beim Laden der Google Sheets Daten")
+                self.invalidate_metrics_cache()
                 return False
-            
+
             # Analysiere Signale
             signals = self.tracker.analyze_signals()
             if len(signals) < self.alert_thresholds['min_signals_for_analysis']:
                 print(f"⚠️ Zu wenige Signale für Analyse: {len(signals)} < {self.alert_thresholds['min_signals_for_analysis']}")
                 return False
-            
-            # Berechne Metriken
-            metrics = self.tracker.calculate_performance_metrics()
+
+            # Berechne Metriken (Cache-Hit überspringt die Aggregation)
+            metrics = self.get_performance_metrics(signals)
+            self._last_metrics = (time.time(), metrics)
             
             # Speichere in History
-            self.performance_history.append({
-                'timestamp': datetime.now(),
-                'metrics': metrics.copy()
-            })
+            self.performance_history.append(PerformanceSnapshot(
+                timestamp=datetime.now(),
+                total_signals=metrics.get('total_signals', 0),
+                success_rate_percent=metrics.get('success_rate_percent', 0.0),
+                average_roi=metrics.get('average_roi', 0.0),
+                total_roi=metrics.get('total_roi', 0.0)
+            ))
             
             # Prüfe Alerts
             alerts = self.check_performance_alerts(metrics)
@@ -166,9 +235,12 @@ class PerformanceMonitor:
             # Sende Alerts falls nötig
             if alerts:
                 alert_message = "🚨 <b>Performance Alerts</b>\n\n" + "\n".join(alerts)
-                self.send_telegram_alert(alert_message)
+                await self.send_telegram_alert(alert_message)
                 print(f"🚨 {len(alerts)} Performance-Alerts gesendet")
             
+            # Gesammelte Sheet-Updates als ein einziger Roundtrip
+            self.tracker.flush_batch()
+
             print(f"✅ Performance-Check abgeschlossen: {metrics['success_rate_percent']:.1f}% Erfolgsrate")
             return True
             
@@ -176,95 +248,167 @@ class PerformanceMonitor:
             print(f"❌ Fehler beim Performance-Check: {e}")
             return False
     
-    def generate_daily_report(self):
+    async def generate_daily_report(self):
         """Generiert einen täglichen Performance-Report"""
         try:
             print("📊 Generiere täglichen Performance-Report...")
             
-            if not self.tracker.load_data_from_sheets():
-                return
-            
-            signals = self.tracker.analyze_signals()
-            if not signals:
-                print("❌ Keine Signale für täglichen Report")
-                return
-            
-            metrics = self.tracker.calculate_performance_metrics()
+            # Lief der 30-Minuten-Check gerade erst, Metriken wiederverwenden
+            # statt Sheets erneut zu laden
+            if self._last_metrics is not None and time.time() - self._last_metrics[0] < 1800:
+                metrics = self._last_metrics[1]
+            else:
+                if not self.tracker.load_data_from_sheets():
+                    self.invalidate_metrics_cache()
+                    return
+
+                signals = self.tracker.analyze_signals()
+                if not signals:
+                    print("❌ Keine Signale für täglichen Report")
+                    return
+
+                metrics = self.get_performance_metrics(signals)
+                self._last_metrics = (time.time(), metrics)
             
             # Erstelle Telegram-Summary
             summary = self.generate_performance_summary(metrics)
             summary += f"\n\n📅 Report vom: {datetime.now().strftime('%d.%m.%Y %H:%M')}"
             
             # Sende Telegram-Report
-            if self.send_telegram_alert(summary):
+            if await self.send_telegram_alert(summary):
                 print("✅ Täglicher Report per Telegram gesendet")
             
             # Speichere detaillierten Report
-            filename = self.tracker.save_report(f"daily_report_{datetime.now().strftime('%Y%m%d')}.txt")
+            filename = self.tracker.save_report(f"daily_report_{_date_tag(date.today().toordinal())}.txt")
             
-            # CSV Export für weitere Analyse
-            self.export_to_csv()
+            # Parquet Export für weitere Analyse (CSV nur noch ad-hoc via CLI)
+            self.export_to_parquet()
             
         except Exception as e:
             print(f"❌ Fehler beim Erstellen des täglichen Reports: {e}")
     
+    def export_to_parquet(self) -> str:
+        """Exportiert Performance-Daten als Parquet (zstd-komprimiert)
+
+        ~5-10x kleiner als CSV, behält Datentypen und lädt deutlich
+        schneller beim nächsten Einlesen. CSV bleibt für manuelle
+        Inspektion über `export_to_csv` verfügbar.
+        """
+        try:
+            if not self.tracker.processed_signals:
+                return ""
+
+            df = self._signals_dataframe()
+            filename = f"trading_signals_export_{_date_tag(date.today().toordinal())}.parquet"
+            df.to_parquet(filename, engine='pyarrow', compression='zstd', index=False)
+
+            print(f"📄 Parquet Export erstellt: {filename}")
+            return filename
+
+        except Exception as e:
+            print(f"❌ Fehler beim Parquet-Export: {e}")
+            return ""
+
+    def _signals_dataframe(self) -> pd.DataFrame:
+        """Konvertiert die analysierten Signale in einen Export-DataFrame"""
+        data = []
+        for signal in self.tracker.processed_signals:
+            data.append({
+                'Timestamp': signal.signal_timestamp,
+                'Coin': signal.coin,
+                'Signal': signal.signal,
+                'Confidence': signal.confidence,
+                'Signal_Price': signal.signal_price,
+                'Current_Price': signal.current_price,
+                'ROI_Percent': signal.roi_percent,
+                'Holding_Period_Days': signal.holding_period_days,
+                'Strategy_Name': signal.strategy_name,
+                'Reasoning': signal.reasoning,
+                'Successful': signal.roi_percent > 0
+            })
+
+        return pd.DataFrame(data)
+
+    _CSV_HEADER = (
+        'Timestamp', 'Coin', 'Signal', 'Confidence', 'Signal_Price',
+        'Current_Price', 'ROI_Percent', 'Holding_Period_Days',
+        'Strategy_Name', 'Reasoning', 'Successful'
+    )
+
     def export_to_csv(self) -> str:
-        """Exportiert Performance-Daten als CSV"""
+        """Exportiert Performance-Daten als CSV (für manuelle Inspektion)
+
+        Schreibt die Signale in einem Durchlauf mit csv.writer — ohne
+        den Umweg über einen vollen DataFrame.
+        """
         try:
             if not self.tracker.processed_signals:
                 return ""
-            
-            # Konvertiere zu DataFrame
-            data = []
-            for signal in self.tracker.processed_signals:
-                data.append({
-                    'Timestamp': signal.signal_timestamp,
-                    'Coin': signal.coin,
-                    'Signal': signal.signal,
-                    'Confidence': signal.confidence,
-                    'Signal_Price': signal.signal_price,
-                    'Current_Price': signal.current_price,
-                    'ROI_Percent': signal.roi_percent,
-                    'Holding_Period_Days': signal.holding_period_days,
-                    'Strategy_Name': signal.strategy_name,
-                    'Reasoning': signal.reasoning,
-                    'Successful': signal.roi_percent > 0
-                })
-            
-            df = pd.DataFrame(data)
-            filename = f"trading_signals_export_{datetime.now().strftime('%Y%m%d')}.csv"
-            df.to_csv(filename, index=False, encoding='utf-8')
-            
+
+            filename = f"trading_signals_export_{_date_tag(date.today().toordinal())}.csv"
+            with open(filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerow(self._CSV_HEADER)
+                writer.writerows(
+                    (s.signal_timestamp, s.coin, s.signal, s.confidence,
+                     s.signal_price, s.current_price, s.roi_percent,
+                     s.holding_period_days, s.strategy_name, s.reasoning,
+                     s.roi_percent > 0)
+                    for s in self.tracker.processed_signals
+                )
+
             print(f"📄 CSV Export erstellt: {filename}")
             return filename
-            
+
         except Exception as e:
             print(f"❌ Fehler beim CSV-Export: {e}")
             return ""
     
-    def start_monitoring(self):
-        """Startet das kontinuierliche Monitoring"""
-        print("🚀 Trading Performance Monitor gestartet")
-        print("=" * 50)
-        
-        # Plane regelmäßige Tasks
-        schedule.every(30).minutes.do(self.run_performance_check)
-        schedule.every().day.at("09:00").do(self.generate_daily_report)
-        schedule.every().day.at("18:00").do(self.generate_daily_report)
-        
+    async def _performance_check_loop(self):
+        """Performance-Check alle 30 Minuten, exakt auf die halbe Stunde ausgerichtet"""
+        while True:
+            # Schlafe bis zur nächsten vollen halben Stunde statt minütlich zu pollen
+            delay_until_next_check = 1800 - (time.time() % 1800)
+            await asyncio.sleep(delay_until_next_check)
+            await self.run_performance_check()
+
+    async def _daily_report_loop(self):
+        """Täglicher Report um 09:00 und 18:00 Uhr"""
+        report_hours = (9, 18)
+        while True:
+            now = datetime.now()
+            next_runs = []
+            for hour in report_hours:
+                slot = now.replace(hour=hour, minute=0, second=0, microsecond=0)
+                if slot <= now:
+                    slot += timedelta(days=1)
+                next_runs.append(slot)
+            next_run = min(next_runs)
+            await asyncio.sleep((next_run - now).total_seconds())
+            await self.generate_daily_report()
+
+    async def _main(self):
+        """Haupt-Event-Loop: Check- und Report-Timer laufen nebenläufig"""
         # Initial Check
-        self.run_performance_check()
-        
+        await self.run_performance_check()
+
         print("⏰ Geplante Tasks:")
         print("• Performance Check: Alle 30 Minuten")
         print("• Täglicher Report: 09:00 und 18:00 Uhr")
         print("\n🔄 Monitoring läuft... (Strg+C zum Beenden)")
-        
+
+        await asyncio.gather(
+            self._performance_check_loop(),
+            self._daily_report_loop()
+        )
+
+    def start_monitoring(self):
+        """Startet das kontinuierliche Monitoring"""
+        print("🚀 Trading Performance Monitor gestartet")
+        print("=" * 50)
+
         try:
-            while True:
-                schedule.run_pending()
-                time.sleep(60)  # Check every minute
-                
+            asyncio.run(self._main())
         except KeyboardInterrupt:
             print("\n🛑 Monitoring gestoppt")
 
@@ -280,10 +424,10 @@ def main():
         
         if command == 'check':
             # Einmaliger Performance-Check
-            monitor.run_performance_check()
+            asyncio.run(monitor.run_performance_check())
         elif command == 'report':
             # Einmaliger Report
-            monitor.generate_daily_report()
+            asyncio.run(monitor.generate_daily_report())
         elif command == 'export':
             # CSV Export
             monitor.tracker.load_data_from_sheets()
@@ -10,11 +10,15 @@ Diese Datei enthält alle einstellbaren Parameter für:
 """
 
 import os
-from typing import Dict, List, Any, Optional
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from functools import lru_cache
 
 # === API KONFIGURATION ===
-API_CONFIG = {
+# Konfigurations-Dicts sind als MappingProxyType eingefroren: Aufrufer
+# können sie nicht versehentlich mutieren.
+API_CONFIG: Mapping[str, Any] = MappingProxyType({
     'bitvavo_timeout': 30,      # Timeout für Bitvavo API-Calls in Sekunden
     'telegram_timeout': 10,     # Timeout für Telegram API-Calls
     'news_api_timeout': 15,     # Timeout für News API-Calls
@@ -24,25 +28,28 @@ API_CONFIG = {
     'max_workers': None,        # Dynamisch berechnet basierend auf CPU-Kernen
     'retry_attempts': 3,        # Anzahl Wiederholungsversuche bei API-Fehlern
     'rate_limit_delay': 0.2,    # Sekunden zwischen API-Calls für Rate Limiting
-}
+})
 
 # === COINS ZUR ANALYSE ===
-COINS_TO_ANALYZE: Dict[str, Dict[str, str]] = {
+COINS_TO_ANALYZE: Mapping[str, Dict[str, str]] = MappingProxyType({
     'Bitcoin': {'symbol': 'BTC'}, 'Ethereum': {'symbol': 'ETH'}, 'Solana': {'symbol': 'SOL'},
     'Cardano': {'symbol': 'ADA'}, 'Avalanche': {'symbol': 'AVAX'}, 'Chainlink': {'symbol': 'LINK'},
     'Polkadot': {'symbol': 'DOT'}, 'Dogecoin': {'symbol': 'DOGE'}, 'Toncoin': {'symbol': 'TON'},
     'Ethena': {'symbol': 'ENA'}, 'Ondo': {'symbol': 'ONDO'}, 'XRP': {'symbol': 'XRP'}, 'BNB': {'symbol': 'BNB'},
-}
+})
+
+# Flaches Symbol-Tupel für Hot-Loops, die nur das Kürzel brauchen
+COIN_SYMBOLS: Tuple[str, ...] = tuple(v['symbol'] for v in COINS_TO_ANALYZE.values())
 
 # Erweiterte Suchbegriffe für bessere News-Coverage
-COIN_SEARCH_TERMS = {
+COIN_SEARCH_TERMS: Mapping[str, Any] = MappingProxyType({
     'Bitcoin': ['Bitcoin', 'BTC', 'digital gold'], 'Ethereum': ['Ethereum', 'ETH', 'smart contracts'], 
     'Solana': ['Solana', 'SOL'], 'Cardano': ['Cardano', 'ADA'], 'Avalanche': ['Avalanche', 'AVAX'], 
     'Chainlink': ['Chainlink', 'LINK', 'oracle'], 'Polkadot': ['Polkadot', 'DOT'], 
     'Dogecoin': ['Dogecoin', 'DOGE', 'meme coin'], 'Toncoin': ['Toncoin', 'TON'],
     'Ethena': ['Ethena', 'ENA'], 'Ondo': ['Ondo', 'ONDO'], 
     'XRP': ['XRP', 'Ripple'], 'BNB': ['BNB', 'Binance'],
-}
+})
 
 # === NEWS & AI KONFIGURATION ===
 QUALITY_SOURCES = [
@@ -57,7 +64,7 @@ CRITICAL_KEYWORDS = [
 ]
 
 # === TECHNISCHE ANALYSE PARAMETER ===
-TECHNICAL_CONFIG = {
+TECHNICAL_CONFIG: Mapping[str, Any] = MappingProxyType({
     'ma_trend_buffer': 0.02,           # 2% Puffer für MA-Trend-Erkennung
     'macd_threshold': 0.0001,          # MACD Histogram Schwellwert für Signale
     'volume_increase_threshold': 1.5,   # Faktor für erhöhtes Volumen
@@ -72,10 +79,10 @@ TECHNICAL_CONFIG = {
     'macd_signal': 9,                  # MACD Signal Line
     'bb_period': 20,                   # Bollinger Bands Periode
     'bb_std': 2,                       # Bollinger Bands Standardabweichungen
-}
+})
 
 # === ALERT SCHWELLENWERTE ===
-ALERT_THRESHOLDS = {
+ALERT_THRESHOLDS: Mapping[str, Any] = MappingProxyType({
     'breakout_percentage': 2.0,        # % über Bollinger Band für Breakout
     'rsi_oversold': 25,               # RSI unter diesem Wert = Alert
     'rsi_overbought': 75,             # RSI über diesem Wert = Alert
@@ -84,10 +91,10 @@ ALERT_THRESHOLDS = {
     'atr_extreme_high': 5.0,          # ATR % für extreme Volatilität
     'atr_extreme_low': 1.0,           # ATR % für sehr niedrige Volatilität
     'atr_trend_threshold': 3.0,       # ATR % ab dem Trend-Alerts ausgelöst werden
-}
+})
 
 # === NEUE SIMULATION KONFIGURATION ===
-SIMULATION_CONFIG = {
+SIMULATION_CONFIG: Mapping[str, Any] = MappingProxyType({
     'initial_balance': 10000.0,       # Startkapital für Simulation (EUR)
     'transaction_fee': 0.0025,        # 0.25% Transaktionsgebühr
     'slippage': 0.001,                # 0.1% Slippage
@@ -96,7 +103,7 @@ SIMULATION_CONFIG = {
     'rebalance_threshold': 0.05,      # 5% Abweichung für Rebalancing
     'backtest_days': 90,              # Tage für Backtesting
     'performance_benchmark': 'BTC',    # Benchmark für Performance-Vergleich
-}
+})
 
 # === TRADING STRATEGIEN ===
 @dataclass
@@ -179,13 +186,13 @@ STRATEGIES = {
 }
 
 # === PERFORMANCE METRIKEN ===
-PERFORMANCE_CONFIG = {
+PERFORMANCE_CONFIG: Mapping[str, Any] = MappingProxyType({
     'benchmark_symbols': ['BTC', 'ETH'],  # Vergleichs-Assets
     'risk_free_rate': 0.02,              # 2% risikofreier Zinssatz für Sharpe Ratio
     'confidence_level': 0.95,            # Konfidenzniveau für VaR
     'rolling_window': 30,                # Tage für rollende Berechnungen
     'min_trades_for_stats': 10,          # Mindestanzahl Trades für Statistiken
-}
+})
 
 # === UMGEBUNGSVARIABLEN ===
 def get_api_credentials() -> Dict[str, Optional[str]]:
@@ -201,8 +208,13 @@ def get_api_credentials() -> Dict[str, Optional[str]]:
     }
 
 # === VALIDIERUNG ===
-def validate_config() -> List[str]:
-    """Validiert die Konfiguration und gibt Warnungen zurück."""
+@lru_cache(maxsize=1)
+def validate_config() -> Tuple[str, ...]:
+    """Validiert die Konfiguration und gibt Warnungen zurück.
+
+    Umgebungsvariablen und STRATEGIES sind prozessweit konstant, daher
+    wird das Ergebnis nach dem ersten Aufruf gecacht (immutables Tupel).
+    """
     warnings = []
     
     # API-Keys prüfen
@@ -224,15 +236,15 @@ def validate_config() -> List[str]:
     
     if SIMULATION_CONFIG['transaction_fee'] < 0:
         warnings.append("ERROR: Negative Transaktionsgebühren nicht möglich!")
-    
-    return warnings
+
+    return tuple(warnings)
 
 # === PORTFOLIO HISTORY ===
 PORTFOLIO_HISTORY_DAYS = 7  # Letzte 7 Tage für Performance-Vergleich
 
 # === EXPORTIERE HAUPTKONFIGURATIONEN ===
 __all__ = [
-    'API_CONFIG', 'COINS_TO_ANALYZE', 'COIN_SEARCH_TERMS',
+    'API_CONFIG', 'COINS_TO_ANALYZE', 'COIN_SYMBOLS', 'COIN_SEARCH_TERMS',
     'QUALITY_SOURCES', 'CRITICAL_KEYWORDS', 'TECHNICAL_CONFIG',
     'ALERT_THRESHOLDS', 'SIMULATION_CONFIG', 'STRATEGIES',
     'PERFORMANCE_CONFIG', 'get_api_credentials', 'validate_config'
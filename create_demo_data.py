@@ -4,7 +4,7 @@ Demo-Daten für Performance-Tracking Test
 """
 
 import pandas as pd
-import json
+import orjson
 from datetime import datetime, timedelta
 import random
 
@@ -80,9 +80,9 @@ if __name__ == "__main__":
     demo_data = create_demo_data()
     df = pd.DataFrame(demo_data)
     
-    # Speichere als JSON für easy loading
-    with open('demo_trading_data.json', 'w', encoding='utf-8') as f:
-        json.dump(demo_data, f, indent=2, ensure_ascii=False)
+    # Speichere als JSON für easy loading (orjson serialisiert in C, Binary-Mode)
+    with open('demo_trading_data.json', 'wb') as f:
+        f.write(orjson.dumps(demo_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
     
     # Speichere auch als CSV
     df.to_csv('demo_trading_data.csv', index=False, encoding='utf-8')
@@ -4,108 +4,113 @@
 Erstellt realistische Demo-Daten für Performance-Testing
 """
 
-import json
-import pandas as pd
+import orjson
 import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from pyarrow import csv as pacsv
 from datetime import datetime, timedelta
-import random
 
-def create_realistic_demo_data():
-    """Erstellt realistische Demo-Daten für 50 Trading-Signale"""
-    
+
+def create_realistic_demo_data(n_signals: int = 50) -> dict:
+    """Erstellt realistische Demo-Daten für Trading-Signale (vektorisiert)
+
+    Gibt ein Spalten-Dict aus NumPy-Arrays zurück — keine Liste von
+    Zeilen-Dicts, damit CSV/Parquet direkt als Arrow Table geschrieben
+    werden können.
+    """
+
     # Basis-Coins für Demo
-    coins = ['BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOT', 'LINK', 'AVAX', 'DOGE', 'XRP']
-    
+    coins = np.array(['BTC', 'ETH', 'BNB', 'ADA', 'SOL', 'DOT', 'LINK', 'AVAX', 'DOGE', 'XRP'])
+
+    # Realistische Preise (vereinfacht)
+    price_lo = np.array([90000, 3500, 600, 0.7, 150, 8, 20, 35, 0.15, 2.3])
+    price_hi = np.array([105000, 4500, 800, 1.2, 200, 12, 30, 50, 0.25, 2.8])
+
+    rng = np.random.default_rng()
+
     # Zeitraum: Letzte 30 Tage
     end_date = datetime.now()
     start_date = end_date - timedelta(days=30)
-    
-    demo_signals = []
-    
-    for i in range(50):
-        # Zufälliger Zeitpunkt in den letzten 30 Tagen
-        signal_time = start_date + timedelta(
-            seconds=random.randint(0, int((end_date - start_date).total_seconds()))
-        )
-        
-        coin = random.choice(coins)
-        signal_type = random.choice(['BUY', 'SELL'])
-        
-        # Realistische Preise (vereinfacht)
-        price_ranges = {
-            'BTC': (90000, 105000), 'ETH': (3500, 4500), 'BNB': (600, 800),
-            'ADA': (0.7, 1.2), 'SOL': (150, 200), 'DOT': (8, 12),
-            'LINK': (20, 30), 'AVAX': (35, 50), 'DOGE': (0.15, 0.25), 'XRP': (2.3, 2.8)
-        }
-        
-        signal_price = round(random.uniform(*price_ranges[coin]), 4)
-        
-        # Aktueller Preis (simuliert) - 70% der Zeit profitabel
-        if random.random() < 0.7:  # 70% Erfolgsrate
-            if signal_type == 'BUY':
-                current_price = signal_price * random.uniform(1.01, 1.15)  # 1-15% Gewinn
-            else:  # SELL
-                current_price = signal_price * random.uniform(0.85, 0.99)  # 1-15% Gewinn
-        else:  # 30% Verluste
-            if signal_type == 'BUY':
-                current_price = signal_price * random.uniform(0.85, 0.99)  # 1-15% Verlust
-            else:  # SELL
-                current_price = signal_price * random.uniform(1.01, 1.15)  # 1-15% Verlust
-        
-        current_price = round(current_price, 4)
-        
-        # Performance berechnen
-        if signal_type == 'BUY':
-            performance = ((current_price - signal_price) / signal_price) * 100
-        else:  # SELL
-            performance = ((signal_price - current_price) / signal_price) * 100
-        
-        # Confidence (60-95%)
-        confidence = random.randint(60, 95)
-        
-        # Strategie
-        strategy = random.choice(['conservative_trend', 'moderate_momentum', 'aggressive_breakout'])
-        
-        demo_signals.append({
-            'Timestamp': signal_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'Coin': coin,
-            'Strategy_Signal': signal_type,
-            'Signal_Price': signal_price,
-            'Current_Price': current_price,
-            'Performance_Percent': round(performance, 2),
-            'Confidence': confidence,
-            'Strategy': strategy,
-            'Signal_Timestamp': signal_time.strftime('%Y-%m-%d %H:%M:%S'),
-            'Analysis_Result': f"{signal_type} signal for {coin}",
-            'Success': 'Yes' if performance > 0 else 'No'
-        })
-    
-    return demo_signals
+    total_seconds = int((end_date - start_date).total_seconds())
+
+    offsets = rng.integers(0, total_seconds, size=n_signals)
+    signal_times = [start_date + timedelta(seconds=int(s)) for s in offsets]
+    timestamps = np.array([t.strftime('%Y-%m-%d %H:%M:%S') for t in signal_times])
+
+    coin_idx = rng.integers(0, len(coins), size=n_signals)
+    coin_draw = coins[coin_idx]
+    signal_types = rng.choice(np.array(['BUY', 'SELL']), size=n_signals)
+
+    signal_prices = np.round(rng.uniform(price_lo[coin_idx], price_hi[coin_idx]), 4)
+
+    # Aktueller Preis (simuliert) - 70% der Zeit profitabel
+    win = rng.random(n_signals) < 0.7
+    up = rng.uniform(1.01, 1.15, size=n_signals)    # 1-15% Aufschlag
+    down = rng.uniform(0.85, 0.99, size=n_signals)  # 1-15% Abschlag
+    is_buy = signal_types == 'BUY'
+
+    # BUY gewinnt bei steigendem, SELL bei fallendem Preis
+    multiplier = np.where(win == is_buy, up, down)
+    current_prices = np.round(signal_prices * multiplier, 4)
+
+    # Performance berechnen (Vorzeichen hängt vom Signal-Typ ab)
+    raw_perf = (current_prices - signal_prices) / signal_prices * 100
+    performance = np.round(np.where(is_buy, raw_perf, -raw_perf), 2)
+
+    # Confidence (60-95%)
+    confidence = rng.integers(60, 96, size=n_signals)
+
+    # Strategie
+    strategies = rng.choice(
+        np.array(['conservative_trend', 'moderate_momentum', 'aggressive_breakout']),
+        size=n_signals
+    )
+
+    analysis = np.char.add(np.char.add(signal_types, ' signal for '), coin_draw)
+
+    return {
+        'Timestamp': timestamps,
+        'Coin': coin_draw,
+        'Strategy_Signal': signal_types,
+        'Signal_Price': signal_prices,
+        'Current_Price': current_prices,
+        'Performance_Percent': performance,
+        'Confidence': confidence,
+        'Strategy': strategies,
+        'Signal_Timestamp': timestamps,
+        'Analysis_Result': analysis,
+        'Success': np.where(performance > 0, 'Yes', 'No')
+    }
+
 
 def save_demo_data():
-    """Speichert Demo-Daten als JSON und CSV"""
-    demo_data = create_realistic_demo_data()
-    
-    # Als JSON speichern
-    with open('demo_trading_signals.json', 'w', encoding='utf-8') as f:
-        json.dump(demo_data, f, indent=2, ensure_ascii=False)
-    
-    # Als CSV speichern
-    df = pd.DataFrame(demo_data)
-    df.to_csv('demo_trading_signals.csv', index=False, encoding='utf-8')
-    
+    """Speichert Demo-Daten als JSON, CSV und Parquet"""
+    columns = create_realistic_demo_data()
+
+    # Ein Arrow Table für beide Formate — kein pandas-Umweg nötig
+    table = pa.table({name: pa.array(values) for name, values in columns.items()})
+    pacsv.write_csv(table, 'demo_trading_signals.csv')
+    pq.write_table(table, 'demo_trading_signals.parquet', compression='zstd')
+
+    # Als JSON speichern: Zeilen-Dicts für die bestehenden Konsumenten
+    names = list(columns)
+    demo_data = [dict(zip(names, row)) for row in zip(*(columns[n].tolist() for n in names))]
+    with open('demo_trading_signals.json', 'wb') as f:
+        f.write(orjson.dumps(demo_data, option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY))
+
     # Statistiken ausgeben
-    df['Performance_Percent'] = pd.to_numeric(df['Performance_Percent'])
-    successful_signals = len(df[df['Performance_Percent'] > 0])
-    total_signals = len(df)
+    performance = columns['Performance_Percent']
+    successful_signals = int((performance > 0).sum())
+    total_signals = len(performance)
     success_rate = (successful_signals / total_signals) * 100
-    avg_performance = df['Performance_Percent'].mean()
-    
+    avg_performance = performance.mean()
+
     print(f"✅ {total_signals} Demo-Signale erstellt")
     print(f"📈 Erfolgsrate: {success_rate:.1f}% ({successful_signals}/{total_signals})")
     print(f"📊 Durchschnittliche Performance: {avg_performance:.2f}%")
-    print(f"💾 Gespeichert als: demo_trading_signals.json und demo_trading_signals.csv")
-    
+    print(f"💾 Gespeichert als: demo_trading_signals.json, .csv und .parquet")
+
     return demo_data
 
 if __name__ == "__main__":
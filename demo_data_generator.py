@@ -4,137 +4,246 @@ Demo Data Generator für Crypto Analysis Dashboard
 Erstellt realistische CSV-Daten im Google Sheets Format
 """
 
-import csv
-import random
 import datetime
-from decimal import Decimal
-
-def generate_demo_data():
-    """Generiert realistische Krypto-Analysedaten"""
-    
-    # Liste der Kryptowährungen mit realistischen Werten
-    crypto_data = [
-        {"name": "Bitcoin", "symbol": "BTC", "base_price": 43500, "volatility": 0.03},
-        {"name": "Ethereum", "symbol": "ETH", "base_price": 2850, "volatility": 0.04},
-        {"name": "Binance Coin", "symbol": "BNB", "base_price": 295, "volatility": 0.05},
-        {"name": "Cardano", "symbol": "ADA", "base_price": 0.48, "volatility": 0.06},
-        {"name": "Solana", "symbol": "SOL", "base_price": 92, "volatility": 0.07},
-        {"name": "Polkadot", "symbol": "DOT", "base_price": 7.2, "volatility": 0.06},
-        {"name": "Chainlink", "symbol": "LINK", "base_price": 14.8, "volatility": 0.05},
-        {"name": "Polygon", "symbol": "MATIC", "base_price": 0.75, "volatility": 0.08},
-        {"name": "Dogecoin", "symbol": "DOGE", "base_price": 0.085, "volatility": 0.12},
-        {"name": "XRP", "symbol": "XRP", "base_price": 0.52, "volatility": 0.08}
-    ]
-    
-    # CSV Header - exakt wie Backend es erstellt
-    fieldnames = [
-        'timestamp', 'coin', 'current_price', 'price_change_24h', 'price_change_7d',
-        'volume_24h', 'market_cap', 'fear_greed_index', 'rsi', 'macd_signal',
-        'bb_position', 'support_level', 'resistance_level', 'atr', 'stoch_k',
-        'stoch_d', 'williams_r', 'news_sentiment', 'ai_recommendation',
-        'strategy_signal', 'confidence_score', 'stop_loss', 'take_profit',
-        'portfolio_weight', 'portfolio_value'
-    ]
-    
-    # Demo-Daten generieren
-    rows = []
+import numpy as np
+from dataclasses import dataclass
+
+@dataclass(frozen=True, slots=True)
+class Crypto:
+    """Stammdaten einer Kryptowährung für die Demo-Generierung"""
+    name: str
+    symbol: str
+    base_price: float
+    volatility: float
+
+# Kryptowährungen mit realistischen Werten — eingefroren als Tupel von
+# Slots-Dataclasses: Attributzugriff läuft über den C-Level-Slot statt
+# über einen Dict-Hash-Lookup
+CRYPTO_DATA = (
+    Crypto("Bitcoin", "BTC", 43500, 0.03),
+    Crypto("Ethereum", "ETH", 2850, 0.04),
+    Crypto("Binance Coin", "BNB", 295, 0.05),
+    Crypto("Cardano", "ADA", 0.48, 0.06),
+    Crypto("Solana", "SOL", 92, 0.07),
+    Crypto("Polkadot", "DOT", 7.2, 0.06),
+    Crypto("Chainlink", "LINK", 14.8, 0.05),
+    Crypto("Polygon", "MATIC", 0.75, 0.08),
+    Crypto("Dogecoin", "DOGE", 0.085, 0.12),
+    Crypto("XRP", "XRP", 0.52, 0.08),
+)
+
+# Kategorische Auswahl-Pools einmalig als Arrays, statt sie bei jedem
+# Aufruf neu zu allozieren
+_MACD_SIGNALS = np.array(['BUY', 'SELL', 'HOLD'])
+_SENTIMENTS = np.array(['Bullish', 'Bearish', 'Neutral'])
+_SENTIMENTS_DOGE = np.array(['Very Bullish', 'Bullish', 'Bearish', 'Very Bearish', 'Neutral'])
+_AI_RECOMMENDATIONS = np.array(['Strong Buy', 'Buy', 'Hold', 'Sell'])
+_AI_RECOMMENDATIONS_DOGE = np.array(['Strong Buy', 'Buy', 'Hold', 'Sell', 'Speculative Buy'])
+
+# Eine komplette CSV-Zeile als %-Template: der %-Operator formatiert
+# alle 25 Felder in einem C-Level-Durchlauf statt 25 einzelner f-Strings
+_ROW_FMT = (
+    "%s,%s,%.4f,%.2f,%.2f,%.0f,%.0f,%d,%.2f,%s,%.3f,%.4f,%.4f,%.4f,"
+    "%.2f,%.2f,%.2f,%s,%s,%s,%.3f,%.4f,%.4f,%.2f,%.2f\n"
+)
+
+# CSV Header - exakt wie Backend es erstellt
+FIELDNAMES = [
+    'timestamp', 'coin', 'current_price', 'price_change_24h', 'price_change_7d',
+    'volume_24h', 'market_cap', 'fear_greed_index', 'rsi', 'macd_signal',
+    'bb_position', 'support_level', 'resistance_level', 'atr', 'stoch_k',
+    'stoch_d', 'williams_r', 'news_sentiment', 'ai_recommendation',
+    'strategy_signal', 'confidence_score', 'stop_loss', 'take_profit',
+    'portfolio_weight', 'portfolio_value'
+]
+
+def generate_demo_columns(seed=None):
+    """Zieht alle Demo-Spalten als Arrays (eine RNG-Ziehung pro Spalte)
+
+    Gibt ein Dict in FIELDNAMES-Reihenfolge zurück; die Rohwerte werden
+    sowohl vom CSV-Formatter als auch vom Parquet-Writer konsumiert.
+    Der lokale Generator vermeidet den globalen RNG-State (keine
+    Contention bei parallelen Aufrufen); mit seed wird die Ausgabe
+    reproduzierbar.
+    """
+    crypto_data = CRYPTO_DATA
+    n = len(crypto_data)
+    rng = np.random.default_rng(seed)
     current_time = datetime.datetime.now()
-    
-    for i, crypto in enumerate(crypto_data):
-        # Zufällige aber realistische Werte generieren
-        price_change_24h = random.uniform(-8, 12)  # Prozent
-        price_change_7d = random.uniform(-15, 25)   # Prozent
-        
-        current_price = crypto["base_price"] * (1 + random.uniform(-0.02, 0.02))
-        volume_24h = random.uniform(500000000, 15000000000)  # Volumen
-        market_cap = current_price * random.uniform(18000000, 950000000)  # Market Cap
-        
-        # Technische Indikatoren
-        rsi = random.uniform(25, 75)
-        macd_signal = random.choice(['BUY', 'SELL', 'HOLD'])
-        bb_position = random.uniform(0.2, 0.8)  # Bollinger Band Position
-        
-        # Support/Resistance
-        support_level = current_price * random.uniform(0.92, 0.98)
-        resistance_level = current_price * random.uniform(1.02, 1.08)
-        
-        # ATR und Stochastic
-        atr = current_price * random.uniform(0.02, 0.06)
-        stoch_k = random.uniform(20, 80)
-        stoch_d = stoch_k + random.uniform(-5, 5)
-        williams_r = random.uniform(-80, -20)
-        
-        # Sentiment und AI - spezielle Behandlung für Dogecoin
-        if crypto["name"] == "Dogecoin":
-            # Dogecoin hat oft extremere Sentiment-Schwankungen
-            news_sentiment = random.choice(['Very Bullish', 'Bullish', 'Bearish', 'Very Bearish', 'Neutral'])
-            ai_recommendation = random.choice(['Strong Buy', 'Buy', 'Hold', 'Sell', 'Speculative Buy'])
-            # Höhere Volatilität in Confidence Score für Meme Coins
-            confidence_score = random.uniform(0.4, 0.85)
-        else:
-            news_sentiment = random.choice(['Bullish', 'Bearish', 'Neutral'])
-            ai_recommendation = random.choice(['Strong Buy', 'Buy', 'Hold', 'Sell'])
-            confidence_score = random.uniform(0.6, 0.95)
-        
-        strategy_signal = random.choice(['BUY', 'SELL', 'HOLD'])
-        
-        # Stop Loss / Take Profit
-        stop_loss = current_price * random.uniform(0.90, 0.95)
-        take_profit = current_price * random.uniform(1.05, 1.15)
-        
-        # Portfolio Daten
-        portfolio_weight = random.uniform(5, 25)  # Prozent
-        portfolio_value = random.uniform(1000, 50000)  # Euro
-        
-        # Timestamp (verschiedene Zeiten für Realismus)
-        timestamp = (current_time - datetime.timedelta(minutes=i*5)).isoformat()
-        
-        row = {
-            'timestamp': timestamp,
-            'coin': crypto["name"],
-            'current_price': f"{current_price:.4f}",
-            'price_change_24h': f"{price_change_24h:.2f}",
-            'price_change_7d': f"{price_change_7d:.2f}",
-            'volume_24h': f"{volume_24h:.0f}",
-            'market_cap': f"{market_cap:.0f}",
-            'fear_greed_index': random.randint(15, 85),
-            'rsi': f"{rsi:.2f}",
-            'macd_signal': macd_signal,
-            'bb_position': f"{bb_position:.3f}",
-            'support_level': f"{support_level:.4f}",
-            'resistance_level': f"{resistance_level:.4f}",
-            'atr': f"{atr:.4f}",
-            'stoch_k': f"{stoch_k:.2f}",
-            'stoch_d': f"{stoch_d:.2f}",
-            'williams_r': f"{williams_r:.2f}",
-            'news_sentiment': news_sentiment,
-            'ai_recommendation': ai_recommendation,
-            'strategy_signal': strategy_signal,
-            'confidence_score': f"{confidence_score:.3f}",
-            'stop_loss': f"{stop_loss:.4f}",
-            'take_profit': f"{take_profit:.4f}",
-            'portfolio_weight': f"{portfolio_weight:.2f}",
-            'portfolio_value': f"{portfolio_value:.2f}"
-        }
-        
-        rows.append(row)
-    
-    return fieldnames, rows
-
-def create_demo_csv(filename="demo_crypto_data.csv"):
-    """Erstellt eine CSV-Datei mit Demo-Daten"""
-    fieldnames, rows = generate_demo_data()
-    
-    with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-        writer.writeheader()
-        writer.writerows(rows)
-    
+
+    base_prices = np.array([c.base_price for c in crypto_data])
+
+    price_change_24h = rng.uniform(-8, 12, n)   # Prozent
+    price_change_7d = rng.uniform(-15, 25, n)   # Prozent
+
+    current_price = base_prices * (1 + rng.uniform(-0.02, 0.02, n))
+    volume_24h = rng.uniform(500000000, 15000000000, n)            # Volumen
+    market_cap = current_price * rng.uniform(18000000, 950000000, n)  # Market Cap
+
+    # Technische Indikatoren
+    rsi = rng.uniform(25, 75, n)
+    macd_signal = rng.choice(_MACD_SIGNALS, n)
+    bb_position = rng.uniform(0.2, 0.8, n)  # Bollinger Band Position
+
+    # Support/Resistance
+    support_level = current_price * rng.uniform(0.92, 0.98, n)
+    resistance_level = current_price * rng.uniform(1.02, 1.08, n)
+
+    # ATR und Stochastic
+    atr = current_price * rng.uniform(0.02, 0.06, n)
+    stoch_k = rng.uniform(20, 80, n)
+    stoch_d = stoch_k + rng.uniform(-5, 5, n)
+    williams_r = rng.uniform(-80, -20, n)
+
+    # Sentiment und AI - Basis-Ziehung für alle Coins
+    news_sentiment = rng.choice(_SENTIMENTS, n).astype(object)
+    ai_recommendation = rng.choice(_AI_RECOMMENDATIONS, n).astype(object)
+    confidence_score = rng.uniform(0.6, 0.95, n)
+
+    # Spezielle Behandlung für Dogecoin: extremere Sentiment-Schwankungen
+    # und höhere Volatilität im Confidence Score für Meme Coins
+    for i, c in enumerate(crypto_data):
+        if c.name == "Dogecoin":
+            news_sentiment[i] = rng.choice(_SENTIMENTS_DOGE)
+            ai_recommendation[i] = rng.choice(_AI_RECOMMENDATIONS_DOGE)
+            confidence_score[i] = rng.uniform(0.4, 0.85)
+
+    strategy_signal = rng.choice(_MACD_SIGNALS, n)
+
+    # Stop Loss / Take Profit
+    stop_loss = current_price * rng.uniform(0.90, 0.95, n)
+    take_profit = current_price * rng.uniform(1.05, 1.15, n)
+
+    # Portfolio Daten
+    portfolio_weight = rng.uniform(5, 25, n)     # Prozent
+    portfolio_value = rng.uniform(1000, 50000, n)  # Euro
+
+    # Timestamps (verschiedene Zeiten für Realismus) — ein datetime64-
+    # Basiswert plus Offset-Array statt n einzelner timedelta-Objekte,
+    # die ISO-Formatierung läuft einmal vektorisiert
+    base = np.datetime64(current_time.replace(microsecond=0))
+    offsets = np.arange(n, dtype='int64') * np.timedelta64(5, 'm')
+    timestamps = np.datetime_as_string(base - offsets, unit='s')
+
+    return {
+        'timestamp': timestamps,
+        'coin': [c.name for c in crypto_data],
+        'current_price': current_price,
+        'price_change_24h': price_change_24h,
+        'price_change_7d': price_change_7d,
+        'volume_24h': volume_24h,
+        'market_cap': market_cap,
+        'fear_greed_index': rng.integers(15, 86, n),
+        'rsi': rsi,
+        'macd_signal': macd_signal,
+        'bb_position': bb_position,
+        'support_level': support_level,
+        'resistance_level': resistance_level,
+        'atr': atr,
+        'stoch_k': stoch_k,
+        'stoch_d': stoch_d,
+        'williams_r': williams_r,
+        'news_sentiment': news_sentiment,
+        'ai_recommendation': ai_recommendation,
+        'strategy_signal': strategy_signal,
+        'confidence_score': confidence_score,
+        'stop_loss': stop_loss,
+        'take_profit': take_profit,
+        'portfolio_weight': portfolio_weight,
+        'portfolio_value': portfolio_value
+    }
+
+def iter_demo_rows(seed=None):
+    """Generiert realistische Krypto-Analysedaten als fertige CSV-Zeilen
+
+    Lazy als Generator: der Writer konsumiert Zeile für Zeile, Peak-Speicher
+    bleibt O(1 Zeile) statt O(Datensatz) — relevant, sobald der Generator
+    für historische Replays hochskaliert wird.
+    """
+    cols = generate_demo_columns(seed)
+
+    for i in range(len(cols['coin'])):
+        # Werte in FIELDNAMES-Reihenfolge durch das eine Zeilen-Template
+        yield _ROW_FMT % (
+            cols['timestamp'][i],
+            cols['coin'][i],
+            cols['current_price'][i],
+            cols['price_change_24h'][i],
+            cols['price_change_7d'][i],
+            cols['volume_24h'][i],
+            cols['market_cap'][i],
+            cols['fear_greed_index'][i],
+            cols['rsi'][i],
+            cols['macd_signal'][i],
+            cols['bb_position'][i],
+            cols['support_level'][i],
+            cols['resistance_level'][i],
+            cols['atr'][i],
+            cols['stoch_k'][i],
+            cols['stoch_d'][i],
+            cols['williams_r'][i],
+            cols['news_sentiment'][i],
+            cols['ai_recommendation'][i],
+            cols['strategy_signal'][i],
+            cols['confidence_score'][i],
+            cols['stop_loss'][i],
+            cols['take_profit'][i],
+            cols['portfolio_weight'][i],
+            cols['portfolio_value'][i]
+        )
+
+def create_demo_csv(filename="demo_crypto_data.csv", seed=None):
+    """Erstellt eine CSV-Datei mit Demo-Daten
+
+    Die Zeilen kommen bereits fertig formatiert (inkl. Zeilenumbruch) aus
+    iter_demo_rows — der Writer streamt sie direkt in den Block-Puffer.
+    """
+    row_count = 0
+
+    # Großer Block-Puffer: die ganze Datei geht in einem write(2) raus
+    with open(filename, 'w', newline='', encoding='utf-8', buffering=1 << 20) as csvfile:
+        csvfile.write(",".join(FIELDNAMES) + "\n")
+        for row in iter_demo_rows(seed):
+            csvfile.write(row)
+            row_count += 1
+
     print(f"✅ Demo CSV erstellt: {filename}")
-    print(f"📊 {len(rows)} Datensätze generiert")
-    print(f"🏷️  {len(fieldnames)} Spalten: {', '.join(fieldnames[:5])}...")
-    
+    print(f"📊 {row_count} Datensätze generiert")
+    print(f"🏷️  {len(FIELDNAMES)} Spalten: {', '.join(FIELDNAMES[:5])}...")
+
+    return filename
+
+def create_demo_parquet(filename="demo_crypto_data.parquet", seed=None):
+    """Erstellt eine Parquet-Datei mit Demo-Daten (spaltenorientiert)
+
+    Konsumenten, die nur einzelne Spalten brauchen (z.B. Preis/RSI im
+    Backtester), lesen so nur diese Spalten statt jede Zeile komplett zu
+    parsen; native Datentypen bleiben erhalten.
+    """
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+
+    cols = generate_demo_columns(seed)
+
+    table = pa.table({name: pa.array(values) for name, values in cols.items()})
+    # Kompakte Typen: float32 reicht für Demo-Preise, int8 für den Index,
+    # Strings dictionary-kodiert
+    schema_overrides = {
+        'current_price': pa.float32(), 'support_level': pa.float32(),
+        'resistance_level': pa.float32(), 'atr': pa.float32(),
+        'stop_loss': pa.float32(), 'take_profit': pa.float32(),
+        'fear_greed_index': pa.int8(),
+    }
+    for name, typ in schema_overrides.items():
+        idx = table.schema.get_field_index(name)
+        table = table.set_column(idx, name, table.column(name).cast(typ))
+
+    pq.write_table(table, filename, compression='zstd', use_dictionary=True)
+
+    print(f"✅ Demo Parquet erstellt: {filename}")
     return filename
 
 if __name__ == "__main__":
-    create_demo_csv()
+    # Fester Seed am CLI-Entry-Point: identische Demo-Dateien bei jedem Lauf
+    create_demo_csv(seed=42)
+    create_demo_parquet(seed=42)
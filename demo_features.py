@@ -4,104 +4,113 @@ Comprehensive Feature Demo
 Shows all 6 implemented improvements working together
 """
 
-print('🚀 COMPREHENSIVE FEATURE DEMO')
-print('=' * 50)
-
-# 1. Strategy Registry Demo
-print('1. STRATEGY REGISTRY:')
-from modules.strategies import list_available_strategies, create_strategy, StrategyRegistry
-
-strategies = list_available_strategies()
-print(f'   Available Strategies: {len(strategies)}')
-for s in strategies:
-    name = s["name"]
-    category = s["category"]
-    print(f'   - {name} ({category})')
-
-print()
-
-# 2. Multi-Strategy Creation
-print('2. MULTI-STRATEGY CREATION:')
-conservative = create_strategy('conservative_trend')
-momentum = create_strategy('moderate_momentum')
-print(f'   Conservative: {conservative.name}')
-print(f'   Momentum: {momentum.name}')
-
-print()
-
-# 3. Portfolio Simulator Demo
-print('3. PORTFOLIO SIMULATOR:')
-from modules.simulation import PortfolioSimulator
-from modules.data_models import MarketData, TechnicalIndicators
-from datetime import datetime
-
-simulator = PortfolioSimulator(initial_balance=10000.0)
-simulator.add_strategy(conservative)
-simulator.add_strategy(momentum)
-
-# Test market data processing
-btc_data = MarketData('BTC', 50000.0, 1000000.0, datetime.now(), 51000.0, 49000.0, 2.0)
-indicators = TechnicalIndicators(
-    rsi=45.0, macd=0.001, macd_signal=0.0005, macd_histogram=0.0005,
-    ma20=49500.0, ma50=49000.0, ma200=48000.0,
-    bb_upper=51000.0, bb_lower=47000.0, bb_position=60.0,
-    atr=1000.0, atr_percentage=2.0,
-    stoch_k=55.0, williams_r=-45.0, volume_ratio=1.2
-)
-
-simulator.process_market_data('BTC', btc_data, indicators)
-print(f'   Simulator Balance: ${simulator.current_balance:.2f}')
-print(f'   Active Strategies: {len(simulator.strategies)}')
-
-print()
-
-# 4. Backtester Demo
-print('4. BACKTESTER:')
-from modules.simulation import SimpleBacktester
-from datetime import timedelta
-
-backtester = SimpleBacktester(initial_capital=10000.0)
-backtester.add_strategy(conservative)
-
-# Minimal historical data
-start_date = datetime.now() - timedelta(days=3)
-end_date = datetime.now()
-historical_data = {
-    'BTC': [
-        MarketData('BTC', 48000.0, 1000000.0, start_date, 49000.0, 47000.0, 0.0),
-        MarketData('BTC', 50000.0, 1200000.0, end_date, 51000.0, 49000.0, 4.2)
-    ]
-}
-
-results = backtester.run_backtest(historical_data, start_date, end_date)
-print(f'   Backtest Results: {len(results)} strategies tested')
-if results:
-    for strategy_name, metrics in results.items():
-        print(f'   - {strategy_name}: Final Capital ${metrics.get("final_capital", 0):.2f}')
-
-print()
-
-# 5. Edge Cases Test Demo
-print('5. EDGE CASES TEST:')
-import unittest
-from tests.test_edge_cases import TestEdgeCases
-
-# Run a subset of edge case tests
-suite = unittest.TestLoader().loadTestsFromTestCase(TestEdgeCases)
-runner = unittest.TextTestRunner(verbosity=0, stream=open('test_output.txt', 'w'))
-result = runner.run(suite)
-
-print(f'   Tests Run: {result.testsRun}')
-print(f'   Failures: {len(result.failures)}')
-print(f'   Errors: {len(result.errors)}')
-
-print()
-print('✅ ALL 6 IMPROVEMENTS IMPLEMENTED:')
-print('   1. ✅ Cleanup: Removed obsolete trend_strategy.py')
-print('   2. ✅ Validation: Fixed ccxt installation (5/5 tests pass)')
-print('   3. ✅ Momentum: Added MACD + Bollinger strategy')
-print('   4. ✅ Backtester: Implemented historical testing')
-print('   5. ✅ Edge Cases: Comprehensive test coverage')
-print('   6. ✅ Registry: Auto-discovery and factory pattern')
-print()
-print('🚀 ARCHITECTURE READY FOR PRODUCTION!')
+def main():
+    # Schwere Imports erst hier, damit ein Import dieses Moduls als
+    # Library nicht die ganze Demo-Kaskade bezahlt
+    print('🚀 COMPREHENSIVE FEATURE DEMO')
+    print('=' * 50)
+
+    # 1. Strategy Registry Demo
+    print('1. STRATEGY REGISTRY:')
+    from modules.strategies import list_available_strategies, create_strategy, StrategyRegistry
+
+    strategies = list_available_strategies()
+    print(f'   Available Strategies: {len(strategies)}')
+    for s in strategies:
+        name = s["name"]
+        category = s["category"]
+        print(f'   - {name} ({category})')
+
+    print()
+
+    # 2. Multi-Strategy Creation
+    print('2. MULTI-STRATEGY CREATION:')
+    conservative = create_strategy('conservative_trend')
+    momentum = create_strategy('moderate_momentum')
+    print(f'   Conservative: {conservative.name}')
+    print(f'   Momentum: {momentum.name}')
+
+    print()
+
+    # 3. Portfolio Simulator Demo
+    print('3. PORTFOLIO SIMULATOR:')
+    from modules.simulation import PortfolioSimulator
+    from modules.data_models import MarketData, TechnicalIndicators
+    from datetime import datetime
+
+    simulator = PortfolioSimulator(initial_balance=10000.0)
+    simulator.add_strategy(conservative)
+    simulator.add_strategy(momentum)
+
+    # Test market data processing
+    btc_data = MarketData('BTC', 50000.0, 1000000.0, datetime.now(), 51000.0, 49000.0, 2.0)
+    indicators = TechnicalIndicators(
+        rsi=45.0, macd=0.001, macd_signal=0.0005, macd_histogram=0.0005,
+        ma20=49500.0, ma50=49000.0, ma200=48000.0,
+        bb_upper=51000.0, bb_lower=47000.0, bb_position=60.0,
+        atr=1000.0, atr_percentage=2.0,
+        stoch_k=55.0, williams_r=-45.0, volume_ratio=1.2
+    )
+
+    simulator.process_market_data('BTC', btc_data, indicators)
+    print(f'   Simulator Balance: ${simulator.current_balance:.2f}')
+    print(f'   Active Strategies: {len(simulator.strategies)}')
+
+    print()
+
+    # 4. Backtester Demo
+    print('4. BACKTESTER:')
+    from modules.simulation import SimpleBacktester
+    from datetime import timedelta
+
+    backtester = SimpleBacktester(initial_capital=10000.0)
+    backtester.add_strategy(conservative)
+
+    # Minimal historical data
+    start_date = datetime.now() - timedelta(days=3)
+    end_date = datetime.now()
+    historical_data = {
+        'BTC': [
+            MarketData('BTC', 48000.0, 1000000.0, start_date, 49000.0, 47000.0, 0.0),
+            MarketData('BTC', 50000.0, 1200000.0, end_date, 51000.0, 49000.0, 4.2)
+        ]
+    }
+
+    results = backtester.run_backtest(historical_data, start_date, end_date)
+    print(f'   Backtest Results: {len(results)} strategies tested')
+    if results:
+        for strategy_name, metrics in results.items():
+            print(f'   - {strategy_name}: Final Capital ${metrics.get("final_capital", 0):.2f}')
+
+    print()
+
+    # 5. Edge Cases Test Demo
+    print('5. EDGE CASES TEST:')
+    import io
+    import unittest
+    from tests.test_edge_cases import TestEdgeCases
+
+    # Run a subset of edge case tests
+    # In-Memory-Stream statt test_output.txt: keine Disk-Writes pro
+    # Testzeile und kein offen bleibendes File-Handle
+    suite = unittest.TestLoader().loadTestsFromTestCase(TestEdgeCases)
+    runner = unittest.TextTestRunner(verbosity=0, stream=io.StringIO())
+    result = runner.run(suite)
+
+    print(f'   Tests Run: {result.testsRun}')
+    print(f'   Failures: {len(result.failures)}')
+    print(f'   Errors: {len(result.errors)}')
+
+    print()
+    print('✅ ALL 6 IMPROVEMENTS IMPLEMENTED:')
+    print('   1. ✅ Cleanup: Removed obsolete trend_strategy.py')
+    print('   2. ✅ Validation: Fixed ccxt installation (5/5 tests pass)')
+    print('   3. ✅ Momentum: Added MACD + Bollinger strategy')
+    print('   4. ✅ Backtester: Implemented historical testing')
+    print('   5. ✅ Edge Cases: Comprehensive test coverage')
+    print('   6. ✅ Registry: Auto-discovery and factory pattern')
+    print()
+    print('🚀 ARCHITECTURE READY FOR PRODUCTION!')
+
+if __name__ == "__main__":
+    main()
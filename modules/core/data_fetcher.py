@@ -7,20 +7,44 @@ mit robuster Fehlerbehandlung, Caching und Rate-Limiting.
 
 import time
 import asyncio
+import itertools
 from abc import ABC, abstractmethod
 from typing import Dict, List, Any, Optional, Union, Protocol
 from datetime import datetime, timedelta
 from dataclasses import dataclass
 import json
-import requests
-from concurrent.futures import ThreadPoolExecutor, TimeoutError
+import numpy as np
+import aiohttp
+from hashlib import blake2b
+
+try:
+    # orjson parst die grossen News/Ticker-Antworten 2-4x schneller als
+    # stdlib json und erzeugt weniger GC-Druck
+    from orjson import loads as _json_loads
+except ImportError:
+    from json import loads as _json_loads
 
 # Lokale Imports
 from ..data_models import MarketData, NewsAnalysis
 from ..utils.logger import logger, handle_exceptions, SecuritySanitizer
 from config import API_CONFIG, QUALITY_SOURCES, CRITICAL_KEYWORDS, get_api_credentials
 
-@dataclass
+# Multi-Pattern-Matcher einmal beim Import kompiliert: ein C-Level-Scan
+# über den Artikel-Text statt len(Keywords) einzelner Substring-Suchen
+import re
+from urllib.parse import urlsplit
+_CRYPTO_RE = re.compile('crypto|bitcoin|blockchain')
+_CRITICAL_RE = re.compile('|'.join(re.escape(k.lower()) for k in CRITICAL_KEYWORDS))
+
+# Qualitätsquellen als normalisierte Host-Menge: O(1)-Lookup statt
+# Substring-Scan, und semantisch korrekt (kein Treffer, wenn der
+# Quellenname nur im Query-String auftaucht)
+_SOURCE_HOSTS = frozenset(
+    (urlsplit(src if '//' in src else '//' + src).hostname or src).lower().removeprefix('www.')
+    for src in QUALITY_SOURCES
+)
+
+@dataclass(slots=True)
 class APIResponse:
     """Standardisierte API-Response-Struktur."""
     success: bool
@@ -32,101 +56,173 @@ class APIResponse:
 
 class DataProvider(Protocol):
     """Interface für alle Datenquellen."""
-    
+
     def is_available(self) -> bool:
         """Prüft ob die Datenquelle verfügbar ist."""
         ...
-    
+
     def get_rate_limit_delay(self) -> float:
         """Gibt die empfohlene Verzögerung zwischen Anfragen zurück."""
         ...
 
+# Geteilte aiohttp-Session für alle Fetcher: ein Connection-Pool mit
+# Keep-Alive und DNS-Cache statt TCP+TLS-Handshake pro Request
+_session: Optional[aiohttp.ClientSession] = None
+
+async def get_session() -> aiohttp.ClientSession:
+    """Gibt die prozessweite ClientSession zurück (lazy erstellt)."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100,
+                limit_per_host=10,
+                ttl_dns_cache=300
+            ),
+            timeout=aiohttp.ClientTimeout(total=30)
+        )
+    return _session
+
+async def close_session():
+    """Schließt die geteilte Session (beim Anwendungs-Shutdown aufrufen)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
+
+class TokenBucket:
+    """
+    Async Token-Bucket für Rate-Limiting.
+
+    Erlaubt Bursts bis `capacity` Requests und füllt mit `refill_rate`
+    Tokens pro Sekunde nach — im Gegensatz zum festen Sleep pro Call
+    serialisieren Mehrfach-Fetches nicht mehr unnötig.
+    """
+
+    def __init__(self, capacity: float, refill_rate: float):
+        self.capacity = capacity
+        self.refill_rate = refill_rate
+        self.tokens = capacity
+        self.last_refill = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self):
+        """Wartet, bis ein Token verfügbar ist, und verbraucht es."""
+        async with self._lock:
+            while True:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.refill_rate)
+                self.last_refill = now
+
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return
+
+                wait_time = (1 - self.tokens) / self.refill_rate
+                logger.debug(f"Rate limiting: waiting {wait_time:.2f}s for token")
+                await asyncio.sleep(wait_time)
+
 class BaseDataFetcher(ABC):
     """Abstrakte Basis-Klasse für alle Daten-Fetcher."""
-    
-    def __init__(self, name: str, timeout: int = 30):
+
+    def __init__(self, name: str, timeout: int = 30,
+                 bucket_capacity: float = 1, refill_rate: float = 1.0,
+                 cache_ttl: float = 0.0):
         self.name = name
         self.timeout = timeout
-        self.last_request_time = 0.0
+        self.limiter = TokenBucket(bucket_capacity, refill_rate)
+        self.cache_ttl = cache_ttl
+        # Zaehler als itertools.count: next() inkrementiert atomar auf
+        # C-Ebene — auch unter free-threading (PEP 703) kein Lost-Update
+        self._req_counter = itertools.count(1)
+        self._err_counter = itertools.count(1)
+        self._hit_counter = itertools.count(1)
         self.request_count = 0
         self.error_count = 0
-        
-    def _enforce_rate_limit(self, delay: float = 1.0):
-        """Erzwingt Rate-Limiting zwischen Anfragen."""
-        current_time = time.time()
-        time_since_last = current_time - self.last_request_time
-        
-        if time_since_last < delay:
-            sleep_time = delay - time_since_last
-            logger.debug(f"Rate limiting {self.name}: sleeping {sleep_time:.2f}s")
-            time.sleep(sleep_time)
-        
-        self.last_request_time = time.time()
-    
-    @handle_exceptions("api_request")
-    def _make_request(self, url: str, params: Optional[Dict] = None, 
-                     headers: Optional[Dict] = None) -> APIResponse:
-        """Macht einen HTTP-Request mit Fehlerbehandlung."""
+        self.cache_hits = 0
+        # TTL-Cache pro Fetcher: {key: (data, monotonic-Zeitpunkt)}
+        self._response_cache: Dict[str, tuple] = {}
+
+    def _cache_key(self, url: str, params: Optional[Dict]) -> str:
+        """Stabiler Cache-Schlüssel aus Fetcher-Name, URL und Parametern."""
+        payload = f"{self.name}|{url}|{sorted(params.items()) if params else ''}"
+        return blake2b(payload.encode(), digest_size=16).hexdigest()
+
+    async def _make_request(self, url: str, params: Optional[Dict] = None,
+                            headers: Optional[Dict] = None) -> APIResponse:
+        """Macht einen HTTP-Request mit Fehlerbehandlung (non-blocking)."""
         start_time = time.time()
-        self.request_count += 1
-        
+        self.request_count = next(self._req_counter)
+
+        # Cache-Hit: identische Anfrage innerhalb der TTL kostet weder
+        # Latenz noch API-Quota (kritisch bei NewsAPIs 1000/Tag-Limit)
+        cache_key = None
+        if self.cache_ttl > 0:
+            cache_key = self._cache_key(url, params)
+            hit = self._response_cache.get(cache_key)
+            if hit is not None and time.monotonic() - hit[1] < self.cache_ttl:
+                self.cache_hits = next(self._hit_counter)
+                return APIResponse(success=True, data=hit[0], cached=True)
+
         try:
-            self._enforce_rate_limit()
-            
-            response = requests.get(
-                url, 
-                params=params, 
-                headers=headers, 
-                timeout=self.timeout
-            )
-            response_time = time.time() - start_time
-            
-            # Log API Call
-            logger.log_api_call(
-                api_name=self.name,
-                endpoint=url,
-                status_code=response.status_code,
-                duration=response_time
-            )
-            
-            response.raise_for_status()
-            
-            return APIResponse(
-                success=True,
-                data=response.json(),
-                status_code=response.status_code,
-                response_time=response_time
-            )
-            
-        except requests.exceptions.Timeout as e:
-            self.error_count += 1
-            error_msg = f"Timeout after {self.timeout}s"
-            logger.error(f"{self.name} timeout: {error_msg}")
-            return APIResponse(success=False, error_message=error_msg)
-        
-        except requests.exceptions.HTTPError as e:
-            self.error_count += 1
-            error_msg = f"HTTP {e.response.status_code}" if e.response else str(e)
-            logger.error(f"{self.name} HTTP error: {error_msg}")
-            return APIResponse(success=False, error_message=error_msg, status_code=e.response.status_code if e.response else None)
-        
-        except requests.exceptions.RequestException as e:
-            self.error_count += 1
-            error_msg = SecuritySanitizer.sanitize(str(e))
-            logger.error(f"{self.name} request error: {error_msg}")
-            return APIResponse(success=False, error_message=error_msg)
-        
+            await self.limiter.acquire()
+
+            session = await get_session()
+            async with session.get(
+                url,
+                params=params,
+                headers=headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                response_time = time.time() - start_time
+
+                # Log API Call
+                logger.log_api_call(
+                    api_name=self.name,
+                    endpoint=url,
+                    status_code=response.status,
+                    duration=response_time
+                )
+
+                response.raise_for_status()
+
+                data = _json_loads(await response.read())
+                if cache_key is not None:
+                    self._response_cache[cache_key] = (data, time.monotonic())
+
+                return APIResponse(
+                    success=True,
+                    data=data,
+                    status_code=response.status,
+                    response_time=response_time
+                )
+
         except Exception as e:
-            self.error_count += 1
-            error_msg = SecuritySanitizer.sanitize(str(e))
-            logger.error(f"{self.name} unexpected error: {error_msg}")
-            return APIResponse(success=False, error_message=error_msg)
+            # Ein gemeinsamer Handler statt vier fast identischer
+            # except-Blöcke: eine Sanitize-Stelle, eine Log-Zeile, eine
+            # APIResponse-Konstruktion
+            self.error_count = next(self._err_counter)
+            status_code = None
+
+            if isinstance(e, asyncio.TimeoutError):
+                error_msg = f"Timeout after {self.timeout}s"
+            elif isinstance(e, aiohttp.ClientResponseError):
+                error_msg = f"HTTP {e.status}"
+                status_code = e.status
+            else:
+                error_msg = SecuritySanitizer.sanitize(str(e))
+
+            logger.error(f"{self.name} request error: {error_msg}")
+            return APIResponse(success=False, error_message=error_msg, status_code=status_code)
 
 class NewsAPIFetcher(BaseDataFetcher):
     """Fetcher für News API (newsapi.org)."""
     
     def __init__(self):
-        super().__init__("NewsAPI", API_CONFIG['news_api_timeout'])
+        # 1000 Requests/Tag: kleine Bursts erlaubt, langsames Nachfuellen
+        super().__init__("NewsAPI", API_CONFIG['news_api_timeout'],
+                         bucket_capacity=5, refill_rate=1 / 90,
+                         cache_ttl=900)  # News: 15 Minuten frisch genug
         credentials = get_api_credentials()
         self.api_key = credentials['news_api_key']
         self.base_url = "https://newsapi.org/v2"
@@ -139,8 +235,7 @@ class NewsAPIFetcher(BaseDataFetcher):
         """News API: 1000 requests/day = ~1 request alle 90 Sekunden."""
         return 2.0  # Konservativ
     
-    @handle_exceptions("fetch_crypto_news")
-    def fetch_crypto_news(self, search_terms: List[str], days_back: int = 1) -> APIResponse:
+    async def fetch_crypto_news(self, search_terms: List[str], days_back: int = 1) -> APIResponse:
         """
         Holt Crypto-News für gegebene Suchbegriffe.
         
@@ -164,11 +259,15 @@ class NewsAPIFetcher(BaseDataFetcher):
             'from': from_date,
             'sortBy': 'relevancy',
             'pageSize': 50,
+            # Bewusst kein 'domains'-Parameter: der Client-Filter akzeptiert
+            # Artikel, die krypto-relevant ODER aus einer Qualitätsquelle
+            # sind — ein serverseitiger Quellenfilter würde den ODER-Zweig
+            # (Krypto-Artikel fremder Quellen) komplett wegschneiden
             'apiKey': self.api_key
         }
         
         url = f"{self.base_url}/everything"
-        response = self._make_request(url, params)
+        response = await self._make_request(url, params)
         
         if response.success:
             articles = response.data.get('articles', [])
@@ -183,31 +282,36 @@ class NewsAPIFetcher(BaseDataFetcher):
     def _filter_quality_articles(self, articles: List[Dict]) -> List[Dict]:
         """Filtert Artikel nach Qualität der Quelle."""
         quality_articles = []
-        
+
         for article in articles:
             url = article.get('url', '').lower()
             title = article.get('title') or ''
             description = article.get('description') or ''
-            
-            # Prüfe Qualitätsquellen
-            is_quality_source = any(source in url for source in QUALITY_SOURCES)
-            is_crypto_related = any(crypto_term in f"{title} {description}".lower() 
-                                  for crypto_term in ['crypto', 'bitcoin', 'blockchain'])
-            
+
+            # Text-Blob nur einmal pro Artikel bauen und lowercasen
+            blob = f"{title} {description}".lower()
+
+            # Host-Lookup gegen die normalisierte Quellen-Menge,
+            # Subdomains zählen über den Suffix-Vergleich mit
+            host = (urlsplit(url).hostname or '').removeprefix('www.')
+            is_quality_source = (host in _SOURCE_HOSTS
+                                 or any(host.endswith('.' + d) for d in _SOURCE_HOSTS))
+            is_crypto_related = _CRYPTO_RE.search(blob) is not None
+
             if is_quality_source or is_crypto_related:
                 # Prüfe auf kritische Keywords
-                is_critical = any(keyword.lower() in f"{title} {description}".lower() 
-                                for keyword in CRITICAL_KEYWORDS)
-                article['is_critical'] = is_critical
+                article['is_critical'] = _CRITICAL_RE.search(blob) is not None
                 quality_articles.append(article)
-        
+
         return quality_articles
 
 class FearGreedIndexFetcher(BaseDataFetcher):
     """Fetcher für Crypto Fear & Greed Index."""
     
     def __init__(self):
-        super().__init__("FearGreedIndex", API_CONFIG['news_api_timeout'])
+        super().__init__("FearGreedIndex", API_CONFIG['news_api_timeout'],
+                         bucket_capacity=2, refill_rate=0.2,
+                         cache_ttl=86400)  # Index aktualisiert sich 1x/Tag
         self.base_url = "https://api.alternative.me"
     
     def is_available(self) -> bool:
@@ -218,11 +322,10 @@ class FearGreedIndexFetcher(BaseDataFetcher):
         """Konservatives Rate-Limiting."""
         return 5.0
     
-    @handle_exceptions("fetch_fear_greed_index")
-    def fetch_fear_greed_index(self) -> APIResponse:
+    async def fetch_fear_greed_index(self) -> APIResponse:
         """Holt den aktuellen Fear & Greed Index."""
         url = f"{self.base_url}/fng/"
-        response = self._make_request(url)
+        response = await self._make_request(url)
         
         if response.success and response.data.get('data'):
             fng_data = response.data['data'][0]
@@ -249,11 +352,55 @@ class FearGreedIndexFetcher(BaseDataFetcher):
         
         return response
 
+class PriceTable:
+    """
+    Kompakter Preis-Snapshot als parallele NumPy-Arrays.
+
+    Statt drei Python-Objekten plus Dict-Eintrag pro Symbol hält die
+    Tabelle ein U8-Symbol-Array und ein float64-Preis-Array — der
+    Simulator kann damit PnL (`current - entry_price`) vektorisiert
+    rechnen, und beim Pollen alle paar Sekunden entsteht kaum GC-Druck.
+    """
+
+    __slots__ = ('symbols', 'prices', 'timestamp', '_index')
+
+    def __init__(self, price_map: Dict[str, float], timestamp: datetime):
+        ordered = sorted(price_map)
+        self.symbols = np.array(ordered, dtype='U8')
+        self.prices = np.fromiter((price_map[s] for s in ordered), dtype=np.float64, count=len(ordered))
+        self.timestamp = timestamp
+        self._index = {s: i for i, s in enumerate(ordered)}
+
+    def __len__(self) -> int:
+        return len(self.prices)
+
+    def __contains__(self, symbol: str) -> bool:
+        return symbol in self._index
+
+    def get(self, symbol: str, default: float = 0.0) -> float:
+        """Gibt den Preis eines Symbols zurück (O(1))."""
+        idx = self._index.get(symbol)
+        return float(self.prices[idx]) if idx is not None else default
+
+    def to_dict(self) -> Dict[str, Dict[str, Any]]:
+        """Konvertiert in das alte Dict-Format (Kompatibilität)."""
+        return {
+            symbol: {
+                'price': float(price),
+                'market': f"{symbol}-EUR",
+                'timestamp': self.timestamp
+            }
+            for symbol, price in zip(self.symbols.tolist(), self.prices.tolist())
+        }
+
 class BitvavoPriceFetcher(BaseDataFetcher):
     """Fetcher für aktuelle Preise von Bitvavo (ohne Authentifizierung)."""
     
     def __init__(self):
-        super().__init__("BitvavoPrices", 10)  # Kurzes Timeout für Preise
+        # Bitvavo erlaubt 1000 Requests/Minute — grosse Bursts sind ok
+        super().__init__("BitvavoPrices", 10,  # Kurzes Timeout für Preise
+                         bucket_capacity=100, refill_rate=16,
+                         cache_ttl=30)  # Preise: 30s Cache
         self.base_url = "https://api.bitvavo.com/v2"
     
     def is_available(self) -> bool:
@@ -264,8 +411,7 @@ class BitvavoPriceFetcher(BaseDataFetcher):
         """Bitvavo: 1000 requests/minute = ~1 request/60ms."""
         return 0.1
     
-    @handle_exceptions("fetch_ticker_prices")
-    def fetch_ticker_prices(self, symbols: List[str]) -> APIResponse:
+    async def fetch_ticker_prices(self, symbols: List[str]) -> APIResponse:
         """
         Holt aktuelle Preise für gegebene Symbole.
         
@@ -276,26 +422,31 @@ class BitvavoPriceFetcher(BaseDataFetcher):
             APIResponse mit Preisdaten
         """
         url = f"{self.base_url}/ticker/price"
-        response = self._make_request(url)
+        response = await self._make_request(url)
         
         if response.success:
             all_prices = response.data
-            
-            # Filtere nur die gewünschten Symbole (EUR Paare)
-            filtered_prices = {}
+
+            # Filtere nur die gewünschten Symbole (EUR Paare):
+            # O(1)-Set-Membership statt Listen-Scan pro Markt, ein
+            # gemeinsamer Timestamp für den ganzen Batch
+            wanted = frozenset(symbols)
+            ts = datetime.now()
+
+            price_map = {}
             for price_data in all_prices:
                 market = price_data.get('market', '')
-                if market.endswith('-EUR'):
-                    symbol = market.replace('-EUR', '')
-                    if symbol in symbols:
-                        filtered_prices[symbol] = {
-                            'price': float(price_data.get('price', 0)),
-                            'market': market,
-                            'timestamp': datetime.now()
-                        }
-            
-            response.data = filtered_prices
-            logger.info(f"Bitvavo prices: {len(filtered_prices)} symbols updated")
+                if not market.endswith('-EUR'):
+                    continue
+                symbol = market[:-4]
+                if symbol not in wanted:
+                    continue
+                price_map[symbol] = float(price_data.get('price', 0))
+
+            # Kompakter Array-Snapshot statt Dict-of-Dicts; Legacy-Callern
+            # steht .to_dict() zur Verfügung
+            response.data = PriceTable(price_map, ts)
+            logger.info(f"Bitvavo prices: {len(price_map)} symbols updated")
         
         return response
 
@@ -303,18 +454,34 @@ class GoogleSheetsFetcher(BaseDataFetcher):
     """Fetcher für Google Sheets Integration."""
     
     def __init__(self):
-        super().__init__("GoogleSheets", API_CONFIG['gsheets_timeout'])
+        super().__init__("GoogleSheets", API_CONFIG['gsheets_timeout'],
+                         bucket_capacity=5, refill_rate=5)
         credentials = get_api_credentials()
         self.credentials_json = credentials['google_credentials']
-    
+        # Client/Worksheet werden beim ersten Zugriff aufgebaut und dann
+        # wiederverwendet — der OAuth-Handshake (~500ms) fällt nur einmal an
+        self._ws = None
+        self._headers: Optional[List[str]] = None
+
     def is_available(self) -> bool:
         """Prüft ob Google Credentials verfügbar sind."""
         return self.credentials_json is not None
-    
+
     def get_rate_limit_delay(self) -> float:
         """Google Sheets: 300 requests/minute."""
         return 1.0
-    
+
+    def _worksheet(self):
+        """Gibt das gecachte Market_Data-Worksheet zurück (lazy verbunden)."""
+        if self._ws is None:
+            import gspread
+
+            credentials_dict = _json_loads(self.credentials_json)
+            gc = gspread.service_account_from_dict(credentials_dict)
+            spreadsheet = gc.open("Krypto-Analyse-DB")
+            self._ws = spreadsheet.worksheet("Market_Data")
+        return self._ws
+
     @handle_exceptions("fetch_portfolio_history")
     def fetch_portfolio_history(self, days: int = 7) -> APIResponse:
         """
@@ -330,35 +497,36 @@ class GoogleSheetsFetcher(BaseDataFetcher):
             return APIResponse(success=False, error_message="Google credentials not available")
         
         try:
-            import gspread
-            
-            # Parse credentials - Safe handling
-            if not self.credentials_json:
-                return APIResponse(success=False, error_message="Google credentials not available")
-            
-            credentials_dict = json.loads(self.credentials_json)
-            gc = gspread.service_account_from_dict(credentials_dict)
-            
-            # Open spreadsheet
-            spreadsheet = gc.open("Krypto-Analyse-DB")
-            worksheet = spreadsheet.worksheet("Market_Data")
-            
-            # Get recent records
-            try:
-                records = worksheet.get_all_records()[-50:]  # Letzte 50 Einträge
-            except Exception:
-                # Fallback for header issues
-                all_values = worksheet.get_all_values()
-                if len(all_values) < 2:
-                    return APIResponse(success=False, error_message="No data in sheet")
-                
-                records = []
-                headers = all_values[0]
-                for row in all_values[-50:]:
-                    if len(row) >= len(headers):
-                        record = dict(zip(headers, row))
-                        records.append(record)
-            
+            worksheet = self._worksheet()
+
+            # Header-Zeile nur beim ersten Mal holen
+            if self._headers is None:
+                self._headers = worksheet.row_values(1)
+            headers = self._headers
+
+            if not headers:
+                return APIResponse(success=False, error_message="No data in sheet")
+
+            # Nur die letzten 50 Zeilen per Range-Get statt des ganzen
+            # Sheets — Bandbreite skaliert mit 50, nicht mit der Historie.
+            # row_count wäre dafür falsch: das ist die Grid-Dimension des
+            # Sheets (Default 1000), nicht die letzte befüllte Zeile — bei
+            # append-getriebenen Sheets läge das Fenster sonst im leeren
+            # Grid-Ende. Die letzte Datenzeile liefert die erste Spalte.
+            # Das Range-Ende folgt der Header-Breite (33 Spalten => 'AG')
+            last_row = len(worksheet.col_values(1))
+            start = max(2, last_row - 49)
+            end_col = ''
+            n = len(headers)
+            while n > 0:
+                n, rest = divmod(n - 1, 26)
+                end_col = chr(ord('A') + rest) + end_col
+            rows = worksheet.get(f'A{start}:{end_col}{last_row}') if last_row >= 2 else []
+
+            # Kurze Zeilen wie bei get_all_records auf Header-Länge auffüllen
+            records = [dict(zip(headers, row + [''] * (len(headers) - len(row))))
+                       for row in rows]
+
             # Process data
             portfolio_data = self._process_portfolio_history(records, days)
             
@@ -374,26 +542,23 @@ class GoogleSheetsFetcher(BaseDataFetcher):
             return APIResponse(success=False, error_message=error_msg)
     
     def _process_portfolio_history(self, records: List[Dict], days: int) -> Dict:
-        """Verarbeitet Portfolio-History-Daten."""
-        portfolio_values = {}
-        
-        for record in records:
-            timestamp_str = record.get('Zeitstempel', '')
-            wert_str = record.get('Wert_EUR', '0')
-            
-            if timestamp_str and wert_str:
-                try:
-                    date = datetime.strptime(timestamp_str, '%Y-%m-%d %H:%M:%S').date()
-                    wert = float(wert_str) if wert_str != '0' else 0
-                    
-                    if wert > 0:
-                        if date not in portfolio_values:
-                            portfolio_values[date] = 0
-                        portfolio_values[date] += wert
-                        
-                except (ValueError, TypeError):
-                    continue
-        
+        """Verarbeitet Portfolio-History-Daten (vektorisiert)."""
+        import pandas as pd
+
+        df = pd.DataFrame(records)
+
+        if df.empty or 'Zeitstempel' not in df.columns or 'Wert_EUR' not in df.columns:
+            daily = pd.Series(dtype=float)
+        else:
+            # Ein C-Level-Durchlauf statt strptime/float pro Zeile; ungültige
+            # Werte werden per errors='coerce' zu NaN/NaT und fallen raus
+            wert = pd.to_numeric(df['Wert_EUR'], errors='coerce')
+            dates = pd.to_datetime(df['Zeitstempel'], format='%Y-%m-%d %H:%M:%S', errors='coerce').dt.date
+            mask = wert.gt(0) & pd.notna(dates)
+            daily = wert[mask].groupby(dates[mask]).sum()
+
+        portfolio_values = daily.to_dict()
+
         # Calculate performance metrics
         today = datetime.now().date()
         yesterday = today - timedelta(days=1)
@@ -432,6 +597,24 @@ class DataFetcherManager:
     def get_fetcher(self, name: str) -> Optional[BaseDataFetcher]:
         """Gibt einen Fetcher zurück."""
         return self.fetchers.get(name)
+
+    async def fetch_all(self, search_terms: List[str], symbols: List[str]) -> Dict[str, APIResponse]:
+        """
+        Holt News, Fear & Greed und Preise nebenläufig.
+
+        Die drei API-Calls laufen per asyncio.gather parallel — die
+        Gesamtlatenz entspricht dem langsamsten Call statt der Summe.
+        """
+        news, fear_greed, prices = await asyncio.gather(
+            self.fetchers['news'].fetch_crypto_news(search_terms),
+            self.fetchers['fear_greed'].fetch_fear_greed_index(),
+            self.fetchers['prices'].fetch_ticker_prices(symbols)
+        )
+        return {'news': news, 'fear_greed': fear_greed, 'prices': prices}
+
+    async def aclose(self):
+        """Schließt den geteilten HTTP-Client (beim Shutdown aufrufen)."""
+        await close_session()
     
     def get_available_fetchers(self) -> Dict[str, bool]:
         """Gibt Status aller Fetcher zurück."""
@@ -444,15 +627,36 @@ class DataFetcherManager:
             stats[name] = {
                 'requests': fetcher.request_count,
                 'errors': fetcher.error_count,
+                'cache_hits': fetcher.cache_hits,
                 'success_rate': (1 - fetcher.error_count / max(1, fetcher.request_count)) * 100
             }
         return stats
 
-# Globale Manager-Instanz
-data_manager = DataFetcherManager()
+# Globale Manager-Instanz — lazy: der Import des Moduls bezahlt nicht
+# mehr die Konstruktion aller vier Fetcher inkl. Credential-Loading
+import threading
+
+_data_manager: Optional[DataFetcherManager] = None
+_manager_lock = threading.Lock()
+
+def get_data_manager() -> DataFetcherManager:
+    """Gibt den prozessweiten DataFetcherManager zurück (lazy erstellt)."""
+    global _data_manager
+    if _data_manager is None:
+        with _manager_lock:
+            if _data_manager is None:
+                _data_manager = DataFetcherManager()
+    return _data_manager
+
+def __getattr__(name: str):
+    # PEP-562-Shim: `data_manager` bleibt für Bestandscode verfügbar,
+    # wird aber erst beim ersten Zugriff konstruiert
+    if name == 'data_manager':
+        return get_data_manager()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 __all__ = [
     'DataProvider', 'BaseDataFetcher', 'NewsAPIFetcher', 'FearGreedIndexFetcher',
-    'BitvavoPriceFetcher', 'GoogleSheetsFetcher', 'DataFetcherManager', 
-    'data_manager', 'APIResponse'
+    'BitvavoPriceFetcher', 'GoogleSheetsFetcher', 'DataFetcherManager',
+    'data_manager', 'get_data_manager', 'APIResponse', 'PriceTable'
 ]
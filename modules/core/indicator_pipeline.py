@@ -0,0 +1,287 @@
+"""
+Vektorisierte Indikator-Pipeline für Backtests.
+
+Berechnet den kompletten Indikator-Satz (MA20/50/200, RSI, MACD, ATR,
+Bollinger, Stochastik) einmal für die gesamte Preishistorie statt pro Bar
+neu. Ist TA-Lib installiert, übernehmen dessen C-Kernels die klassischen
+Indikatoren; sonst rechnen pandas rolling/ewm-Pfade mit identischen
+Parametern. Der Simulator liest die fertigen float64-Spalten dann nur
+noch per Integer-Index (siehe indicators_at).
+"""
+
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from ..data_models import TechnicalIndicators
+
+try:
+    import talib  # optional: C-Kernels für SMA/RSI/MACD/ATR
+except ImportError:
+    talib = None
+
+
+def build_indicator_frame(ohlcv: pd.DataFrame) -> pd.DataFrame:
+    """
+    Berechnet alle TechnicalIndicators-Spalten für eine komplette Historie.
+
+    Args:
+        ohlcv: DataFrame mit den Spalten close, high, low, volume
+               (eine Zeile pro Bar, chronologisch sortiert)
+
+    Returns:
+        DataFrame auf demselben Index mit den Spalten rsi, macd,
+        macd_signal, macd_histogram, ma20, ma50, ma200, bb_upper,
+        bb_lower, bb_position, atr, atr_percentage, stoch_k,
+        williams_r und volume_ratio
+    """
+    close = ohlcv['close'].astype(np.float64)
+    high = ohlcv['high'].astype(np.float64)
+    low = ohlcv['low'].astype(np.float64)
+    volume = ohlcv['volume'].astype(np.float64)
+
+    if talib is not None:
+        ma20 = pd.Series(talib.SMA(close.values, 20), index=close.index)
+        ma50 = pd.Series(talib.SMA(close.values, 50), index=close.index)
+        ma200 = pd.Series(talib.SMA(close.values, 200), index=close.index)
+        rsi = pd.Series(talib.RSI(close.values, 14), index=close.index)
+        macd_arr, signal_arr, hist_arr = talib.MACD(close.values)
+        macd = pd.Series(macd_arr, index=close.index)
+        macd_signal = pd.Series(signal_arr, index=close.index)
+        macd_histogram = pd.Series(hist_arr, index=close.index)
+        atr = pd.Series(talib.ATR(high.values, low.values, close.values, 14),
+                        index=close.index)
+    else:
+        ma20 = close.rolling(20, min_periods=1).mean()
+        ma50 = close.rolling(50, min_periods=1).mean()
+        ma200 = close.rolling(200, min_periods=1).mean()
+
+        # Wilder-RSI über rekursives ewm statt Python-Schleife
+        delta = close.diff()
+        gain = delta.clip(lower=0.0)
+        loss = -delta.clip(upper=0.0)
+        avg_gain = gain.ewm(alpha=1 / 14, adjust=False).mean()
+        avg_loss = loss.ewm(alpha=1 / 14, adjust=False).mean()
+        rsi = 100.0 - 100.0 / (1.0 + avg_gain / avg_loss.replace(0.0, np.nan))
+
+        ema12 = close.ewm(span=12, adjust=False).mean()
+        ema26 = close.ewm(span=26, adjust=False).mean()
+        macd = ema12 - ema26
+        macd_signal = macd.ewm(span=9, adjust=False).mean()
+        macd_histogram = macd - macd_signal
+
+        prev_close = close.shift(1)
+        true_range = pd.concat([
+            high - low,
+            (high - prev_close).abs(),
+            (low - prev_close).abs(),
+        ], axis=1).max(axis=1)
+        atr = true_range.ewm(alpha=1 / 14, adjust=False).mean()
+
+    # Bollinger, Stochastik und Volumen-Ratio immer über pandas (bottleneck
+    # beschleunigt die rolling-Aggregationen automatisch, falls installiert)
+    bb_mid = close.rolling(20, min_periods=1).mean()
+    bb_std = close.rolling(20, min_periods=1).std().fillna(0.0)
+    bb_upper = bb_mid + 2.0 * bb_std
+    bb_lower = bb_mid - 2.0 * bb_std
+    bb_span = bb_upper - bb_lower
+    bb_position = pd.Series(
+        np.where(bb_span > 0, (close - bb_lower) / bb_span * 100.0, 50.0),
+        index=close.index
+    )
+
+    low14 = low.rolling(14, min_periods=1).min()
+    high14 = high.rolling(14, min_periods=1).max()
+    stoch_span = high14 - low14
+    stoch_k = pd.Series(
+        np.where(stoch_span > 0, (close - low14) / stoch_span * 100.0, 50.0),
+        index=close.index
+    )
+    williams_r = stoch_k - 100.0
+
+    volume_ratio = volume / volume.rolling(20, min_periods=1).mean()
+
+    return pd.DataFrame({
+        'rsi': rsi.fillna(50.0),
+        'macd': macd.fillna(0.0),
+        'macd_signal': macd_signal.fillna(0.0),
+        'macd_histogram': macd_histogram.fillna(0.0),
+        'ma20': ma20.fillna(close),
+        'ma50': ma50.fillna(close),
+        'ma200': ma200.fillna(close),
+        'bb_upper': bb_upper,
+        'bb_lower': bb_lower,
+        'bb_position': bb_position,
+        'atr': atr.fillna(0.0),
+        'atr_percentage': (atr / close * 100.0).fillna(0.0),
+        'stoch_k': stoch_k,
+        'williams_r': williams_r,
+        'volume_ratio': volume_ratio.fillna(1.0),
+    }, index=ohlcv.index)
+
+
+class LiveIndicatorState:
+    """
+    Inkrementeller Indikator-Zustand für den Live-/Streaming-Modus.
+
+    Im Live-Betrieb kommt pro Tick genau ein neuer Preis an — die komplette
+    Historie neu zu rechnen wäre O(N) pro Bar. update() hält stattdessen
+    Ring-Puffer plus laufende Summen (SMA/Bollinger/Volumen) und rekursive
+    Zustände (EMA, Wilder-RSI, Wilder-ATR) und liefert in O(1) pro Tick ein
+    fertiges TechnicalIndicators-Objekt für BaseStrategy.analyze.
+    """
+
+    MAX_WINDOW = 200
+
+    def __init__(self) -> None:
+        self._prices = np.zeros(self.MAX_WINDOW)
+        self._volumes = np.zeros(20)
+        self._highs = np.zeros(14)
+        self._lows = np.zeros(14)
+        self._n = 0
+        self._sum20 = 0.0
+        self._sumsq20 = 0.0
+        self._sum50 = 0.0
+        self._sum200 = 0.0
+        self._vol_sum = 0.0
+        self._ema12: Optional[float] = None
+        self._ema26: Optional[float] = None
+        self._macd_signal = 0.0
+        self._avg_gain = 0.0
+        self._avg_loss = 0.0
+        self._atr = 0.0
+        self._prev_close: Optional[float] = None
+
+    def update(self, price: float, high: Optional[float] = None,
+               low: Optional[float] = None, volume: float = 0.0) -> TechnicalIndicators:
+        """Verarbeitet einen neuen Tick und liefert die aktuellen Indikatoren."""
+        high = price if high is None else high
+        low = price if low is None else low
+        n = self._n
+
+        # Laufende Summen: ältesten Wert des jeweiligen Fensters abziehen,
+        # neuen addieren — statt das Fenster jedes Mal komplett zu summieren
+        if n >= 20:
+            oldest = self._prices[(n - 20) % self.MAX_WINDOW]
+            self._sum20 -= oldest
+            self._sumsq20 -= oldest * oldest
+        if n >= 50:
+            self._sum50 -= self._prices[(n - 50) % self.MAX_WINDOW]
+        if n >= 200:
+            self._sum200 -= self._prices[(n - 200) % self.MAX_WINDOW]
+        if n >= 20:
+            self._vol_sum -= self._volumes[n % 20]
+
+        self._prices[n % self.MAX_WINDOW] = price
+        self._volumes[n % 20] = volume
+        self._highs[n % 14] = high
+        self._lows[n % 14] = low
+        self._sum20 += price
+        self._sumsq20 += price * price
+        self._sum50 += price
+        self._sum200 += price
+        self._vol_sum += volume
+
+        c20 = min(n + 1, 20)
+        c50 = min(n + 1, 50)
+        c200 = min(n + 1, 200)
+        c14 = min(n + 1, 14)
+
+        ma20 = self._sum20 / c20
+        ma50 = self._sum50 / c50
+        ma200 = self._sum200 / c200
+
+        # EMA/MACD: rekursives Blending, beim ersten Tick mit dem Preis geseedet
+        if self._ema12 is None:
+            self._ema12 = price
+            self._ema26 = price
+        else:
+            self._ema12 += (2.0 / 13) * (price - self._ema12)
+            self._ema26 += (2.0 / 27) * (price - self._ema26)
+        macd = self._ema12 - self._ema26
+        self._macd_signal += (2.0 / 10) * (macd - self._macd_signal)
+        macd_histogram = macd - self._macd_signal
+
+        # Wilder-RSI und Wilder-ATR über den rekursiven 1/14-Mittelwert
+        if self._prev_close is not None:
+            delta = price - self._prev_close
+            self._avg_gain = (self._avg_gain * 13 + max(delta, 0.0)) / 14
+            self._avg_loss = (self._avg_loss * 13 + max(-delta, 0.0)) / 14
+            true_range = max(high - low, abs(high - self._prev_close),
+                             abs(low - self._prev_close))
+            self._atr = (self._atr * 13 + true_range) / 14
+        else:
+            self._atr = high - low
+
+        if self._avg_loss > 0:
+            rsi = 100.0 - 100.0 / (1.0 + self._avg_gain / self._avg_loss)
+        else:
+            rsi = 100.0 if self._avg_gain > 0 else 50.0
+
+        # Bollinger aus laufender Summe/Quadratsumme des 20er-Fensters
+        # (Stichproben-Varianz mit ddof=1, wie pandas rolling().std())
+        if c20 > 1:
+            variance = max((self._sumsq20 - c20 * ma20 * ma20) / (c20 - 1), 0.0)
+        else:
+            variance = 0.0
+        bb_std = variance ** 0.5
+        bb_upper = ma20 + 2.0 * bb_std
+        bb_lower = ma20 - 2.0 * bb_std
+        bb_span = bb_upper - bb_lower
+        bb_position = (price - bb_lower) / bb_span * 100.0 if bb_span > 0 else 50.0
+
+        # Stochastik über den 14er-Ring (Max/Min sind ordnungsunabhängig)
+        high14 = float(self._highs[:c14].max())
+        low14 = float(self._lows[:c14].min())
+        stoch_span = high14 - low14
+        stoch_k = (price - low14) / stoch_span * 100.0 if stoch_span > 0 else 50.0
+
+        vol_mean = self._vol_sum / min(n + 1, 20)
+        volume_ratio = volume / vol_mean if vol_mean > 0 else 1.0
+
+        self._n += 1
+        self._prev_close = price
+
+        return TechnicalIndicators(
+            rsi=rsi,
+            macd=macd,
+            macd_signal=self._macd_signal,
+            macd_histogram=macd_histogram,
+            ma20=ma20,
+            ma50=ma50,
+            ma200=ma200,
+            bb_upper=bb_upper,
+            bb_lower=bb_lower,
+            bb_position=bb_position,
+            atr=self._atr,
+            atr_percentage=self._atr / price * 100.0 if price > 0 else 0.0,
+            stoch_k=stoch_k,
+            williams_r=stoch_k - 100.0,
+            volume_ratio=volume_ratio,
+        )
+
+
+def indicators_at(frame: pd.DataFrame, i: int) -> TechnicalIndicators:
+    """Baut das TechnicalIndicators-Objekt für Bar i aus den fertigen Spalten."""
+    row = frame.iloc[i]
+    return TechnicalIndicators(
+        rsi=float(row['rsi']),
+        macd=float(row['macd']),
+        macd_signal=float(row['macd_signal']),
+        macd_histogram=float(row['macd_histogram']),
+        ma20=float(row['ma20']),
+        ma50=float(row['ma50']),
+        ma200=float(row['ma200']),
+        bb_upper=float(row['bb_upper']),
+        bb_lower=float(row['bb_lower']),
+        bb_position=float(row['bb_position']),
+        atr=float(row['atr']),
+        atr_percentage=float(row['atr_percentage']),
+        stoch_k=float(row['stoch_k']),
+        williams_r=float(row['williams_r']),
+        volume_ratio=float(row['volume_ratio']),
+    )
+
+
+__all__ = ['build_indicator_frame', 'indicators_at', 'LiveIndicatorState']
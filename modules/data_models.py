@@ -8,34 +8,39 @@ Dadurch entstehen klare Interfaces und bessere Wartbarkeit.
 from typing import Dict, List, Any, Optional, TypedDict, Union, Protocol
 from datetime import datetime
 from dataclasses import dataclass
-from enum import Enum
+from enum import IntEnum
+
+import numpy as np
 
 # === ENUMS ===
-class TradingSignal(Enum):
+# IntEnum statt String-Enum: Vergleiche laufen als C-Ints und die Werte
+# lassen sich verlustfrei in np.int8-Spalten packen (vektorisierte
+# Signal-Masken im Backtester); für String-Ausgabe dient .name
+class TradingSignal(IntEnum):
     """Handelssignale für Strategieentscheidungen."""
-    STRONG_BUY = "STRONG_BUY"
-    BUY = "BUY"
-    HOLD = "HOLD"
-    SELL = "SELL"
-    STRONG_SELL = "STRONG_SELL"
+    STRONG_BUY = 2
+    BUY = 1
+    HOLD = 0
+    SELL = -1
+    STRONG_SELL = -2
 
-class VolatilityLevel(Enum):
+class VolatilityLevel(IntEnum):
     """Volatilitätsstufen basierend auf ATR."""
-    LOW = "LOW"
-    MEDIUM = "MEDIUM"
-    HIGH = "HIGH"
-    EXTREME = "EXTREME"
+    LOW = 0
+    MEDIUM = 1
+    HIGH = 2
+    EXTREME = 3
 
-class TrendDirection(Enum):
+class TrendDirection(IntEnum):
     """Trendrichtungen für MA-Analyse."""
-    BULLISH = "BULLISH"
-    BEARISH = "BEARISH"
-    NEUTRAL = "NEUTRAL"
-    GOLDEN_CROSS = "GOLDEN_CROSS"
-    DEATH_CROSS = "DEATH_CROSS"
+    DEATH_CROSS = -2
+    BEARISH = -1
+    NEUTRAL = 0
+    BULLISH = 1
+    GOLDEN_CROSS = 2
 
 # === CORE DATA MODELS ===
-@dataclass
+@dataclass(slots=True)
 class MarketData:
     """Grundlegende Marktdaten für einen Coin."""
     symbol: str
@@ -46,7 +51,52 @@ class MarketData:
     low_24h: float
     change_24h: float
 
-@dataclass
+@dataclass(slots=True)
+class MarketDataSeries:
+    """
+    Spaltenorientierte Marktdaten-Zeitreihe (Structure of Arrays).
+
+    Statt einer Liste von MarketData-Instanzen pro Bar hält die Serie
+    parallele NumPy-Arrays — Indikator-Berechnungen (RSI, MACD, BB)
+    können damit vektorisiert über die ganze Historie laufen, und der
+    GC muss nicht tausende Einzelobjekte verwalten.
+    """
+    symbol: str
+    timestamps: np.ndarray
+    price: np.ndarray
+    volume: np.ndarray
+    high_24h: np.ndarray
+    low_24h: np.ndarray
+    change_24h: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.price)
+
+    @classmethod
+    def from_records(cls, records: List['MarketData']) -> 'MarketDataSeries':
+        """Baut die Serie aus einer Liste von MarketData-Instanzen."""
+        n = len(records)
+        return cls(
+            symbol=records[0].symbol if records else '',
+            timestamps=np.array([r.timestamp for r in records], dtype='datetime64[us]'),
+            price=np.fromiter((r.price for r in records), dtype=np.float64, count=n),
+            volume=np.fromiter((r.volume for r in records), dtype=np.float64, count=n),
+            high_24h=np.fromiter((r.high_24h for r in records), dtype=np.float64, count=n),
+            low_24h=np.fromiter((r.low_24h for r in records), dtype=np.float64, count=n),
+            change_24h=np.fromiter((r.change_24h for r in records), dtype=np.float64, count=n)
+        )
+
+    def to_dataclasses(self) -> List['MarketData']:
+        """Konvertiert zurück in einzelne MarketData-Instanzen (Kompatibilität)."""
+        return [
+            MarketData(self.symbol, price, volume, ts, high, low, change)
+            for price, volume, ts, high, low, change in zip(
+                self.price.tolist(), self.volume.tolist(), self.timestamps.tolist(),
+                self.high_24h.tolist(), self.low_24h.tolist(), self.change_24h.tolist()
+            )
+        ]
+
+@dataclass(slots=True)
 class TechnicalIndicators:
     """Sammlung aller technischen Indikatoren."""
     rsi: float
@@ -65,7 +115,7 @@ class TechnicalIndicators:
     williams_r: float
     volume_ratio: float
 
-@dataclass
+@dataclass(slots=True)
 class NewsAnalysis:
     """Ergebnis der KI-basierten News-Analyse."""
     sentiment_score: int  # -10 bis +10
@@ -75,7 +125,7 @@ class NewsAnalysis:
     confidence: float  # 0.0 bis 1.0
     articles_count: int
 
-@dataclass
+@dataclass(slots=True)
 class TradingDecision:
     """Handelsentscheidung einer Strategie."""
     signal: TradingSignal
@@ -85,7 +135,7 @@ class TradingDecision:
     take_profit: Optional[float]
     position_size: float  # Anteil des Portfolios (0.0 bis 1.0)
 
-@dataclass
+@dataclass(slots=True)
 class PortfolioPosition:
     """Eine Position im Portfolio."""
     symbol: str
@@ -96,7 +146,7 @@ class PortfolioPosition:
     entry_time: datetime
     strategy_name: str
 
-@dataclass
+@dataclass(slots=True)
 class PerformanceMetrics:
     """Performance-Kennzahlen eines Portfolios."""
     total_return: float
@@ -0,0 +1,48 @@
+"""
+Vektorisierte Indikator-Kernels für den Backtester.
+
+Die Kernel füllen pro Symbol komplette Indikator-Spalten in einem
+Durchlauf, statt dass die Hauptschleife pro Tick Python-Arithmetik
+ausführt. numba ist optional: ist es installiert, werden die Funktionen
+JIT-kompiliert (nogil, ohne Interpreter-Overhead), sonst laufen sie als
+reine NumPy-Vektorpfade mit identischem Ergebnis.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba optional — der NumPy-Pfad ist funktional identisch
+    def njit(**_kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+@njit(cache=True, nogil=True)
+def compute_mock_indicators(px, ma20, ma50):
+    """
+    Berechnet die Mock-Indikator-Spalten für eine komplette Preisreihe.
+
+    Args:
+        px: Preis-Array (float64)
+        ma20: vorberechnete gleitende 20er-Mittel
+        ma50: vorberechnete gleitende 50er-Mittel
+
+    Returns:
+        Tuple aus (macd, macd_signal, macd_histogram,
+        bb_upper, bb_lower, bb_position, atr) als parallele Arrays
+    """
+    macd = np.where(ma50 > 0, (ma20 - ma50) / ma50, 0.0)
+    macd_signal = macd * 0.9
+    macd_histogram = macd - macd_signal
+
+    bb_upper = px * 1.02
+    bb_lower = px * 0.98
+    bb_span = bb_upper - bb_lower
+    bb_position = np.where(bb_span > 0, (px - bb_lower) / bb_span * 100.0, 0.0)
+
+    atr = px * 0.02
+
+    return macd, macd_signal, macd_histogram, bb_upper, bb_lower, bb_position, atr
+
+__all__ = ['compute_mock_indicators']
@@ -0,0 +1,124 @@
+"""
+Numerischer Bar-Loop-Kernel für den PortfolioSimulator.
+
+Der rein numerische Kern eines Backtests (Cash, Positionen, SL/TP,
+Equity, Drawdown) wird hier als einzelne Funktion über die komplette
+Bar-Historie ausgeführt statt pro Bar durch Python-Methoden zu laufen.
+numba ist optional: ist es installiert, wird der Kernel JIT-kompiliert;
+sonst läuft dieselbe Funktion als reiner Python/NumPy-Pfad mit
+identischem Ergebnis. Nicht-numerische Buchhaltung (Symbol-Namen,
+Begründungen) wird außerhalb des Kernels über Integer-Codes aufgelöst.
+"""
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:  # numba optional — der Fallback ist funktional identisch
+    def njit(**_kwargs):
+        def decorator(func):
+            return func
+        return decorator
+
+
+@njit(cache=True, fastmath=True)
+def run_kernel(prices, signals, sl, tp, position_size, cash0, max_pos):
+    """
+    Führt den kompletten Bar-Loop über alle Symbole in einem Aufruf aus.
+
+    Args:
+        prices: (T, S) float64 — Schlusskurse pro Bar und Symbol
+        signals: (T, S) int8 — 1=BUY, -1=SELL, 0=HOLD
+        sl: (T, S) float64 — Stop-Loss bei Einstieg (NaN = nicht gesetzt)
+        tp: (T, S) float64 — Take-Profit bei Einstieg (NaN = nicht gesetzt)
+        position_size: Anteil der Equity pro neuer Position
+        cash0: Startkapital
+        max_pos: maximale Anzahl gleichzeitiger Positionen
+
+    Returns:
+        Tuple aus (trades[:n, 7], balance[T], max_drawdown). Trade-Zeilen:
+        (bar_index, symbol_index, action 0=BUY/1=SELL, price, quantity,
+        pnl, reason_code 0=Entry/1=SL/2=TP/3=Signal)
+    """
+    T, S = prices.shape
+    qty = np.zeros(S)
+    entry = np.zeros(S)
+    stop = np.zeros(S)
+    take = np.zeros(S)
+    active = np.zeros(S, np.uint8)
+
+    cash = cash0
+    equity = cash0
+    peak = cash0
+    max_dd = 0.0
+
+    balance = np.empty(T)
+    trades = np.zeros((2 * T * S, 7))
+    n_trades = 0
+    n_open = 0
+
+    for t in range(T):
+        for s in range(S):
+            price = prices[t, s]
+
+            # Exits: SL vor TP vor Strategie-Signal
+            if active[s] == 1:
+                reason = 0
+                if not np.isnan(stop[s]) and price <= stop[s]:
+                    reason = 1
+                elif not np.isnan(take[s]) and price >= take[s]:
+                    reason = 2
+                elif signals[t, s] < 0:
+                    reason = 3
+                if reason != 0:
+                    pnl = (price - entry[s]) * qty[s]
+                    cash += qty[s] * price
+                    trades[n_trades, 0] = t
+                    trades[n_trades, 1] = s
+                    trades[n_trades, 2] = 1.0
+                    trades[n_trades, 3] = price
+                    trades[n_trades, 4] = qty[s]
+                    trades[n_trades, 5] = pnl
+                    trades[n_trades, 6] = reason
+                    n_trades += 1
+                    active[s] = 0
+                    n_open -= 1
+
+            # Entries: eine Position pro Symbol, Equity-anteilige Größe
+            if active[s] == 0 and signals[t, s] > 0 and n_open < max_pos:
+                value = equity * position_size
+                if value <= cash and price > 0:
+                    quantity = value / price
+                    qty[s] = quantity
+                    entry[s] = price
+                    stop[s] = sl[t, s]
+                    take[s] = tp[t, s]
+                    active[s] = 1
+                    cash -= value
+                    trades[n_trades, 0] = t
+                    trades[n_trades, 1] = s
+                    trades[n_trades, 2] = 0.0
+                    trades[n_trades, 3] = price
+                    trades[n_trades, 4] = quantity
+                    trades[n_trades, 5] = 0.0
+                    trades[n_trades, 6] = 0.0
+                    n_trades += 1
+                    n_open += 1
+
+        # Equity/Drawdown einmal pro Bar
+        positions_value = 0.0
+        for s in range(S):
+            if active[s] == 1:
+                positions_value += qty[s] * prices[t, s]
+        equity = cash + positions_value
+        balance[t] = equity
+        if equity > peak:
+            peak = equity
+        drawdown = (peak - equity) / peak
+        if drawdown > max_dd:
+            max_dd = drawdown
+
+    return trades[:n_trades], balance, max_dd
+
+
+__all__ = ['run_kernel']
@@ -8,17 +8,174 @@ Unterscheidet sich vom PortfolioSimulator durch:
 - Detaillierte Trade-Statistiken
 """
 
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, NamedTuple, Optional, Any, Tuple
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+import itertools
+import logging
+import os
 import pandas as pd
 import numpy as np
 
 from ..data_models import MarketData, TechnicalIndicators, TradingDecision, TradingSignal
 from ..strategies.base_strategy import BaseStrategy
 from ..utils.logger import logger
+from ._ind_kernels import compute_mock_indicators
 
-@dataclass
+@dataclass(slots=True)
+class _PreparedData:
+    """
+    Vorindizierte Zeitreihe eines Symbols (Structure of Arrays).
+
+    Die Hauptschleife des Backtests fragt pro Tick "Datenpunkt zu t",
+    "letzter Preis <= t" und "letzte 50 Preise" ab — auf List[MarketData]
+    wären das O(N)-Scans pro Tick (O(T²) insgesamt). Mit sortiertem
+    datetime64-Array, paralleler Preis-Spalte und Index-Dict werden alle
+    drei Zugriffe O(1) bzw. O(log N).
+    """
+    ts: np.ndarray                      # datetime64[us], aufsteigend sortiert
+    px: np.ndarray                      # float64, parallel zu ts
+    records: List[MarketData]           # nach Zeitstempel sortiert
+    ts_to_idx: Dict[datetime, int]      # Zeitstempel -> Zeilenindex
+    ma20: np.ndarray                    # vorberechnete gleitende 20er-Mittel (float32)
+    ma50: np.ndarray                    # vorberechnete gleitende 50er-Mittel (float32)
+    macd: np.ndarray                    # vorberechnete Indikator-Spalten (float32)
+    macd_signal: np.ndarray
+    macd_histogram: np.ndarray
+    bb_upper: np.ndarray
+    bb_lower: np.ndarray
+    bb_position: np.ndarray
+    atr: np.ndarray
+    rsi: np.ndarray                     # vorberechneter Mock-RSI (30-70)
+
+class _IndicatorsView(NamedTuple):
+    """
+    Leichtgewichtige Indikator-Sicht für den heißen Backtest-Pfad.
+
+    Feldnamen identisch zu TechnicalIndicators — Strategien greifen nur
+    per Attribut zu, Duck-Typing genügt. Der NamedTuple-Build ist deutlich
+    billiger als eine Dataclass-Instanziierung pro (Symbol, Tick).
+    """
+    rsi: float
+    macd: float
+    macd_signal: float
+    macd_histogram: float
+    ma20: float
+    ma50: float
+    ma200: float
+    bb_upper: float
+    bb_lower: float
+    bb_position: float
+    atr: float
+    atr_percentage: float
+    stoch_k: float
+    williams_r: float
+    volume_ratio: float
+
+def _rolling_mean(px: np.ndarray, window: int) -> np.ndarray:
+    """
+    Gleitender Mittelwert über `window` Bars per Kumulativsumme.
+
+    O(T)-Vorberechnung statt O(T*window) pro Tick; Bars vor dem ersten
+    vollen Fenster behalten wie bisher den aktuellen Preis als Fallback.
+    """
+    out = px.copy()
+    if len(px) >= window:
+        csum = np.cumsum(px)
+        out[window - 1:] = (csum[window - 1:] - np.concatenate(([0.0], csum[:-window]))) / window
+    return out
+
+def _max_loss_run(loss_mask: np.ndarray) -> int:
+    """Längste Serie aufeinanderfolgender True-Werte (Run-Length-Trick)."""
+    if not loss_mask.any():
+        return 0
+    padded = np.concatenate(([False], loss_mask, [False]))
+    edges = np.flatnonzero(np.diff(padded.astype(np.int8)))
+    return int((edges[1::2] - edges[::2]).max())
+
+@dataclass(slots=True)
+class _PreparedRun:
+    """
+    Strategieunabhängig vorbereiteter Backtest-Lauf.
+
+    Bündelt SoA-Daten und Master-Zeitachse, damit Parameter-Sweeps die
+    teure Vorverarbeitung genau einmal bezahlen und pro Kombination nur
+    noch die eigentliche Simulation laufen lassen.
+    """
+    prepared: Dict[str, _PreparedData]
+    master_ts: np.ndarray               # datetime64[us], gefiltert auf den Zeitraum
+    start_date: datetime
+    end_date: datetime
+
+def _prepare_data(historical_data: Dict[str, List[MarketData]]) -> Dict[str, _PreparedData]:
+    """Baut pro Symbol die SoA-Sicht (sortierte Arrays + Index-Dict)."""
+    prepared = {}
+
+    for symbol, symbol_data in historical_data.items():
+        if not symbol_data:
+            continue
+
+        records = sorted(symbol_data, key=lambda r: r.timestamp)
+        n = len(records)
+        px = np.fromiter((r.price for r in records), dtype=np.float64, count=n)
+
+        # Indikator-Spalten in float32: halbe Speicherbandbreite und
+        # halber Cache-Footprint für die Signal-Pässe. Geldgrößen
+        # (px, Kapital, PnL) bleiben float64; die MA-Summation läuft
+        # in float64 und wird erst am Ende downgecastet.
+        px32 = px.astype(np.float32)
+        ma20 = _rolling_mean(px, 20).astype(np.float32)
+        ma50 = _rolling_mean(px, 50).astype(np.float32)
+
+        # Alle abgeleiteten Indikator-Spalten in einem Kernel-Aufruf
+        (macd, macd_signal, macd_histogram,
+         bb_upper, bb_lower, bb_position, atr) = compute_mock_indicators(px32, ma20, ma50)
+
+        # Mock-RSI (30-70) als eine RNG-Ziehung pro Symbol statt
+        # String-Bau + hash() pro Tick im heißen Pfad
+        rng = np.random.default_rng(abs(hash(symbol)) % (2 ** 32))
+        rsi = rng.integers(30, 71, n).astype(np.float32)
+
+        prepared[symbol] = _PreparedData(
+            ts=np.array([r.timestamp for r in records], dtype='datetime64[us]'),
+            px=px,
+            records=records,
+            ts_to_idx={r.timestamp: i for i, r in enumerate(records)},
+            ma20=ma20,
+            ma50=ma50,
+            macd=macd,
+            macd_signal=macd_signal,
+            macd_histogram=macd_histogram,
+            bb_upper=bb_upper,
+            bb_lower=bb_lower,
+            bb_position=bb_position,
+            atr=atr,
+            rsi=rsi
+        )
+
+    return prepared
+
+def _prepare_run(historical_data: Dict[str, List[MarketData]],
+                 start_date: datetime, end_date: datetime) -> _PreparedRun:
+    """Führt die komplette strategieunabhängige Vorverarbeitung aus."""
+    # Daten einmalig in SoA-Arrays vorindizieren — danach kommt die
+    # Hauptschleife ohne lineare Scans über die Rohdaten aus
+    prepared = _prepare_data(historical_data)
+
+    # Master-Zeitachse als datetime64-Union: C-Level Sort/Dedup auf
+    # 8-Byte-Ints statt eines Python-Sets aus geboxten datetimes
+    if prepared:
+        master_ts = np.unique(np.concatenate([pdata.ts for pdata in prepared.values()]))
+        master_ts = master_ts[(master_ts >= np.datetime64(start_date)) &
+                              (master_ts <= np.datetime64(end_date))]
+    else:
+        master_ts = np.empty(0, dtype='datetime64[us]')
+
+    return _PreparedRun(prepared=prepared, master_ts=master_ts,
+                        start_date=start_date, end_date=end_date)
+
+@dataclass(slots=True)
 class BacktestTrade:
     """Ein einzelner Trade im Backtest."""
     strategy_name: str
@@ -49,7 +206,7 @@ class BacktestTrade:
             self.duration_hours = (self.exit_time - self.entry_time).total_seconds() / 3600
             self.is_winner = self.pnl > 0
 
-@dataclass
+@dataclass(slots=True)
 class BacktestResults:
     """Zusammenfassung der Backtest-Ergebnisse."""
     strategy_name: str
@@ -83,7 +240,16 @@ class BacktestResults:
     
     # Trade History
     trades: List[BacktestTrade] = field(default_factory=list)
-    equity_curve: List[Tuple[datetime, float]] = field(default_factory=list)
+    # Equity-Kurve als parallele Arrays statt Liste von (datetime, float)-
+    # Tupeln: zusammenhängender Speicher, direkt an pandas/Plotting
+    # übergebbar, ~10x weniger Heap bei langen Läufen
+    equity_times: np.ndarray = field(default_factory=lambda: np.empty(0, dtype='datetime64[us]'))
+    equity_values: np.ndarray = field(default_factory=lambda: np.empty(0, dtype=np.float64))
+
+    @property
+    def equity_curve(self) -> List[Tuple[datetime, float]]:
+        """Kompatibilitäts-Sicht als Liste von (timestamp, value)-Tupeln."""
+        return list(zip(self.equity_times.tolist(), self.equity_values.tolist()))
 
 class SimpleBacktester:
     """
@@ -104,6 +270,17 @@ class SimpleBacktester:
         self.active_trades: Dict[str, BacktestTrade] = {}  # symbol -> trade
         self.completed_trades: List[BacktestTrade] = []
         self.equity_history: List[Tuple[datetime, float]] = []
+        # Spalten-Puffer der abgeschlossenen Trades für die vektorisierte
+        # Ergebnis-Aggregation (BacktestTrade bleibt die API-Sicht)
+        self._trade_rows: List[Dict[str, Any]] = []
+        # (strategy_name, symbol) -> (entries, exits) Boolean-Arrays
+        self._vector_signals: Dict[Tuple[str, str], Tuple[np.ndarray, np.ndarray]] = {}
+        # Letzter gesehener Preis pro Symbol — macht die Portfolio-Bewertung
+        # pro Tick zu einem Dict-Lookup statt einer Binärsuche pro Position
+        self._last_px: Dict[str, float] = {}
+        # Equity-Kurve des letzten Laufs als parallele Arrays
+        self._equity_ts: np.ndarray = np.empty(0, dtype='datetime64[us]')
+        self._equity_values: np.ndarray = np.empty(0, dtype=np.float64)
         
         logger.info(f"Backtester initialized with {initial_capital:.2f} capital")
     
@@ -125,125 +302,170 @@ class SimpleBacktester:
         Returns:
             Dict mit BacktestResults pro Strategie
         """
+        return self.run_backtest_prepared(_prepare_run(historical_data, start_date, end_date))
+
+    def run_backtest_prepared(self, run: _PreparedRun) -> Dict[str, BacktestResults]:
+        """
+        Führt den Backtest auf einem bereits vorbereiteten Lauf aus.
+
+        Die strategieunabhängige Vorverarbeitung (SoA-Ingestion, Master-
+        Zeitachse, Indikator-Spalten) steckt in _prepare_run — Parameter-
+        Sweeps rufen sie genau einmal auf und starten pro Kombination nur
+        noch hier.
+        """
+        start_date, end_date = run.start_date, run.end_date
+        prepared = run.prepared
+        master_ts = run.master_ts
+
         logger.info(f"Starting backtest from {start_date} to {end_date}")
-        
+
         # Reset state
         self.current_capital = self.initial_capital
         self.active_trades.clear()
         self.completed_trades.clear()
         self.equity_history.clear()
-        
-        # Sammle alle verfügbaren Zeitpunkte
-        all_timestamps = set()
-        for symbol_data in historical_data.values():
-            for data_point in symbol_data:
-                if start_date <= data_point.timestamp <= end_date:
-                    all_timestamps.add(data_point.timestamp)
-        
-        sorted_timestamps = sorted(all_timestamps)
-        logger.info(f"Processing {len(sorted_timestamps)} time points")
-        
+        self._last_px.clear()
+        self._trade_rows.clear()
+
+        # Vektor-Pfad: Strategien mit supports_vectorized berechnen ihre
+        # Entry-/Exit-Masken einmal über die ganze Serie; die Hauptschleife
+        # liest dann nur noch Flags und ruft analyze nur an Signal-Bars
+        self._vector_signals.clear()
+        for strategy_name, strategy in self.strategies.items():
+            if getattr(strategy, 'supports_vectorized', False):
+                for symbol, pdata in prepared.items():
+                    # Indikator-SoA wie in _create_mock_indicators, nur als
+                    # ganze Spalten; float64 wie die skalare Sicht, damit
+                    # Vergleiche an Grenzwerten identisch ausfallen
+                    n = len(pdata.px)
+                    ma50 = pdata.ma50.astype(np.float64)
+                    cols = {
+                        'rsi': pdata.rsi.astype(np.float64),
+                        'macd': pdata.macd.astype(np.float64),
+                        'macd_signal': pdata.macd_signal.astype(np.float64),
+                        'macd_histogram': pdata.macd_histogram.astype(np.float64),
+                        'ma20': pdata.ma20.astype(np.float64),
+                        'ma50': ma50,
+                        'ma200': ma50,  # Vereinfacht
+                        'bb_upper': pdata.bb_upper.astype(np.float64),
+                        'bb_lower': pdata.bb_lower.astype(np.float64),
+                        'bb_position': pdata.bb_position.astype(np.float64),
+                        'atr': pdata.atr.astype(np.float64),
+                        'atr_percentage': np.full(n, 2.0),
+                        'stoch_k': np.full(n, 50.0),
+                        'williams_r': np.full(n, -50.0),
+                        'volume_ratio': np.ones(n),
+                    }
+                    self._vector_signals[(strategy_name, symbol)] = \
+                        strategy.vectorized_signals(pdata.px, cols)
+
+        total_ticks = len(master_ts)
+        logger.info(f"Processing {total_ticks} time points")
+
+        # Vorallozierte Equity-Kurve: ein float64-Slot pro Tick statt
+        # T Python-Tupel mit geboxten datetimes
+        equity_values = np.empty(total_ticks, dtype=np.float64)
+
+        # Guard einmal vor der Schleife auswerten: der Fortschritts-String
+        # wird nur noch gebaut, wenn INFO überhaupt emittiert wird
+        info_enabled = logger.isEnabledFor(logging.INFO)
+
         # Hauptschleife: Prozessiere jeden Zeitpunkt
-        for i, timestamp in enumerate(sorted_timestamps):
-            if i % 100 == 0:  # Progress logging
-                logger.info(f"Processing {timestamp} ({i+1}/{len(sorted_timestamps)})")
-            
-            self._process_timestamp(timestamp, historical_data)
-            
-            # Record equity curve
-            total_portfolio_value = self._calculate_portfolio_value(timestamp, historical_data)
-            self.equity_history.append((timestamp, total_portfolio_value))
-        
+        for i in range(total_ticks):
+            ts64 = master_ts[i]
+            # Rückkonvertierung nach datetime nur einmal pro Tick — die
+            # Strategie-API und die Trade-Records erwarten datetime
+            timestamp = ts64.item()
+
+            if info_enabled and i % 100 == 0:  # Progress logging
+                logger.info(f"Processing {timestamp} ({i+1}/{total_ticks})")
+
+            self._process_timestamp(timestamp, prepared)
+
+            # Record equity curve: Cash plus offene Positionen zum letzten
+            # bekannten Preis — O(offene Positionen) Dict-Lookups pro Tick
+            total_value = self.current_capital
+            for symbol, trade in self.active_trades.items():
+                total_value += trade.quantity * self._last_px.get(symbol, trade.entry_price)
+            equity_values[i] = total_value
+
+        self._equity_ts = master_ts
+        self._equity_values = equity_values
+
+        # Rückkonvertierung in das bisherige Listenformat erst bei der
+        # Ergebnis-Emission, nicht im heißen Pfad
+        self.equity_history = [
+            (master_ts[i].item(), float(equity_values[i])) for i in range(total_ticks)
+        ]
+
         # Close all remaining positions
-        self._close_all_positions(end_date, historical_data)
-        
+        self._close_all_positions(end_date, prepared)
+
         # Generate results per strategy
         return self._generate_results(start_date, end_date)
-    
-    def _process_timestamp(self, timestamp: datetime, 
-                          historical_data: Dict[str, List[MarketData]]) -> None:
+
+    def _process_timestamp(self, timestamp: datetime,
+                          prepared: Dict[str, _PreparedData]) -> None:
         """Prozessiert einen einzelnen Zeitpunkt."""
-        
+
         # Für jedes Symbol aktuelle Daten holen
-        for symbol, data_series in historical_data.items():
-            current_data = None
-            
-            # Finde aktuellste Daten für diesen Zeitpunkt
-            for data_point in data_series:
-                if data_point.timestamp == timestamp:
-                    current_data = data_point
-                    break
-            
-            if not current_data:
+        for symbol, pdata in prepared.items():
+            # O(1)-Lookup statt Scan über die ganze Serie
+            idx = pdata.ts_to_idx.get(timestamp)
+            if idx is None:
                 continue
-            
+
+            current_data = pdata.records[idx]
+            self._last_px[symbol] = float(pdata.px[idx])
+
             # Erstelle Mock-Indikatoren (in echtem Backtest würden diese berechnet)
-            indicators = self._create_mock_indicators(current_data, symbol, data_series, timestamp)
+            indicators = self._create_mock_indicators(current_data, symbol, pdata, idx)
             
+            # Entscheidungs-Memo für diese Bar: Exit- und Entry-Pfad teilen
+            # sich pro Strategie denselben analyze-Aufruf, statt dieselbe
+            # Bar doppelt zu analysieren
+            bar_decisions: Dict[str, TradingDecision] = {}
+
             # Prüfe bestehende Positionen für Exit-Signale
-            self._check_exit_conditions(symbol, current_data, indicators, timestamp)
-            
+            self._check_exit_conditions(symbol, current_data, indicators, timestamp, idx, bar_decisions)
+
             # Teste Entry-Signale für alle Strategien
             for strategy_name, strategy in self.strategies.items():
                 if symbol not in self.active_trades:  # Keine Position offen
-                    self._check_entry_signals(strategy, symbol, current_data, indicators, timestamp)
+                    self._check_entry_signals(strategy, symbol, current_data, indicators,
+                                              timestamp, idx, bar_decisions)
     
     def _create_mock_indicators(self, current_data: MarketData, symbol: str,
-                               data_series: List[MarketData], timestamp: datetime) -> TechnicalIndicators:
+                               pdata: _PreparedData, idx: int) -> _IndicatorsView:
         """Erstellt Mock-Indikatoren für Backtest (vereinfacht)."""
-        
+
         # In einem echten Backtest würden hier echte technische Indikatoren berechnet
-        # Für jetzt verwenden wir vereinfachte Mock-Werte
-        
-        # Sammle letzte 20 Preise für MA-Berechnung
-        recent_prices = []
-        for data_point in data_series:
-            if data_point.timestamp <= timestamp:
-                recent_prices.append(data_point.price)
-        recent_prices = recent_prices[-50:]  # Letzte 50 für MA50
-        
-        # Einfache Moving Averages
-        ma20 = np.mean(recent_prices[-20:]) if len(recent_prices) >= 20 else current_data.price
-        ma50 = np.mean(recent_prices[-50:]) if len(recent_prices) >= 50 else current_data.price
-        ma200 = ma50  # Vereinfacht
-        
-        # Mock RSI (zwischen 30-70)
-        rsi = 50 + (hash(f"{symbol}{timestamp}") % 41 - 20)  # Pseudo-random 30-70
-        
-        # Mock MACD
-        macd = (ma20 - ma50) / ma50 if ma50 > 0 else 0
-        macd_signal = macd * 0.9
-        macd_histogram = macd - macd_signal
-        
-        # Mock Bollinger Bands
-        bb_upper = current_data.price * 1.02
-        bb_lower = current_data.price * 0.98
-        bb_position = ((current_data.price - bb_lower) / (bb_upper - bb_lower)) * 100
-        
-        # Mock ATR (2% des Preises)
-        atr = current_data.price * 0.02
-        atr_percentage = 2.0
-        
-        return TechnicalIndicators(
-            rsi=float(rsi),
-            macd=float(macd),
-            macd_signal=float(macd_signal),
-            macd_histogram=float(macd_histogram),
-            ma20=float(ma20),
-            ma50=float(ma50),
-            ma200=float(ma200),
-            bb_upper=float(bb_upper),
-            bb_lower=float(bb_lower),
-            bb_position=float(bb_position),
-            atr=float(atr),
-            atr_percentage=float(atr_percentage),
+        # Für jetzt verwenden wir vereinfachte Mock-Werte — alle Spalten sind
+        # bereits vorberechnet, hier bleibt nur der O(1)-Lookup per Index
+
+        ma50 = float(pdata.ma50[idx])
+
+        return _IndicatorsView(
+            rsi=float(pdata.rsi[idx]),
+            macd=float(pdata.macd[idx]),
+            macd_signal=float(pdata.macd_signal[idx]),
+            macd_histogram=float(pdata.macd_histogram[idx]),
+            ma20=float(pdata.ma20[idx]),
+            ma50=ma50,
+            ma200=ma50,  # Vereinfacht
+            bb_upper=float(pdata.bb_upper[idx]),
+            bb_lower=float(pdata.bb_lower[idx]),
+            bb_position=float(pdata.bb_position[idx]),
+            atr=float(pdata.atr[idx]),
+            atr_percentage=2.0,
             stoch_k=50.0,
             williams_r=-50.0,
             volume_ratio=1.0
         )
     
     def _check_exit_conditions(self, symbol: str, current_data: MarketData,
-                              indicators: TechnicalIndicators, timestamp: datetime) -> None:
+                              indicators: TechnicalIndicators, timestamp: datetime,
+                              idx: int, bar_decisions: Dict[str, TradingDecision]) -> None:
         """Prüft Exit-Bedingungen für bestehende Positionen."""
         if symbol not in self.active_trades:
             return
@@ -263,20 +485,44 @@ class SimpleBacktester:
         
         # Strategy-basierte Exit-Signale
         strategy = self.strategies.get(trade.strategy_name)
-        if strategy:
+        if not strategy:
+            return
+
+        # Vektor-Pfad: Exit-Maske wurde vorab für die ganze Serie berechnet
+        flags = self._vector_signals.get((trade.strategy_name, symbol))
+        if flags is not None:
+            if flags[1][idx]:
+                self._close_trade(trade, current_price, timestamp,
+                                  f"Strategy Signal: {TradingSignal.SELL.name}")
+            return
+
+        decision = bar_decisions.get(trade.strategy_name)
+        if decision is None:
             decision = strategy.analyze(symbol, current_data, indicators, None)
-            
-            # Verkaufs-Signal bei bestehender Long-Position
-            if decision.signal in [TradingSignal.SELL, TradingSignal.STRONG_SELL]:
-                self._close_trade(trade, current_price, timestamp, f"Strategy Signal: {decision.signal}")
+            bar_decisions[trade.strategy_name] = decision
+
+        # Verkaufs-Signal bei bestehender Long-Position
+        if decision.signal in [TradingSignal.SELL, TradingSignal.STRONG_SELL]:
+            self._close_trade(trade, current_price, timestamp, f"Strategy Signal: {decision.signal.name}")
     
     def _check_entry_signals(self, strategy: BaseStrategy, symbol: str,
                            current_data: MarketData, indicators: TechnicalIndicators,
-                           timestamp: datetime) -> None:
+                           timestamp: datetime, idx: int,
+                           bar_decisions: Dict[str, TradingDecision]) -> None:
         """Prüft Entry-Signale für eine Strategie."""
-        
+
+        # Vektor-Pfad: an Bars ohne Entry-Flag gar nicht erst analysieren —
+        # der skalare analyze-Aufruf bleibt nur an Signal-Bars übrig, um
+        # Confidence/Stop-Loss/Position-Size zu bestimmen
+        flags = self._vector_signals.get((strategy.name, symbol))
+        if flags is not None and not flags[0][idx]:
+            return
+
         try:
-            decision = strategy.analyze(symbol, current_data, indicators, None)
+            decision = bar_decisions.get(strategy.name)
+            if decision is None:
+                decision = strategy.analyze(symbol, current_data, indicators, None)
+                bar_decisions[strategy.name] = decision
             
             # Nur Buy-Signale verarbeiten (Long-only Backtest)
             if decision.signal in [TradingSignal.BUY, TradingSignal.STRONG_BUY]:
@@ -319,7 +565,8 @@ class SimpleBacktester:
         # Update verfügbares Kapital
         self.current_capital -= position_value
         
-        logger.debug(f"Opened {symbol} position: {quantity:.4f} @ {market_data.price:.4f}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Opened {symbol} position: {quantity:.4f} @ {market_data.price:.4f}")
     
     def _close_trade(self, trade: BacktestTrade, exit_price: float,
                     exit_time: datetime, exit_reason: str) -> None:
@@ -337,49 +584,37 @@ class SimpleBacktester:
         
         # Move to completed trades
         self.completed_trades.append(trade)
+        self._trade_rows.append({
+            'strategy_name': trade.strategy_name,
+            'pnl': trade.pnl,
+            'pnl_percentage': trade.pnl_percentage,
+            'duration_hours': trade.duration_hours,
+            'is_winner': trade.is_winner
+        })
         del self.active_trades[trade.symbol]
         
-        logger.debug(f"Closed {trade.symbol}: PnL {trade.pnl:.2f} ({trade.pnl_percentage:+.2f}%)")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Closed {trade.symbol}: PnL {trade.pnl:.2f} ({trade.pnl_percentage:+.2f}%)")
     
-    def _close_all_positions(self, end_date: datetime, 
-                           historical_data: Dict[str, List[MarketData]]) -> None:
+    def _close_all_positions(self, end_date: datetime,
+                           prepared: Dict[str, _PreparedData]) -> None:
         """Schließt alle offenen Positionen am Ende des Backtests."""
-        
+
+        end_ts64 = np.datetime64(end_date)
+
         for symbol, trade in list(self.active_trades.items()):
-            # Finde letzten verfügbaren Preis
-            symbol_data = historical_data.get(symbol, [])
-            last_price = None
-            
-            for data_point in reversed(symbol_data):
-                if data_point.timestamp <= end_date:
-                    last_price = data_point.price
-                    break
-            
-            if last_price:
-                self._close_trade(trade, last_price, end_date, "Backtest End")
-    
-    def _calculate_portfolio_value(self, timestamp: datetime,
-                                 historical_data: Dict[str, List[MarketData]]) -> float:
-        """Berechnet den Gesamtwert des Portfolios zu einem Zeitpunkt."""
-        
-        total_value = self.current_capital  # Cash
-        
-        # Add value of open positions
-        for symbol, trade in self.active_trades.items():
-            symbol_data = historical_data.get(symbol, [])
-            current_price = None
-            
-            # Finde aktuellen Preis
-            for data_point in symbol_data:
-                if data_point.timestamp <= timestamp:
-                    current_price = data_point.price
-            
-            if current_price:
-                position_value = trade.quantity * current_price
-                total_value += position_value
-        
-        return total_value
-    
+            pdata = prepared.get(symbol)
+            if pdata is None:
+                continue
+
+            # Letzter verfügbarer Preis <= end_date per Binärsuche statt
+            # Rückwärts-Scan über die Records
+            idx = int(np.searchsorted(pdata.ts, end_ts64, side='right')) - 1
+            if idx >= 0:
+                last_price = float(pdata.px[idx])
+                if last_price:
+                    self._close_trade(trade, last_price, end_date, "Backtest End")
+
     def _generate_results(self, start_date: datetime, end_date: datetime) -> Dict[str, BacktestResults]:
         """Generiert Backtest-Ergebnisse pro Strategie."""
         
@@ -391,48 +626,81 @@ class SimpleBacktester:
             trades_by_strategy[trade.strategy_name].append(trade)
         
         results = {}
-        
-        for strategy_name, strategy_trades in trades_by_strategy.items():
-            if not strategy_trades:
-                continue
-            
-            # Basic calculations
-            total_pnl = sum(trade.pnl for trade in strategy_trades)
-            winning_trades = [t for t in strategy_trades if t.is_winner]
-            losing_trades = [t for t in strategy_trades if not t.is_winner]
-            
-            # Performance metrics
-            final_capital = self.initial_capital + total_pnl
-            total_return_pct = (total_pnl / self.initial_capital) * 100
-            
-            # Trade statistics
-            win_rate = len(winning_trades) / len(strategy_trades) if strategy_trades else 0
-            avg_win = float(np.mean([t.pnl for t in winning_trades])) if winning_trades else 0.0
-            avg_loss = float(np.mean([t.pnl for t in losing_trades])) if losing_trades else 0.0
-            
-            # Risk metrics
-            daily_returns = [t.pnl_percentage for t in strategy_trades]
-            sharpe_ratio = float(np.mean(daily_returns) / np.std(daily_returns)) if len(daily_returns) > 1 and np.std(daily_returns) > 0 else 0.0
-            
+
+        # Equity-basierte Risiko-Kennzahlen einmal vektorisiert berechnen:
+        # Log-Returns, Drawdown per laufendem Maximum, VaR als Quantil —
+        # SIMD-Reduktionen im NumPy-C-Core statt Python-Schleifen über Trades
+        eq = self._equity_values
+        sharpe_ratio = sortino_ratio = max_drawdown = value_at_risk_95 = 0.0
+        if len(eq) > 1 and np.all(eq > 0):
+            returns = np.diff(np.log(eq))
+            annualization = np.sqrt(252.0)  # Annahme: Tages-Bars
+
+            std = returns.std()
+            if std > 0:
+                sharpe_ratio = float(returns.mean() / std * annualization)
+
+            downside = returns[returns < 0]
+            if len(downside) > 0:
+                downside_std = downside.std()
+                if downside_std > 0:
+                    sortino_ratio = float(returns.mean() / downside_std * annualization)
+
+            max_drawdown = float((1.0 - eq / np.maximum.accumulate(eq)).max())
+            value_at_risk_95 = float(np.quantile(returns, 0.05))
+
+        if not self._trade_rows:
+            return results
+
+        # Trade-Statistiken vektorisiert über den Spalten-Puffer: ein
+        # DataFrame, alle Aggregate in groupby-C-Pfaden statt Python-
+        # Listen-Comprehensions pro Strategie und Trade
+        df = pd.DataFrame(self._trade_rows)
+        df['win_pnl'] = df['pnl'].where(df['is_winner'])
+        df['loss_pnl'] = df['pnl'].mask(df['is_winner'])
+
+        grouped = df.groupby('strategy_name', sort=False)
+        stats = grouped.agg(
+            total_pnl=('pnl', 'sum'),
+            trade_count=('pnl', 'size'),
+            wins=('is_winner', 'sum'),
+            avg_win=('win_pnl', 'mean'),
+            avg_loss=('loss_pnl', 'mean')
+        )
+        # Längste Verlustserie pro Strategie per Run-Length auf der Maske
+        max_loss_runs = grouped['is_winner'].apply(
+            lambda s: _max_loss_run(~s.to_numpy(dtype=bool)))
+
+        for row in stats.itertuples():
+            strategy_name = row.Index
+            total_pnl = float(row.total_pnl)
+            trade_count = int(row.trade_count)
+            wins = int(row.wins)
+
             results[strategy_name] = BacktestResults(
                 strategy_name=strategy_name,
                 start_date=start_date,
                 end_date=end_date,
                 initial_capital=self.initial_capital,
-                final_capital=final_capital,
+                final_capital=self.initial_capital + total_pnl,
                 total_return=total_pnl,
-                total_return_pct=total_return_pct,
+                total_return_pct=(total_pnl / self.initial_capital) * 100,
+                max_drawdown=max_drawdown,
                 sharpe_ratio=sharpe_ratio,
-                total_trades=len(strategy_trades),
-                winning_trades=len(winning_trades),
-                losing_trades=len(losing_trades),
-                win_rate=win_rate,
-                avg_win=avg_win,
-                avg_loss=avg_loss,
-                trades=strategy_trades,
-                equity_curve=self.equity_history.copy()
+                sortino_ratio=sortino_ratio,
+                total_trades=trade_count,
+                winning_trades=wins,
+                losing_trades=trade_count - wins,
+                win_rate=wins / trade_count if trade_count else 0,
+                avg_win=float(row.avg_win) if not np.isnan(row.avg_win) else 0.0,
+                avg_loss=float(row.avg_loss) if not np.isnan(row.avg_loss) else 0.0,
+                max_consecutive_losses=int(max_loss_runs[strategy_name]),
+                value_at_risk_95=value_at_risk_95,
+                trades=trades_by_strategy.get(strategy_name, []),
+                equity_times=self._equity_ts,
+                equity_values=self._equity_values
             )
-        
+
         return results
     
     def run_parameter_sweep(self, strategy_class: type, parameter_ranges: Dict[str, List],
@@ -452,36 +720,98 @@ class SimpleBacktester:
             Dict mit Ergebnissen pro Parameter-Kombination
         """
         logger.info(f"Starting parameter sweep for {strategy_class.__name__}")
-        
+
         # Generiere alle Parameter-Kombinationen
-        import itertools
         param_names = list(parameter_ranges.keys())
         param_values = list(parameter_ranges.values())
-        
+
+        # Rein numerische Grids über np.meshgrid expandieren: das kartesische
+        # Produkt entsteht als (N, K)-Array im C-Core statt Tupel für Tupel
+        # in Python. meshgrid promotet gemeinsam und die Originaltypen werden
+        # pro Spalte über type(values[0]) wiederhergestellt — das ist nur
+        # korrekt, wenn jede Spalte typ-homogen ist ([1, 1.5, 2] würde sonst
+        # zu 1, 1, 2 abgeschnitten). Gemischte int/float-Spalten und
+        # textuelle Parameter fallen auf itertools.product zurück.
+        is_numeric_grid = bool(param_values) and all(
+            values and all(
+                isinstance(value, (int, float))
+                and not isinstance(value, bool)
+                and type(value) is type(values[0])
+                for value in values
+            )
+            for values in param_values
+        )
+        if is_numeric_grid:
+            grid = np.stack(np.meshgrid(*param_values, indexing='ij'),
+                            axis=-1).reshape(-1, len(param_names))
+            col_types = [type(values[0]) for values in param_values]
+            combos = [
+                dict(zip(param_names, (t(v) for t, v in zip(col_types, row))))
+                for row in grid.tolist()
+            ]
+        else:
+            combos = [dict(zip(param_names, combination))
+                      for combination in itertools.product(*param_values)]
+        if not combos:
+            return {}
+
         results = {}
-        
-        for combination in itertools.product(*param_values):
-            param_dict = dict(zip(param_names, combination))
-            param_key = "_".join([f"{k}={v}" for k, v in param_dict.items()])
-            
-            logger.info(f"Testing parameters: {param_dict}")
-            
-            # Erstelle Strategie mit diesen Parametern
-            try:
-                strategy = strategy_class(**param_dict)
-                self.strategies.clear()
-                self.add_strategy(strategy)
-                
-                # Führe Backtest aus
-                backtest_results = self.run_backtest(historical_data, start_date, end_date)
-                
-                if strategy.name in backtest_results:
-                    results[param_key] = backtest_results[strategy.name]
-                    
-            except Exception as e:
-                logger.error(f"Error testing parameters {param_dict}: {e}")
-                continue
-        
+
+        # Jede Kombination ist unabhängig und CPU-lastig — über Prozesse
+        # verteilen statt sequentiell im selben Interpreter. Die Daten
+        # wandern per Initializer genau einmal pro Worker, nicht pro Combo.
+        max_workers = min(os.cpu_count() or 1, len(combos))
+        with ProcessPoolExecutor(
+            max_workers=max_workers,
+            initializer=_init_sweep_worker,
+            initargs=(historical_data, start_date, end_date, self.initial_capital)
+        ) as executor:
+            for param_key, combo_result in executor.map(
+                _run_one_combo,
+                ((strategy_class, param_dict) for param_dict in combos)
+            ):
+                if combo_result is not None:
+                    results[param_key] = combo_result
+
         return results
 
+# === SWEEP-WORKER (Top-Level, damit ProcessPoolExecutor sie picklen kann) ===
+
+# Pro Worker-Prozess einmal gesetzter Kontext (Daten + Zeitraum + Kapital)
+_SWEEP_CONTEXT: Optional[Tuple] = None
+
+def _init_sweep_worker(historical_data: Dict[str, List[MarketData]],
+                       start_date: datetime, end_date: datetime,
+                       initial_capital: float) -> None:
+    """Initializer: bereitet den Lauf genau einmal pro Worker-Prozess vor.
+
+    Die teure Vorverarbeitung (SoA-Ingestion, Master-Zeitachse,
+    Indikator-Spalten) läuft hier ein einziges Mal; alle Combos desselben
+    Workers teilen sich den fertigen _PreparedRun.
+    """
+    global _SWEEP_CONTEXT
+    _SWEEP_CONTEXT = (_prepare_run(historical_data, start_date, end_date), initial_capital)
+
+def _run_one_combo(job: Tuple[type, Dict[str, Any]]) -> Tuple[str, Optional[BacktestResults]]:
+    """Führt den Backtest für genau eine Parameter-Kombination aus."""
+    strategy_class, param_dict = job
+    param_key = "_".join([f"{k}={v}" for k, v in param_dict.items()])
+    run, initial_capital = _SWEEP_CONTEXT
+
+    logger.info(f"Testing parameters: {param_dict}")
+
+    try:
+        strategy = strategy_class(**param_dict)
+
+        # Frischer Backtester pro Combo: kein geteilter Zustand zwischen Prozessen
+        backtester = SimpleBacktester(initial_capital=initial_capital)
+        backtester.add_strategy(strategy)
+        backtest_results = backtester.run_backtest_prepared(run)
+
+        return param_key, backtest_results.get(strategy.name)
+
+    except Exception as e:
+        logger.error(f"Error testing parameters {param_dict}: {e}")
+        return param_key, None
+
 __all__ = ['SimpleBacktester', 'BacktestTrade', 'BacktestResults']
@@ -11,13 +11,21 @@ Dieses Modul simuliert ein Trading-Portfolio mit:
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from multiprocessing import shared_memory
+import itertools
 import logging
+import os
+
+import numpy as np
+import pandas as pd
 
 from ..data_models import MarketData, TechnicalIndicators, NewsAnalysis, TradingDecision, TradingSignal
 from ..strategies.base_strategy import BaseStrategy
 from ..utils.logger import logger
+from ._kernel import run_kernel
 
-@dataclass
+@dataclass(slots=True)
 class SimulationPosition:
     """Eine Position in der Simulation."""
     symbol: str
@@ -27,11 +35,13 @@ class SimulationPosition:
     entry_time: datetime
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
-    
-    @property
-    def current_value(self) -> float:
-        return self.quantity * self.entry_price
-    
+    # Einmalig bei Eröffnung berechnet — quantity/entry_price ändern sich
+    # nach dem Entry nicht mehr, damit entfällt der Property-Aufruf pro Bar
+    current_value: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.current_value = self.quantity * self.entry_price
+
     def calculate_pnl(self, current_price: float) -> float:
         """Berechnet unrealisierten PnL."""
         return (current_price - self.entry_price) * self.quantity
@@ -70,82 +80,304 @@ class PortfolioSimulator:
         # Portfolio State
         self.positions: Dict[str, SimulationPosition] = {}
         self.strategies: Dict[str, BaseStrategy] = {}
-        self.trade_history: List[Dict] = []
-        self.balance_history: List[Dict] = []
+
+        # Balance-Historie als typisierte Spalten-Puffer (analog zur
+        # Trade-Historie) statt einer Liste von Dicts mit String-Keys
+        self._balance_cap = 256
+        self._balance_n = 0
+        self._balance_buf: Dict[str, np.ndarray] = {
+            'timestamp': np.empty(self._balance_cap, dtype='datetime64[us]'),
+            'total_balance': np.empty(self._balance_cap),
+            'cash': np.empty(self._balance_cap),
+            'positions_value': np.empty(self._balance_cap),
+            'positions_count': np.empty(self._balance_cap, dtype=np.int32),
+        }
+
+        # Spaltenbasierte Trade-Historie: vorallokierte typisierte Puffer
+        # statt einer Liste von Dicts; Strings (Symbol/Strategie/Grund)
+        # werden über eine Intern-Tabelle als int32-Codes abgelegt.
+        self._trade_cap = 256
+        self._trade_n = 0
+        self._trade_buf: Dict[str, np.ndarray] = {
+            'timestamp': np.empty(self._trade_cap, dtype='datetime64[us]'),
+            'symbol': np.empty(self._trade_cap, dtype=np.int32),
+            'strategy': np.empty(self._trade_cap, dtype=np.int32),
+            'action': np.empty(self._trade_cap, dtype=np.int8),   # 0=BUY, 1=SELL
+            'price': np.empty(self._trade_cap, dtype=np.float32),
+            'quantity': np.empty(self._trade_cap, dtype=np.float32),
+            'value': np.empty(self._trade_cap),
+            'pnl': np.empty(self._trade_cap),
+            'reason': np.empty(self._trade_cap, dtype=np.int32),
+            'hold_duration': np.empty(self._trade_cap, dtype=np.int32),
+        }
+        self._interned: Dict[str, int] = {}
+        self._interned_rev: List[str] = []
+
+        # SoA-Arrays für die vektorisierte Positions-Prüfung: pro Slot
+        # quantity/entry/SL/TP/Symbol-Code, statt Python-Schleifen über Dicts.
+        # NaN bei SL/TP bedeutet "nicht gesetzt" (Vergleiche mit NaN sind False).
+        # float32 reicht für die Schwellwert-Vergleiche (~7 signifikante
+        # Stellen) und halbiert die Cache-Last des Bar-Loops; die laufende
+        # Geld-Buchhaltung (cash/current_balance, PnL über die Positions-
+        # Objekte) bleibt bewusst float64.
+        self._pos_qty = np.zeros(max_positions, dtype=np.float32)
+        self._pos_entry = np.zeros(max_positions, dtype=np.float32)
+        self._pos_sl = np.full(max_positions, np.nan, dtype=np.float32)
+        self._pos_tp = np.full(max_positions, np.nan, dtype=np.float32)
+        self._pos_sym = np.full(max_positions, -1, dtype=np.int32)
+        self._pos_active = np.zeros(max_positions, dtype=bool)
+        self._slot_ids: List[Optional[str]] = [None] * max_positions
+        self._pos_slot: Dict[str, int] = {}
+        self._symbol_codes: Dict[str, int] = {}
+
+        # Sekundär-Indizes für O(1)-Zugriff statt linearer Scans über positions
+        self._by_symbol: Dict[str, set] = {}
+        self._by_symstrat: Dict[tuple, str] = {}
         
         # Performance Tracking
         self.peak_balance = initial_balance
         self.max_drawdown = 0.0
         self.start_time = datetime.now()
+        self._last_day = None  # Kalendertag des letzten Balance-Snapshots
+        self._pos_seq = 0      # laufende Nummer für Positions-IDs
+
+        # Zuletzt gesehener Preis pro Symbol — Basis für unrealized_pnl,
+        # wenn get_current_status keine aktuellen Preise übergeben bekommt
+        self._last_prices: Dict[str, float] = {}
+
+        # Laufender Positions-Wert: wird bei Open/Close fortgeschrieben,
+        # damit die Portfolio-Bewertung pro Bar O(1) statt O(Positionen) ist
+        # (current_value ist nach dem Entry konstant, siehe SimulationPosition)
+        self._positions_value = 0.0
         
         logger.info(f"Portfolio Simulator initialized with ${initial_balance:,.2f}")
     
     def add_strategy(self, strategy: BaseStrategy) -> None:
-        """Fügt eine Strategie zum Portfolio hinzu."""
+        """Fügt eine Strategie zum Portfolio hinzu (mit Struktur-Validierung)."""
+        # Strukturfehler sofort beim Registrieren abfangen — der Dispatch im
+        # Bar-Loop muss dann nur noch enge, erwartbare Fehler behandeln
+        if not callable(getattr(strategy, 'analyze', None)):
+            raise TypeError(f"Strategy {type(strategy).__name__} hat keine analyze-Methode")
+        if not getattr(strategy, 'name', None):
+            raise ValueError("Strategy benötigt einen nicht-leeren Namen")
+
         self.strategies[strategy.name] = strategy
         logger.info(f"Strategy added: {strategy.name}")
     
-    def process_market_data(self, symbol: str, market_data: MarketData, 
-                           indicators: TechnicalIndicators, 
-                           news: Optional[NewsAnalysis] = None) -> None:
+    def process_market_data(self, symbol: str, market_data: MarketData,
+                           indicators: TechnicalIndicators,
+                           news: Optional[NewsAnalysis] = None,
+                           now: Optional[datetime] = None) -> None:
         """
         Verarbeitet Marktdaten für alle Strategien.
-        
+
         Args:
             symbol: Trading Symbol (z.B. 'BTC')
             market_data: Aktuelle Marktdaten
             indicators: Technische Indikatoren
             news: Optional News-Analyse
+            now: Bar-Zeitstempel; Default ist market_data.timestamp. Die
+                Wanduhr wird im Hot-Path bewusst nicht befragt — im Backtest
+                ist die Bar-Zeit auch die korrekte Handelszeit.
         """
         current_price = market_data.price
-        
+        now = now or market_data.timestamp
+        self._last_prices[symbol] = current_price
+
         # 1. Update bestehende Positionen
-        self._update_positions(symbol, current_price)
-        
-        # 2. Führe Strategien aus
+        self._update_positions(symbol, current_price, now)
+
+        # 2. Führe Strategien aus. Nur enge, erwartbare Daten-Fehler werden
+        # abgefangen — Strukturfehler fliegen schon bei add_strategy, echte
+        # Programmierfehler (RuntimeError etc.) sollen durchschlagen statt
+        # den Frame mit einem breiten except Exception zu deoptimieren.
         for strategy_name, strategy in self.strategies.items():
             try:
                 decision = strategy.analyze(symbol, market_data, indicators, news)
-                self._process_trading_decision(symbol, strategy_name, decision, current_price)
-            except Exception as e:
+                self._process_trading_decision(symbol, strategy_name, decision, current_price, now)
+            except (ValueError, KeyError) as e:
                 logger.error(f"Strategy {strategy_name} error: {e}")
-        
+
         # 3. Update Portfolio-Wert
-        self._update_portfolio_value()
-        
+        self._update_portfolio_value(now)
+
         # 4. Risk Management
-        self._apply_risk_management()
+        self._apply_risk_management(now)
     
-    def _update_positions(self, symbol: str, current_price: float) -> None:
-        """Updated alle Positionen für ein Symbol."""
-        positions_to_close = []
-        
-        for pos_id, position in self.positions.items():
-            if position.symbol == symbol:
-                # Stop-Loss Check
-                if position.stop_loss and current_price <= position.stop_loss:
-                    self._close_position(pos_id, current_price, "Stop-Loss")
-                    positions_to_close.append(pos_id)
-                
-                # Take-Profit Check
-                elif position.take_profit and current_price >= position.take_profit:
-                    self._close_position(pos_id, current_price, "Take-Profit")
-                    positions_to_close.append(pos_id)
-        
-        # Entferne geschlossene Positionen
-        for pos_id in positions_to_close:
+    def process_bar(self, df_bar: pd.DataFrame,
+                    news: Optional[NewsAnalysis] = None,
+                    now: Optional[datetime] = None) -> None:
+        """
+        Verarbeitet einen kompletten Bar (alle Symbole) als Batch.
+
+        Statt process_market_data pro Symbol aufzurufen — und damit jede
+        Strategie N_symbole Mal einzeln zu dispatchen — bekommt jede
+        Strategie den ganzen Bar über analyze_batch auf einmal.
+
+        Args:
+            df_bar: DataFrame indexiert nach Symbol mit den Objekt-Spalten
+                market_data und indicators (eine Zeile pro Symbol)
+            news: Optional News-Analyse
+            now: Bar-Zeitstempel; Default ist der Timestamp des ersten Symbols
+        """
+        prices = {symbol: df_bar.at[symbol, 'market_data'].price
+                  for symbol in df_bar.index}
+        if now is None:
+            now = df_bar.iloc[0]['market_data'].timestamp
+        self._last_prices.update(prices)
+
+        # 1. Update bestehende Positionen
+        for symbol, price in prices.items():
+            self._update_positions(symbol, price, now)
+
+        # 2. Führe Strategien aus — ein Batch-Aufruf pro Strategie; wie im
+        # Einzel-Symbol-Pfad werden nur enge Daten-Fehler abgefangen
+        for strategy_name, strategy in self.strategies.items():
+            try:
+                decisions = strategy.analyze_batch(df_bar, news)
+            except (ValueError, KeyError) as e:
+                logger.error(f"Strategy {strategy_name} error: {e}")
+                continue
+
+            for symbol, row in decisions.iterrows():
+                decision = TradingDecision(
+                    signal=TradingSignal(int(row['signal'])),
+                    confidence=float(row['confidence']),
+                    reasoning=row['reasoning'],
+                    stop_loss=None if pd.isna(row['stop_loss']) else float(row['stop_loss']),
+                    take_profit=None if pd.isna(row['take_profit']) else float(row['take_profit']),
+                    position_size=float(row['position_size'])
+                )
+                self._process_trading_decision(symbol, strategy_name, decision,
+                                               prices[symbol], now)
+
+        # 3. Update Portfolio-Wert
+        self._update_portfolio_value(now)
+
+        # 4. Risk Management
+        self._apply_risk_management(now)
+
+    _ACTION_LABELS = ('BUY', 'SELL')
+    _REASON_LABELS = ('', 'Stop-Loss', 'Take-Profit', 'Strategy Signal')
+
+    def _intern(self, text: str) -> int:
+        """Interniert einen String und liefert seinen int32-Code."""
+        code = self._interned.get(text)
+        if code is None:
+            code = len(self._interned_rev)
+            self._interned[text] = code
+            self._interned_rev.append(text)
+        return code
+
+    def _append_trade(self, timestamp: datetime, symbol: str, strategy: str,
+                      action: int, price: float, quantity: float, value: float,
+                      pnl: float, reason: str, hold_duration: int) -> None:
+        """Schreibt einen Trade positionsweise in die Spalten-Puffer (amortisiert O(1))."""
+        if self._trade_n == self._trade_cap:
+            self._trade_cap *= 2
+            for key, arr in self._trade_buf.items():
+                grown = np.empty(self._trade_cap, dtype=arr.dtype)
+                grown[:self._trade_n] = arr
+                self._trade_buf[key] = grown
+
+        i = self._trade_n
+        buf = self._trade_buf
+        buf['timestamp'][i] = timestamp
+        buf['symbol'][i] = self._intern(symbol)
+        buf['strategy'][i] = self._intern(strategy)
+        buf['action'][i] = action
+        buf['price'][i] = price
+        buf['quantity'][i] = quantity
+        buf['value'][i] = value
+        buf['pnl'][i] = pnl
+        buf['reason'][i] = self._intern(reason)
+        buf['hold_duration'][i] = hold_duration
+        self._trade_n += 1
+
+    def trade_history_df(self) -> pd.DataFrame:
+        """Materialisiert die spaltenbasierte Trade-Historie als DataFrame."""
+        n = self._trade_n
+        buf = self._trade_buf
+        labels = np.array(self._interned_rev or [''], dtype=object)
+        actions = np.array(self._ACTION_LABELS, dtype=object)
+
+        return pd.DataFrame({
+            'symbol': labels[buf['symbol'][:n]],
+            'strategy': labels[buf['strategy'][:n]],
+            'action': actions[buf['action'][:n]],
+            'price': buf['price'][:n],
+            'quantity': buf['quantity'][:n],
+            'value': buf['value'][:n],
+            'pnl': buf['pnl'][:n],
+            'reason': labels[buf['reason'][:n]],
+            'hold_duration': buf['hold_duration'][:n],
+        }, index=pd.DatetimeIndex(buf['timestamp'][:n], name='timestamp'))
+
+    @property
+    def trade_history(self) -> List[Dict]:
+        """Kompatibilitäts-Sicht: Trades als Liste von Dicts (nur für Reports)."""
+        return self.trade_history_df().reset_index().to_dict('records')
+
+    @property
+    def balance_history(self) -> List[Dict]:
+        """Kompatibilitäts-Sicht: Balance-Snapshots als Liste von Dicts."""
+        n = self._balance_n
+        buf = self._balance_buf
+        timestamps = buf['timestamp'][:n].tolist()
+        return [
+            {
+                'timestamp': timestamps[i],
+                'total_balance': float(buf['total_balance'][i]),
+                'cash': float(buf['cash'][i]),
+                'positions_value': float(buf['positions_value'][i]),
+                'positions_count': int(buf['positions_count'][i]),
+            }
+            for i in range(n)
+        ]
+
+    def _symbol_code(self, symbol: str) -> int:
+        """Liefert den Integer-Code eines Symbols (interniert bei Erstkontakt)."""
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            code = len(self._symbol_codes)
+            self._symbol_codes[symbol] = code
+        return code
+
+    def _update_positions(self, symbol: str, current_price: float, now: datetime) -> None:
+        """Prüft Stop-Loss/Take-Profit für alle Positionen eines Symbols vektorisiert."""
+        code = self._symbol_codes.get(symbol)
+        if code is None:
+            return
+
+        mask = self._pos_active & (self._pos_sym == code)
+        if not mask.any():
+            return
+
+        # Branchenlose Checks über das ganze Positions-Buch; Stop-Loss hat
+        # Vorrang vor Take-Profit (wie zuvor im elif). Die Gründe werden als
+        # gepackte uint8-Codes berechnet (0=keiner, 1=SL, 2=TP, 3=Signal)
+        # und erst beim tatsächlichen Schließen in Strings aufgelöst.
+        hit_sl = mask & (current_price <= self._pos_sl)
+        hit_tp = mask & (current_price >= self._pos_tp)
+        reason_codes = np.where(hit_sl, 1, np.where(hit_tp, 2, 0)).astype(np.uint8)
+
+        for slot in np.flatnonzero(reason_codes):
+            pos_id = self._slot_ids[slot]
+            self._close_position(pos_id, current_price,
+                                 self._REASON_LABELS[reason_codes[slot]], now)
             del self.positions[pos_id]
     
-    def _process_trading_decision(self, symbol: str, strategy_name: str, 
-                                 decision: TradingDecision, current_price: float) -> None:
+    def _process_trading_decision(self, symbol: str, strategy_name: str,
+                                 decision: TradingDecision, current_price: float,
+                                 now: datetime) -> None:
         """Verarbeitet eine Trading-Entscheidung."""
-        
+
         if decision.signal == TradingSignal.BUY:
-            self._open_long_position(symbol, strategy_name, decision, current_price)
-        
+            self._open_long_position(symbol, strategy_name, decision, current_price, now)
+
         elif decision.signal == TradingSignal.SELL:
-            self._close_positions_for_symbol(symbol, current_price, "Strategy Signal")
-        
+            self._close_positions_for_symbol(symbol, current_price, "Strategy Signal", now)
+
         elif decision.signal == TradingSignal.STRONG_BUY:
             # Größere Position bei starkem Signal
             enhanced_decision = TradingDecision(
@@ -156,16 +388,18 @@ class PortfolioSimulator:
                 take_profit=decision.take_profit,
                 position_size=min(decision.position_size * 1.5, 0.10)  # Max 10%
             )
-            self._open_long_position(symbol, strategy_name, enhanced_decision, current_price)
-    
-    def _open_long_position(self, symbol: str, strategy_name: str, 
-                           decision: TradingDecision, current_price: float) -> None:
+            self._open_long_position(symbol, strategy_name, enhanced_decision, current_price, now)
+
+    def _open_long_position(self, symbol: str, strategy_name: str,
+                           decision: TradingDecision, current_price: float,
+                           now: datetime) -> None:
         """Öffnet eine Long-Position."""
         
         # Prüfe ob bereits Position für dieses Symbol/Strategie existiert
         existing_pos = self._get_position(symbol, strategy_name)
         if existing_pos:
-            logger.info(f"Position already exists for {symbol} with {strategy_name}")
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(f"Position already exists for {symbol} with {strategy_name}")
             return
         
         # Prüfe maximale Anzahl Positionen
@@ -182,81 +416,113 @@ class PortfolioSimulator:
             logger.warning(f"Insufficient cash for position: ${position_value:,.2f} > ${self.cash:,.2f}")
             return
         
-        # Erstelle Position
-        position_id = f"{symbol}_{strategy_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+        # Erstelle Position — laufende Sequenznummer statt strftime-Formatierung
+        self._pos_seq += 1
+        position_id = f"{symbol}_{strategy_name}_{self._pos_seq}"
         position = SimulationPosition(
             symbol=symbol,
             strategy_name=strategy_name,
             entry_price=current_price,
             quantity=quantity,
-            entry_time=datetime.now(),
+            entry_time=now,
             stop_loss=decision.stop_loss,
             take_profit=decision.take_profit
         )
         
         self.positions[position_id] = position
         self.cash -= position_value
+        self._positions_value += position.current_value
+
+        # Belege einen freien SoA-Slot für die vektorisierte SL/TP-Prüfung
+        slot = int(np.flatnonzero(~self._pos_active)[0])
+        self._pos_qty[slot] = quantity
+        self._pos_entry[slot] = current_price
+        self._pos_sl[slot] = decision.stop_loss if decision.stop_loss is not None else np.nan
+        self._pos_tp[slot] = decision.take_profit if decision.take_profit is not None else np.nan
+        self._pos_sym[slot] = self._symbol_code(symbol)
+        self._pos_active[slot] = True
+        self._slot_ids[slot] = position_id
+        self._pos_slot[position_id] = slot
+
+        # Sekundär-Indizes pflegen
+        self._by_symbol.setdefault(symbol, set()).add(position_id)
+        self._by_symstrat[(symbol, strategy_name)] = position_id
         
         # Log Trade
-        self.trade_history.append({
-            'timestamp': datetime.now(),
-            'symbol': symbol,
-            'strategy': strategy_name,
-            'action': 'BUY',
-            'price': current_price,
-            'quantity': quantity,
-            'value': position_value,
-            'reasoning': decision.reasoning
-        })
-        
-        logger.info(f"Opened position: {symbol} @ ${current_price:.2f} (${position_value:,.2f})")
+        self._append_trade(
+            timestamp=now,
+            symbol=symbol,
+            strategy=strategy_name,
+            action=0,
+            price=current_price,
+            quantity=quantity,
+            value=position_value,
+            pnl=np.nan,
+            reason=decision.reasoning,
+            hold_duration=-1
+        )
+
+        # Guard, damit der f-String bei gefiltertem Level gar nicht erst
+        # formatiert wird (der Logger-Wrapper sanitisiert fertige Strings,
+        # daher keine %-Lazy-Argumente möglich)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Opened position: {symbol} @ ${current_price:.2f} (${position_value:,.2f})")
     
-    def _close_position(self, position_id: str, current_price: float, reason: str) -> None:
+    def _close_position(self, position_id: str, current_price: float, reason: str,
+                        now: datetime) -> None:
         """Schließt eine Position."""
         position = self.positions[position_id]
         close_value = position.quantity * current_price
         pnl = position.calculate_pnl(current_price)
-        
+
         self.cash += close_value
+        self._positions_value -= position.current_value
+
+        # Gib den SoA-Slot wieder frei
+        slot = self._pos_slot.pop(position_id, None)
+        if slot is not None:
+            self._pos_active[slot] = False
+            self._slot_ids[slot] = None
+
+        # Sekundär-Indizes aufräumen
+        symbol_ids = self._by_symbol.get(position.symbol)
+        if symbol_ids is not None:
+            symbol_ids.discard(position_id)
+        self._by_symstrat.pop((position.symbol, position.strategy_name), None)
         
         # Log Trade
-        self.trade_history.append({
-            'timestamp': datetime.now(),
-            'symbol': position.symbol,
-            'strategy': position.strategy_name,
-            'action': 'SELL',
-            'price': current_price,
-            'quantity': position.quantity,
-            'value': close_value,
-            'pnl': pnl,
-            'reason': reason,
-            'hold_duration': (datetime.now() - position.entry_time).days
-        })
+        self._append_trade(
+            timestamp=now,
+            symbol=position.symbol,
+            strategy=position.strategy_name,
+            action=1,
+            price=current_price,
+            quantity=position.quantity,
+            value=close_value,
+            pnl=pnl,
+            reason=reason,
+            hold_duration=(now - position.entry_time).days
+        )
         
-        logger.info(f"Closed position: {position.symbol} @ ${current_price:.2f} "
-                   f"PnL: ${pnl:+.2f} ({reason})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Closed position: {position.symbol} @ ${current_price:.2f} "
+                        f"PnL: ${pnl:+.2f} ({reason})")
     
-    def _close_positions_for_symbol(self, symbol: str, current_price: float, reason: str) -> None:
-        """Schließt alle Positionen für ein Symbol."""
-        positions_to_close = [
-            pos_id for pos_id, pos in self.positions.items() 
-            if pos.symbol == symbol
-        ]
-        
-        for pos_id in positions_to_close:
-            self._close_position(pos_id, current_price, reason)
+    def _close_positions_for_symbol(self, symbol: str, current_price: float, reason: str,
+                                    now: datetime) -> None:
+        """Schließt alle Positionen für ein Symbol (O(1)-Lookup über Symbol-Index)."""
+        for pos_id in list(self._by_symbol.get(symbol, ())):
+            self._close_position(pos_id, current_price, reason, now)
             del self.positions[pos_id]
-    
+
     def _get_position(self, symbol: str, strategy_name: str) -> Optional[SimulationPosition]:
-        """Sucht nach bestehender Position."""
-        for position in self.positions.values():
-            if position.symbol == symbol and position.strategy_name == strategy_name:
-                return position
-        return None
+        """Sucht nach bestehender Position über den (Symbol, Strategie)-Index."""
+        pos_id = self._by_symstrat.get((symbol, strategy_name))
+        return self.positions.get(pos_id) if pos_id is not None else None
     
-    def _update_portfolio_value(self) -> None:
-        """Updated den Gesamt-Portfolio-Wert."""
-        positions_value = sum(pos.current_value for pos in self.positions.values())
+    def _update_portfolio_value(self, now: datetime) -> None:
+        """Updated den Gesamt-Portfolio-Wert (O(1) über den laufenden Positions-Wert)."""
+        positions_value = self._positions_value
         self.current_balance = self.cash + positions_value
         
         # Update Peak und Drawdown
@@ -267,34 +533,170 @@ class PortfolioSimulator:
         if current_drawdown > self.max_drawdown:
             self.max_drawdown = current_drawdown
         
-        # Speichere Balance History
-        self.balance_history.append({
-            'timestamp': datetime.now(),
-            'total_balance': self.current_balance,
-            'cash': self.cash,
-            'positions_value': positions_value,
-            'positions_count': len(self.positions)
-        })
+        # Balance-Historie auf Tagesauflösung verdichten: pro Kalendertag wird
+        # nur der letzte Snapshot gehalten. Minuten-Bars würden sonst die
+        # Historie aufblähen und die Daily-Returns/Sharpe-Berechnung verfälschen.
+        # Der Snapshot ist ein positionsweiser Schreibzugriff in die
+        # Spalten-Puffer — kein Dict mit fünf String-Keys pro Bar mehr.
+        if self._last_day == now.date():
+            i = self._balance_n - 1
+        else:
+            if self._balance_n == self._balance_cap:
+                self._balance_cap *= 2
+                for key, arr in self._balance_buf.items():
+                    grown = np.empty(self._balance_cap, dtype=arr.dtype)
+                    grown[:self._balance_n] = arr
+                    self._balance_buf[key] = grown
+            i = self._balance_n
+            self._balance_n += 1
+            self._last_day = now.date()
+
+        buf = self._balance_buf
+        buf['timestamp'][i] = now
+        buf['total_balance'][i] = self.current_balance
+        buf['cash'][i] = self.cash
+        buf['positions_value'][i] = positions_value
+        buf['positions_count'][i] = len(self.positions)
     
-    def _apply_risk_management(self) -> None:
+    def _apply_risk_management(self, now: datetime) -> None:
         """Wendet Risk Management Regeln an."""
-        
-        # Max Drawdown Protection
-        if self.max_drawdown > 0.15:  # 15% Max Drawdown
-            logger.warning(f"Max drawdown exceeded: {self.max_drawdown:.1%}")
-            # Schließe alle Positionen bei zu hohem Drawdown
-            for pos_id in list(self.positions.keys()):
-                position = self.positions[pos_id]
-                # Aktuelle Preise müssten hier übergeben werden
-                # Vereinfacht: Schließe mit Entry-Preis
-                self._close_position(pos_id, position.entry_price, "Risk Management")
-                del self.positions[pos_id]
+
+        # Max Drawdown Protection — der Normalfall (kein Bruch) kehrt sofort
+        # zurück, ohne die Positions-Keys zu kopieren oder zu iterieren
+        if self.max_drawdown <= 0.15:  # 15% Max Drawdown
+            return
+
+        logger.warning(f"Max drawdown exceeded: {self.max_drawdown:.1%}")
+        # Schließe alle Positionen zum zuletzt gesehenen Marktpreis — der
+        # Entry-Preis würde den PnL der Notbremse systematisch auf 0 setzen
+        for pos_id in list(self.positions.keys()):
+            position = self.positions[pos_id]
+            close_price = self._last_prices.get(position.symbol, position.entry_price)
+            self._close_position(pos_id, close_price, "Risk Management", now)
+            del self.positions[pos_id]
     
+    def run_vectorized_backtest(self, prices: np.ndarray, signals: np.ndarray,
+                                stop_loss: Optional[np.ndarray] = None,
+                                take_profit: Optional[np.ndarray] = None,
+                                position_size: float = 0.05) -> Dict[str, Any]:
+        """
+        Führt einen kompletten Backtest als einzelnen Kernel-Aufruf aus.
+
+        Für vorab berechnete Signal-Matrizen (z.B. aus vektorisierten
+        Strategien) läuft der gesamte Bar-Loop in _kernel.run_kernel —
+        mit numba JIT-kompiliert, sonst als funktional identischer
+        Python/NumPy-Fallback — statt Bar für Bar durch
+        process_market_data.
+
+        Args:
+            prices: (T, S)-Preismatrix (Bars x Symbole)
+            signals: (T, S)-Signalmatrix (1=BUY, -1=SELL, 0=HOLD)
+            stop_loss: optionale (T, S)-SL-Matrix (NaN = nicht gesetzt)
+            take_profit: optionale (T, S)-TP-Matrix (NaN = nicht gesetzt)
+            position_size: Equity-Anteil pro neuer Position
+
+        Returns:
+            Dict mit Balance-Kurve, Trade-Matrix und Kennzahlen
+        """
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        if stop_loss is None:
+            stop_loss = np.full(prices.shape, np.nan)
+        if take_profit is None:
+            take_profit = np.full(prices.shape, np.nan)
+
+        trades, balance, max_dd = run_kernel(
+            prices,
+            np.ascontiguousarray(signals, dtype=np.int8),
+            np.ascontiguousarray(stop_loss, dtype=np.float64),
+            np.ascontiguousarray(take_profit, dtype=np.float64),
+            position_size, self.initial_balance, self.max_positions
+        )
+
+        pnl = trades[trades[:, 2] == 1.0, 5]
+        daily_returns = np.diff(balance) / balance[:-1] if balance.size > 1 else np.zeros(0)
+
+        return {
+            'final_balance': float(balance[-1]) if balance.size else self.initial_balance,
+            'total_return': float(balance[-1] / self.initial_balance - 1.0) if balance.size else 0.0,
+            'max_drawdown': float(max_dd),
+            'sharpe_ratio': self._calculate_sharpe_ratio(daily_returns),
+            'total_trades': int(trades.shape[0]),
+            'winning_trades': int(np.sum(pnl > 0)),
+            'losing_trades': int(np.sum(pnl < 0)),
+            'balance': balance,
+            'trades': trades,
+        }
+
+    def run_parameter_sweep(self, param_grid: Dict[str, List[Any]],
+                            prices: np.ndarray, signals: np.ndarray,
+                            stop_loss: Optional[np.ndarray] = None,
+                            take_profit: Optional[np.ndarray] = None) -> Dict[str, Dict[str, Any]]:
+        """
+        Testet mehrere Parameter-Kombinationen parallel über Prozesse.
+
+        Backtests sind entlang der Zeitachse sequentiell, über Parameter-
+        Kombinationen aber perfekt parallel. Die (T, S)-Matrizen werden
+        einmal in multiprocessing.shared_memory-Blöcke kopiert; die Worker
+        hängen sich per np.ndarray(buffer=shm.buf) daran und bekommen nur
+        noch die kleinen Parameter-Dicts gepickelt — nicht die Bar-Daten.
+        Jeder Worker rechnet mit einem frischen PortfolioSimulator über
+        run_vectorized_backtest.
+
+        Args:
+            param_grid: z.B. {'position_size': [0.02, 0.05], 'max_positions': [5, 10]}
+            prices: (T, S)-Preismatrix (Bars x Symbole)
+            signals: (T, S)-Signalmatrix (1=BUY, -1=SELL, 0=HOLD)
+            stop_loss: optionale (T, S)-SL-Matrix (NaN = nicht gesetzt)
+            take_profit: optionale (T, S)-TP-Matrix (NaN = nicht gesetzt)
+
+        Returns:
+            Dict: Parameter-Beschreibung -> Kennzahlen-Dict des Laufs
+        """
+        keys = list(param_grid.keys())
+        combos = [dict(zip(keys, values))
+                  for values in itertools.product(*param_grid.values())]
+        if not combos:
+            return {}
+
+        prices = np.ascontiguousarray(prices, dtype=np.float64)
+        signals = np.ascontiguousarray(signals, dtype=np.int8)
+        if stop_loss is None:
+            stop_loss = np.full(prices.shape, np.nan)
+        if take_profit is None:
+            take_profit = np.full(prices.shape, np.nan)
+        stop_loss = np.ascontiguousarray(stop_loss, dtype=np.float64)
+        take_profit = np.ascontiguousarray(take_profit, dtype=np.float64)
+
+        blocks = []
+        try:
+            for arr in (prices, signals, stop_loss, take_profit):
+                shm = shared_memory.SharedMemory(create=True, size=arr.nbytes)
+                np.ndarray(arr.shape, dtype=arr.dtype, buffer=shm.buf)[:] = arr
+                blocks.append(shm)
+
+            workers = min(os.cpu_count() or 1, len(combos))
+            initargs = (prices.shape, tuple(b.name for b in blocks),
+                        self.initial_balance, self.max_positions)
+            with ProcessPoolExecutor(max_workers=workers,
+                                     initializer=_init_sweep_worker,
+                                     initargs=initargs) as executor:
+                results = list(executor.map(_run_sweep_combo, combos))
+        finally:
+            for shm in blocks:
+                shm.close()
+                shm.unlink()
+
+        return {
+            ', '.join(f'{key}={value}' for key, value in combo.items()): result
+            for combo, result in zip(combos, results)
+        }
+
     def get_performance_summary(self) -> SimulationResult:
         """Erstellt eine Performance-Zusammenfassung."""
-        total_trades = len(self.trade_history)
-        winning_trades = len([t for t in self.trade_history if t.get('pnl', 0) > 0])
-        losing_trades = len([t for t in self.trade_history if t.get('pnl', 0) < 0])
+        total_trades = self._trade_n
+        pnl = self._trade_buf['pnl'][:self._trade_n]
+        winning_trades = int(np.sum(pnl > 0))
+        losing_trades = int(np.sum(pnl < 0))
         
         win_rate = winning_trades / total_trades if total_trades > 0 else 0.0
         total_return = (self.current_balance - self.initial_balance) / self.initial_balance
@@ -320,47 +722,65 @@ class PortfolioSimulator:
         )
     
     def _calculate_daily_returns(self) -> List[float]:
-        """Berechnet tägliche Returns."""
-        if len(self.balance_history) < 2:
+        """Berechnet tägliche Returns vektorisiert aus der Balance-Historie."""
+        if self._balance_n < 2:
             return [0.0]
-        
-        daily_returns = []
-        for i in range(1, len(self.balance_history)):
-            prev_balance = self.balance_history[i-1]['total_balance']
-            curr_balance = self.balance_history[i]['total_balance']
-            daily_return = (curr_balance - prev_balance) / prev_balance
-            daily_returns.append(daily_return)
-        
-        return daily_returns
-    
+
+        balances = self._balance_buf['total_balance'][:self._balance_n]
+        returns = np.diff(balances) / balances[:-1]
+        return returns.tolist()
+
     def _calculate_sharpe_ratio(self, daily_returns: List[float]) -> float:
-        """Berechnet Sharpe Ratio (vereinfacht)."""
-        if not daily_returns:
-            return 0.0
-        
-        avg_return = sum(daily_returns) / len(daily_returns)
-        if avg_return == 0:
+        """Berechnet Sharpe Ratio (vereinfacht, annualisiert über 252 Handelstage)."""
+        returns = np.asarray(daily_returns, dtype=np.float64)
+        if returns.size == 0:
             return 0.0
-        
-        variance = sum((r - avg_return) ** 2 for r in daily_returns) / len(daily_returns)
-        std_dev = variance ** 0.5
-        
-        if std_dev == 0:
+
+        avg_return = returns.mean()
+        std_dev = returns.std()
+        if avg_return == 0 or std_dev == 0:
             return 0.0
-        
-        # Annualisierte Sharpe Ratio (252 Trading-Tage)
-        return (avg_return * 252) / (std_dev * (252 ** 0.5))
+
+        return float((avg_return * 252) / (std_dev * np.sqrt(252)))
     
-    def get_current_status(self) -> Dict[str, Any]:
-        """Gibt aktuellen Portfolio-Status zurück."""
+    def get_current_status(self, current_prices: Optional[Dict[str, float]] = None) -> Dict[str, Any]:
+        """
+        Gibt aktuellen Portfolio-Status zurück.
+
+        Args:
+            current_prices: Optionale aktuelle Preise pro Symbol; ohne
+                Angabe werden die zuletzt im Bar-Loop gesehenen Preise
+                verwendet. Der unrealisierte PnL wird damit korrekt gegen
+                den Marktpreis gerechnet (statt wie früher immer 0 gegen
+                den Entry-Preis) — vektorisiert über alle Positionen.
+        """
+        # Invariante: der laufende Wert muss der Summe der offenen Positionen
+        # entsprechen — hier (außerhalb des Hot-Path) einmal nachgerechnet
         positions_value = sum(pos.current_value for pos in self.positions.values())
-        
+        assert abs(positions_value - self._positions_value) < 1e-6, \
+            "Laufender Positions-Wert ist aus dem Takt"
+
+        prices_map = current_prices if current_prices is not None else self._last_prices
+        position_list = list(self.positions.values())
+        count = len(position_list)
+        if count:
+            entry = np.fromiter((pos.entry_price for pos in position_list),
+                                dtype=np.float64, count=count)
+            qty = np.fromiter((pos.quantity for pos in position_list),
+                              dtype=np.float64, count=count)
+            price = np.fromiter((prices_map.get(pos.symbol, pos.entry_price)
+                                 for pos in position_list),
+                                dtype=np.float64, count=count)
+            unrealized_pnl = (price - entry) * qty
+        else:
+            unrealized_pnl = np.zeros(0)
+
         return {
             'timestamp': datetime.now(),
             'total_balance': self.current_balance,
             'cash': self.cash,
             'positions_value': positions_value,
-            'positions_count': len(self.positions),
+            'positions_count': count,
             'total_return': (self.current_balance - self.initial_balance) / self.initial_balance,
             'max_drawdown': self.max_drawdown,
             'active_strategies': list(self.strategies.keys()),
@@ -371,9 +791,48 @@ class PortfolioSimulator:
                     'entry_price': pos.entry_price,
                     'quantity': pos.quantity,
                     'current_value': pos.current_value,
-                    'unrealized_pnl': pos.calculate_pnl(pos.entry_price),  # Würde aktuellen Preis benötigen
+                    'unrealized_pnl': float(unrealized_pnl[i]),
                     'entry_time': pos.entry_time
                 }
-                for pos in self.positions.values()
+                for i, pos in enumerate(position_list)
             ]
         }
+
+# --- Worker-Seite des Parameter-Sweeps -------------------------------------
+# Die Funktionen müssen auf Modul-Ebene liegen, damit sie picklebar sind.
+# _SWEEP_CONTEXT wird pro Worker-Prozess einmal im Initializer gefüllt;
+# die Shared-Memory-Blöcke bleiben dort referenziert, damit die ndarray-
+# Sichten über die Lebensdauer des Workers gültig bleiben.
+
+_SWEEP_CONTEXT: Optional[tuple] = None
+
+def _init_sweep_worker(shape: tuple, block_names: tuple,
+                       initial_balance: float, max_positions: int) -> None:
+    """Hängt den Worker an die Shared-Memory-Blöcke des Parents."""
+    global _SWEEP_CONTEXT
+    blocks = [shared_memory.SharedMemory(name=name) for name in block_names]
+    prices = np.ndarray(shape, dtype=np.float64, buffer=blocks[0].buf)
+    signals = np.ndarray(shape, dtype=np.int8, buffer=blocks[1].buf)
+    stop_loss = np.ndarray(shape, dtype=np.float64, buffer=blocks[2].buf)
+    take_profit = np.ndarray(shape, dtype=np.float64, buffer=blocks[3].buf)
+    _SWEEP_CONTEXT = (blocks, prices, signals, stop_loss, take_profit,
+                      initial_balance, max_positions)
+
+def _run_sweep_combo(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Worker: ein frischer Simulator gegen die geteilten Bar-Daten."""
+    _, prices, signals, stop_loss, take_profit, initial_balance, max_positions = _SWEEP_CONTEXT
+
+    simulator = PortfolioSimulator(
+        initial_balance=params.get('initial_balance', initial_balance),
+        max_positions=params.get('max_positions', max_positions)
+    )
+    result = simulator.run_vectorized_backtest(
+        prices, signals, stop_loss, take_profit,
+        position_size=params.get('position_size', 0.05)
+    )
+
+    # Nur die Kennzahlen zurückpicklen, nicht Balance-Kurve und Trade-Matrix
+    result.pop('balance')
+    result.pop('trades')
+    result['params'] = params
+    return result
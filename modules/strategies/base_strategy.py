@@ -6,10 +6,14 @@ gemeinsame Funktionalitäten zur Verfügung.
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, List, Any, Optional, Union
+from typing import Dict, List, Any, Optional, Tuple, Union
 from dataclasses import dataclass, field
 from datetime import datetime
 import json
+import logging
+
+import numpy as np
+import pandas as pd
 
 # Import unserer Datenmodelle
 from ..data_models import (
@@ -31,7 +35,7 @@ class StrategyMetrics:
     profit_factor: float = 0.0
     last_updated: datetime = field(default_factory=datetime.now)
 
-@dataclass 
+@dataclass(slots=True)
 class StrategyPosition:
     """Eine offene Position einer Strategie."""
     symbol: str
@@ -41,11 +45,13 @@ class StrategyPosition:
     stop_loss: Optional[float] = None
     take_profit: Optional[float] = None
     reasoning: str = ""
-    
-    @property
-    def current_value(self) -> float:
-        return self.quantity * self.entry_price
-    
+    # Einmalig bei Eröffnung berechnet — quantity/entry_price ändern sich
+    # nach dem Entry nicht mehr, damit entfällt der Property-Aufruf pro Bar
+    current_value: float = field(init=False, default=0.0)
+
+    def __post_init__(self):
+        self.current_value = self.quantity * self.entry_price
+
     def calculate_pnl(self, current_price: float) -> float:
         """Berechnet unrealisierten PnL."""
         return (current_price - self.entry_price) * self.quantity
@@ -56,7 +62,14 @@ class BaseStrategy(ABC):
     
     Jede Strategie muss diese Klasse erweitern und die abstrakten Methoden implementieren.
     """
-    
+
+    # Opt-in für den Vektor-Pfad des Backtesters: Strategien, die ihre
+    # Entry-/Exit-Signale als Boolean-Arrays über die ganze Historie
+    # berechnen können, setzen dieses Flag und implementieren
+    # vectorized_signals — der Backtester ruft analyze dann nur noch an
+    # Signal-Bars auf statt an jedem Tick.
+    supports_vectorized: bool = False
+
     def __init__(self, name: str, config: Dict[str, Any]):
         self.name = name
         self.config = config
@@ -90,7 +103,60 @@ class BaseStrategy(ABC):
     def get_parameters(self) -> Dict[str, Any]:
         """Gibt die aktuellen Strategie-Parameter zurück."""
         pass
-    
+
+    def vectorized_signals(self, px: np.ndarray,
+                          indicators: Dict[str, np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Berechnet Entry-/Exit-Signale vektorisiert über die ganze Historie.
+
+        Optionaler Vektor-Pfad für Backtests: statt einem analyze-Aufruf
+        pro Tick liefert die Strategie zwei Boolean-Arrays parallel zur
+        Preisreihe. Nur relevant, wenn supports_vectorized True ist.
+
+        Args:
+            px: Preis-Array (float64)
+            indicators: vorberechnete Indikator-Spalten parallel zu px,
+                Keys wie die Feldnamen von TechnicalIndicators
+                (rsi, ma20, ma50, ma200, atr_percentage, ...)
+
+        Returns:
+            Tuple (entries, exits) als Boolean-Arrays
+        """
+        raise NotImplementedError(f"{self.name} does not support vectorized signals")
+
+    def analyze_batch(self, df_bar: pd.DataFrame,
+                      news: Optional[NewsAnalysis] = None) -> pd.DataFrame:
+        """
+        Analysiert alle Symbole eines Bars in einem Aufruf.
+
+        Default-Implementierung: ruft analyze pro Zeile auf und packt die
+        Entscheidungen in Spalten. Günstige Strategien überschreiben das
+        mit einer np.where-basierten Variante über die Indikator-Spalten,
+        sodass pro Bar ein vektorisierter Aufruf statt N_symbole
+        Python-Dispatches läuft.
+
+        Args:
+            df_bar: DataFrame indexiert nach Symbol mit den Objekt-Spalten
+                market_data und indicators (eine Zeile pro Symbol)
+            news: Optional News-Analyse (für alle Symbole gleich)
+
+        Returns:
+            DataFrame indexiert nach Symbol mit den Spalten signal
+            (int-Code), confidence, position_size, stop_loss, take_profit
+            und reasoning
+        """
+        rows = []
+        for symbol in df_bar.index:
+            decision = self.analyze(symbol, df_bar.at[symbol, 'market_data'],
+                                    df_bar.at[symbol, 'indicators'], news)
+            rows.append((int(decision.signal), decision.confidence,
+                         decision.position_size, decision.stop_loss,
+                         decision.take_profit, decision.reasoning))
+
+        return pd.DataFrame(rows, index=df_bar.index,
+                            columns=['signal', 'confidence', 'position_size',
+                                     'stop_loss', 'take_profit', 'reasoning'])
+
     def validate_signal(self, decision: TradingDecision, symbol: str) -> bool:
         """
         Validiert ein Handelssignal basierend auf Risikomanagement.
@@ -104,7 +170,8 @@ class BaseStrategy(ABC):
         """
         # Prüfe ob Strategie aktiviert ist
         if not self.is_enabled:
-            logger.debug(f"Strategy {self.name} is disabled")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Strategy {self.name} is disabled")
             return False
         
         # Prüfe Positions-Limit
@@ -116,7 +183,8 @@ class BaseStrategy(ABC):
         # Prüfe Mindest-Confidence
         min_confidence = self.config.get('min_confidence', 0.6)
         if decision.confidence < min_confidence:
-            logger.debug(f"Decision confidence {decision.confidence:.2f} below minimum {min_confidence}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(f"Decision confidence {decision.confidence:.2f} below minimum {min_confidence}")
             return False
         
         # Prüfe Position Size
@@ -169,8 +237,10 @@ class BaseStrategy(ABC):
                 position_size=1.0  # Close full position
             )
         
-        # Log Position Status
-        logger.debug(f"Position {symbol}: PnL {pnl_percentage:+.2f}%")
+        # Log Position Status — Guard, damit der f-String bei gefiltertem
+        # Level nicht pro Bar formatiert wird
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Position {symbol}: PnL {pnl_percentage:+.2f}%")
         
         return None
     
@@ -189,7 +259,8 @@ class BaseStrategy(ABC):
         )
         self.positions[symbol] = position
         
-        logger.info(f"Added position: {symbol} @ {price:.4f} (qty: {quantity:.4f})")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(f"Added position: {symbol} @ {price:.4f} (qty: {quantity:.4f})")
     
     def close_position(self, symbol: str) -> Optional[StrategyPosition]:
         """Schließt eine Position und gibt sie zurück."""
@@ -271,7 +342,7 @@ class TechnicalAnalysisHelpers:
     def is_high_volatility(indicators: TechnicalIndicators, threshold: float = 3.0) -> bool:
         """Prüft ob hohe Volatilität vorliegt."""
         return indicators.atr_percentage > threshold
-    
+
     @staticmethod
     def calculate_position_size(balance: float, risk_per_trade: float, 
                               entry_price: float, stop_loss: float) -> float:
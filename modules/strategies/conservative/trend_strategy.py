@@ -9,13 +9,89 @@ Implementiert eine konservative Trend-Following Strategie mit:
 """
 
 from typing import Dict, List, Optional, Any
-from datetime import datetime
 import logging
 
+import numpy as np
+import pandas as pd
+
 from ...data_models import MarketData, TechnicalIndicators, NewsAnalysis, TradingDecision, TradingSignal
 from ..base_strategy import BaseStrategy, StrategyPosition, StrategyMetrics
 from .config import CONSERVATIVE_CONFIG, CONSERVATIVE_PARAMS, validate_conservative_config
 
+# Bit-Layout für die Prädikat-Maske in _combine_signals. bit7 kodiert die
+# bärische Trendrichtung separat, weil bit0 allein neutral und bärisch
+# nicht unterscheiden kann (die SELL-Leiter prüft explizit auf 'bearish').
+_TREND_BULLISH = 1 << 0
+_MA_ALIGNED = 1 << 1
+_VOLATILITY_OK = 1 << 2
+_RSI_OVERSOLD = 1 << 3
+_RSI_OVERBOUGHT = 1 << 4
+_VOLUME_OK = 1 << 5
+_NEWS_OK = 1 << 6
+_TREND_BEARISH = 1 << 7
+
+
+def _build_signal_table() -> tuple:
+    """
+    Baut die Lookup-Tabelle (Signal, Confidence-Basis, Reasoning-Template)
+    für alle 256 Prädikat-Kombinationen einmal beim Modul-Import.
+    _combine_signals indexiert danach nur noch mit der Bitmaske statt die
+    if/elif-Leiter pro Aufruf zu durchlaufen; die trend-stärkeabhängige
+    BUY-Confidence und die Trend-Stärke im Reasoning werden beim Lookup
+    ergänzt.
+    """
+    table = []
+    for mask in range(256):
+        bullish = bool(mask & _TREND_BULLISH)
+        aligned = bool(mask & _MA_ALIGNED)
+        volatility_ok = bool(mask & _VOLATILITY_OK)
+        oversold = bool(mask & _RSI_OVERSOLD)
+        overbought = bool(mask & _RSI_OVERBOUGHT)
+        volume_ok = bool(mask & _VOLUME_OK)
+        news_ok = bool(mask & _NEWS_OK)
+        bearish = bool(mask & _TREND_BEARISH)
+
+        reasons = []
+        if (bullish and aligned and volatility_ok and not overbought and
+                volume_ok and news_ok):
+            signal = TradingSignal.BUY
+            confidence_base = 0.1 if oversold else 0.0
+            reasons = [
+                "Bullisher Trend (MA50 > MA200)",
+                "Trend-Stärke: {strength:.2%}",
+                "Niedrige Volatilität ✓",
+                "Volume-Bestätigung ✓",
+            ]
+            if oversold:
+                reasons.append("RSI überverkauft - gute Einstiegschance")
+        elif bearish or overbought or not volatility_ok or not news_ok:
+            signal = TradingSignal.SELL
+            confidence_base = 0.6
+            if bearish:
+                reasons.append("Bärischer Trend (MA50 < MA200)")
+            if overbought:
+                reasons.append("RSI überkauft")
+            if not volatility_ok:
+                reasons.append("Hohe Volatilität - Risiko")
+            if not news_ok:
+                reasons.append("Negative News - Risiko")
+        else:
+            signal = TradingSignal.HOLD
+            confidence_base = 0.0
+
+        table.append((signal, confidence_base,
+                      " | ".join(reasons) if reasons else "Keine klaren Signale"))
+    return tuple(table)
+
+
+_SIGNAL_TABLE = _build_signal_table()
+
+# Tabellen-Spalten als Arrays für den vektorisierten Lookup in analyze_batch
+_TABLE_SIGNAL = np.array([int(t[0]) for t in _SIGNAL_TABLE], dtype=np.int64)
+_TABLE_CONFIDENCE = np.array([t[1] for t in _SIGNAL_TABLE], dtype=np.float64)
+_TABLE_REASONING = np.array([t[2] for t in _SIGNAL_TABLE], dtype=object)
+
+
 class ConservativeTrendStrategy(BaseStrategy):
     """
     Conservative Trend Following Strategy.
@@ -84,11 +160,88 @@ class ConservativeTrendStrategy(BaseStrategy):
                 signal=TradingSignal.HOLD,
                 confidence=0.0,
                 reasoning=f"Analyse-Fehler: {str(e)}",
-                timestamp=datetime.now(),
                 stop_loss=None,
-                take_profit=None
+                take_profit=None,
+                position_size=0.0
             )
     
+    def analyze_batch(self, df_bar: pd.DataFrame,
+                      news: Optional[NewsAnalysis] = None) -> pd.DataFrame:
+        """
+        Vektorisierte Batch-Analyse über alle Symbole eines Bars.
+
+        Die Einzelprüfungen aus _analyze_trend, _check_volatility,
+        _analyze_rsi und _check_volume laufen hier als NumPy-Broadcasts
+        über die Indikator-Spalten statt als Python-Vergleiche pro
+        Symbol. Die Entscheidungslogik entspricht _combine_signals.
+        """
+        n = len(df_bar)
+        columns = ['signal', 'confidence', 'position_size',
+                   'stop_loss', 'take_profit', 'reasoning']
+        if n == 0:
+            return pd.DataFrame(columns=columns, index=df_bar.index)
+
+        cfg = self.conservative_config
+        inds = df_bar['indicators'].to_numpy()
+        mds = df_bar['market_data'].to_numpy()
+        ma50 = np.fromiter((i.ma50 for i in inds), np.float64, n)
+        ma200 = np.fromiter((i.ma200 for i in inds), np.float64, n)
+        rsi = np.fromiter((i.rsi for i in inds), np.float64, n)
+        atr_pct = np.fromiter((i.atr_percentage for i in inds), np.float64, n)
+        volume_ratio = np.fromiter((i.volume_ratio for i in inds), np.float64, n)
+        price = np.fromiter((md.price for md in mds), np.float64, n)
+
+        # Trend: Richtung, Stärke und MA-Alignment in einem Durchlauf
+        trend_strength = (ma50 - ma200) / ma200
+        bullish = ma50 > ma200 * (1.0 + cfg.min_trend_strength)
+        bearish = ma50 < ma200 * (1.0 - cfg.min_trend_strength)
+        ma_aligned = ma50 > ma200
+
+        # Filter
+        volatility_ok = atr_pct <= cfg.max_atr_percentage
+        oversold = rsi <= cfg.rsi_oversold
+        overbought = rsi >= cfg.rsi_overbought
+        volume_ok = volume_ratio >= cfg.min_volume_ratio
+        news_ok = self._analyze_news(news) if news else True
+
+        # Prädikat-Bitmaske pro Symbol, dann vektorisierter Tabellen-Lookup
+        # (gleiche _SIGNAL_TABLE wie im skalaren _combine_signals)
+        mask = (
+            bullish.astype(np.uint8)
+            | (ma_aligned.astype(np.uint8) << 1)
+            | (volatility_ok.astype(np.uint8) << 2)
+            | (oversold.astype(np.uint8) << 3)
+            | (overbought.astype(np.uint8) << 4)
+            | (volume_ok.astype(np.uint8) << 5)
+            | (np.uint8(news_ok) << 6)
+            | (bearish.astype(np.uint8) << 7)
+        )
+        signal = _TABLE_SIGNAL[mask]
+        confidence = _TABLE_CONFIDENCE[mask].copy()
+        reasoning = _TABLE_REASONING[mask]
+        buy = signal == int(TradingSignal.BUY)
+
+        # Trend-stärkeabhängige BUY-Anteile ergänzen (Confidence + Reasoning)
+        confidence[buy] += np.minimum(0.8, 0.4 + trend_strength[buy] * 2.0)
+        for i in np.flatnonzero(buy):
+            reasoning[i] = reasoning[i].format(strength=trend_strength[i])
+
+        stop_distance = price * 0.02 * cfg.stop_loss_atr_multiplier
+        position_size = np.where(buy, cfg.max_position_size, 0.0)
+        stop_loss = np.where(buy, price - stop_distance, np.nan)
+        take_profit = np.where(
+            buy, price + stop_distance * cfg.take_profit_ratio, np.nan
+        )
+
+        return pd.DataFrame({
+            'signal': signal,
+            'confidence': confidence,
+            'position_size': position_size,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'reasoning': reasoning,
+        }, index=df_bar.index, columns=columns)
+
     def _analyze_trend(self, indicators: TechnicalIndicators) -> Dict[str, any]:
         """Analysiert Trend basierend auf Moving Averages."""
         ma_50 = indicators.ma_50
@@ -150,63 +303,48 @@ class ConservativeTrendStrategy(BaseStrategy):
         
         return True
     
-    def _combine_signals(self, trend: Dict, volatility_ok: bool, rsi: str, 
+    def _combine_signals(self, trend: Dict, volatility_ok: bool, rsi: str,
                         volume_ok: bool, news_ok: bool, current_price: float) -> TradingDecision:
-        """Kombiniert alle Signale zu einer finalen Entscheidung."""
-        
-        reasons = []
-        confidence = 0.0
-        signal = TradingSignal.HOLD
-        
-        # Bullish Bedingungen
-        if (trend['direction'] == 'bullish' and 
-            trend['ma_alignment'] and
-            volatility_ok and 
-            rsi in ['oversold', 'neutral'] and
-            volume_ok and 
-            news_ok):
-            
-            signal = TradingSignal.BUY
-            confidence = min(0.8, 0.4 + trend['strength'] * 2)
-            reasons.extend([
-                f"Bullisher Trend (MA50 > MA200)",
-                f"Trend-Stärke: {trend['strength']:.2%}",
-                f"Niedrige Volatilität ✓",
-                f"Volume-Bestätigung ✓"
-            ])
-            
-            if rsi == 'oversold':
-                confidence += 0.1
-                reasons.append("RSI überverkauft - gute Einstiegschance")
-        
-        # Bearish/Exit Bedingungen
-        elif (trend['direction'] == 'bearish' or 
-              rsi == 'overbought' or 
-              not volatility_ok or
-              not news_ok):
-            
-            signal = TradingSignal.SELL
-            confidence = 0.6
-            
-            if trend['direction'] == 'bearish':
-                reasons.append("Bärischer Trend (MA50 < MA200)")
-            if rsi == 'overbought':
-                reasons.append("RSI überkauft")
-            if not volatility_ok:
-                reasons.append("Hohe Volatilität - Risiko")
-            if not news_ok:
-                reasons.append("Negative News - Risiko")
-        
+        """
+        Kombiniert alle Signale zu einer finalen Entscheidung.
+
+        Branchless: die Prädikate werden als Bitmaske kodiert und die
+        fertige (Signal, Confidence-Basis, Reasoning)-Kombination aus der
+        beim Import gebauten _SIGNAL_TABLE gelesen — keine if/elif-Leiter
+        und keine String-Konstruktion pro Aufruf. Nur die trend-stärke-
+        abhängigen BUY-Anteile werden ergänzt.
+        """
+        mask = (
+            (trend['direction'] == 'bullish')
+            | bool(trend['ma_alignment']) << 1
+            | volatility_ok << 2
+            | (rsi == 'oversold') << 3
+            | (rsi == 'overbought') << 4
+            | volume_ok << 5
+            | news_ok << 6
+            | (trend['direction'] == 'bearish') << 7
+        )
+        signal, confidence_base, reasoning = _SIGNAL_TABLE[mask]
+
+        if signal == TradingSignal.BUY:
+            confidence = min(0.8, 0.4 + trend['strength'] * 2) + confidence_base
+            reasoning = reasoning.format(strength=trend['strength'])
+        else:
+            confidence = confidence_base
+
         # Stop-Loss und Take-Profit berechnen
         stop_loss, take_profit = self._calculate_risk_levels(current_price, signal)
-        
+        position_size = (self.conservative_config.max_position_size
+                         if signal in (TradingSignal.BUY, TradingSignal.STRONG_BUY)
+                         else 0.0)
+
         return TradingDecision(
             signal=signal,
             confidence=confidence,
-            reasoning=" | ".join(reasons) if reasons else "Keine klaren Signale",
-            timestamp=datetime.now(),
+            reasoning=reasoning,
             stop_loss=stop_loss,
-            take_profit=take_profit
+            take_profit=take_profit,
+            position_size=position_size
         )
     
     def _calculate_risk_levels(self, current_price: float, signal: TradingSignal) -> tuple:
@@ -249,9 +387,9 @@ class ConservativeTrendStrategy(BaseStrategy):
                 signal=TradingSignal.SELL,
                 confidence=1.0,
                 reasoning="Stop-Loss ausgelöst",
-                timestamp=datetime.now(),
                 stop_loss=None,
-                take_profit=None
+                take_profit=None,
+                position_size=0.0
             )
         
         # Take-Profit Check
@@ -260,9 +398,9 @@ class ConservativeTrendStrategy(BaseStrategy):
                 signal=TradingSignal.SELL,
                 confidence=1.0,
                 reasoning="Take-Profit erreicht",
-                timestamp=datetime.now(),
                 stop_loss=None,
-                take_profit=None
+                take_profit=None,
+                position_size=0.0
             )
         
         # Trend-Reversal Check
@@ -272,9 +410,9 @@ class ConservativeTrendStrategy(BaseStrategy):
                 signal=TradingSignal.SELL,
                 confidence=0.8,
                 reasoning="Trend-Reversal: MA50 < MA200",
-                timestamp=datetime.now(),
                 stop_loss=None,
-                take_profit=None
+                take_profit=None,
+                position_size=0.0
             )
         
         return None  # Position halten
@@ -9,10 +9,74 @@ from typing import Dict, List, Optional, Any
 from datetime import datetime
 import logging
 
+import numpy as np
+import pandas as pd
+
 from ...data_models import MarketData, TechnicalIndicators, NewsAnalysis, TradingDecision, TradingSignal
 from ..base_strategy import BaseStrategy
 from .config import CONSERVATIVE_CONFIG, CONSERVATIVE_PARAMS
 
+# Bit-Layout für die Prädikat-Maske in _combine_signals
+_TREND_BULLISH = 1 << 0
+_VOLATILITY_OK = 1 << 1
+_RSI_OVERSOLD = 1 << 2
+_RSI_OVERBOUGHT = 1 << 3
+_NEWS_OK = 1 << 4
+
+
+def _build_signal_table() -> tuple:
+    """
+    Baut die Lookup-Tabelle (Signal, Confidence, Reasoning) für alle 32
+    Prädikat-Kombinationen einmal beim Modul-Import. _combine_signals
+    indexiert danach nur noch mit der Bitmaske statt die if/elif-Leiter
+    pro Aufruf zu durchlaufen.
+    """
+    table = []
+    for mask in range(32):
+        trend_bullish = bool(mask & _TREND_BULLISH)
+        volatility_ok = bool(mask & _VOLATILITY_OK)
+        oversold = bool(mask & _RSI_OVERSOLD)
+        overbought = bool(mask & _RSI_OVERBOUGHT)
+        news_ok = bool(mask & _NEWS_OK)
+
+        reasons = []
+        if trend_bullish and not overbought and volatility_ok and news_ok:
+            signal = TradingSignal.BUY
+            confidence = 0.8 if oversold else 0.7
+            reasons = [
+                "Bullish Trend (MA50 > MA200)",
+                "RSI oversold" if oversold else "RSI neutral",
+                "Low Volatility",
+                "Positive News",
+            ]
+        elif not trend_bullish or overbought or not volatility_ok or not news_ok:
+            signal = TradingSignal.SELL
+            confidence = 0.6
+            if not trend_bullish:
+                reasons.append("Bearish Trend")
+            if overbought:
+                reasons.append("RSI Overbought")
+            if not volatility_ok:
+                reasons.append("High Volatility")
+            if not news_ok:
+                reasons.append("Negative News")
+        else:
+            signal = TradingSignal.HOLD
+            confidence = 0.5
+            reasons.append("No clear signals")
+
+        table.append((signal, confidence, " | ".join(reasons)))
+    return tuple(table)
+
+
+_SIGNAL_TABLE = _build_signal_table()
+
+# Tabellen-Spalten als Arrays für den vektorisierten Lookup in analyze_batch
+_TABLE_SIGNAL = np.array([int(t[0]) for t in _SIGNAL_TABLE], dtype=np.int64)
+_TABLE_CONFIDENCE = np.array([t[1] for t in _SIGNAL_TABLE], dtype=np.float64)
+_TABLE_REASONING = np.array([t[2] for t in _SIGNAL_TABLE], dtype=object)
+
+
 class ConservativeTrendStrategy(BaseStrategy):
     """
     Vereinfachte Conservative Trend Following Strategy.
@@ -23,6 +87,8 @@ class ConservativeTrendStrategy(BaseStrategy):
     - Einfaches Risk Management
     """
     
+    supports_vectorized = True
+
     def __init__(self):
         super().__init__(
             name=CONSERVATIVE_PARAMS['name'],
@@ -30,6 +96,24 @@ class ConservativeTrendStrategy(BaseStrategy):
         )
         self.strategy_config = CONSERVATIVE_CONFIG
         logging.info(f"Conservative Strategy initialized: {self.name}")
+
+    def vectorized_signals(self, px: np.ndarray,
+                          indicators: Dict[str, np.ndarray]) -> tuple:
+        """
+        Entry-/Exit-Masken für den Backtester über die ganze Serie.
+
+        Entspricht analyze ohne News (news_ok=True): Entry, wenn Trend
+        bullish, RSI nicht überkauft und Volatilität akzeptabel ist;
+        Exit ist das Komplement (die BUY-/SELL-Bedingungen in
+        _combine_signals decken zusammen alle Fälle ab).
+        """
+        ma50 = indicators['ma50']
+        ma200 = indicators['ma200']
+        rsi = indicators['rsi']
+        atr_pct = indicators['atr_percentage']
+
+        entries = (ma50 > ma200 * 1.01) & (rsi < 70.0) & (atr_pct <= 3.0)
+        return entries, ~entries
     
     def analyze(self, symbol: str, market_data: MarketData, 
                indicators: TechnicalIndicators, 
@@ -78,6 +162,71 @@ class ConservativeTrendStrategy(BaseStrategy):
                 position_size=0.0
             )
     
+    def analyze_batch(self, df_bar: pd.DataFrame,
+                      news: Optional[NewsAnalysis] = None) -> pd.DataFrame:
+        """
+        Vektorisierte Batch-Analyse über alle Symbole eines Bars.
+
+        Statt analyze pro Symbol aufzurufen, werden die relevanten
+        Indikator-Spalten (MA50, MA200, RSI, ATR%) einmal als
+        float64-Arrays extrahiert und alle Vergleiche als NumPy-
+        Broadcasts in C ausgeführt. Signal, Confidence und Reasoning
+        kommen pro Zeile aus demselben Tabellen-Lookup wie im skalaren
+        _combine_signals.
+        """
+        n = len(df_bar)
+        columns = ['signal', 'confidence', 'position_size',
+                   'stop_loss', 'take_profit', 'reasoning']
+        if n == 0:
+            return pd.DataFrame(columns=columns, index=df_bar.index)
+
+        inds = df_bar['indicators'].to_numpy()
+        mds = df_bar['market_data'].to_numpy()
+        ma50 = np.fromiter((i.ma50 for i in inds), np.float64, n)
+        ma200 = np.fromiter((i.ma200 for i in inds), np.float64, n)
+        rsi = np.fromiter((i.rsi for i in inds), np.float64, n)
+        atr_pct = np.fromiter((i.atr_percentage for i in inds), np.float64, n)
+        price = np.fromiter((md.price for md in mds), np.float64, n)
+
+        # Prädikate als Boolean-Arrays (entsprechen _is_trend_bullish,
+        # _get_rsi_signal und _is_volatility_acceptable pro Symbol)
+        trend_bullish = ma50 > ma200 * 1.01
+        oversold = rsi <= 30.0
+        overbought = rsi >= 70.0
+        volatility_ok = atr_pct <= 3.0
+        news_ok = self._is_news_positive(news)
+
+        # Prädikat-Bitmaske pro Symbol, dann vektorisierter Tabellen-Lookup
+        # (gleiche _SIGNAL_TABLE wie im skalaren _combine_signals)
+        mask = (
+            trend_bullish.astype(np.uint8)
+            | (volatility_ok.astype(np.uint8) << 1)
+            | (oversold.astype(np.uint8) << 2)
+            | (overbought.astype(np.uint8) << 3)
+            | (np.uint8(news_ok) << 4)
+        )
+        signal = _TABLE_SIGNAL[mask]
+        confidence = _TABLE_CONFIDENCE[mask]
+        reasoning = _TABLE_REASONING[mask]
+        buy = signal == int(TradingSignal.BUY)
+
+        max_size = self.strategy_config.max_position_size
+        stop_distance = price * 0.02 * self.strategy_config.stop_loss_atr_multiplier
+        position_size = np.where(buy, max_size, 0.0)
+        stop_loss = np.where(buy, price - stop_distance, np.nan)
+        take_profit = np.where(
+            buy, price + stop_distance * self.strategy_config.take_profit_ratio, np.nan
+        )
+
+        return pd.DataFrame({
+            'signal': signal,
+            'confidence': confidence,
+            'position_size': position_size,
+            'stop_loss': stop_loss,
+            'take_profit': take_profit,
+            'reasoning': reasoning,
+        }, index=df_bar.index, columns=columns)
+
     def _is_trend_bullish(self, indicators: TechnicalIndicators) -> bool:
         """Prüft ob Trend bullish ist (MA50 > MA200)."""
         return indicators.ma50 > indicators.ma200 * 1.01  # 1% Buffer
@@ -102,52 +251,24 @@ class ConservativeTrendStrategy(BaseStrategy):
             return True
         return news.sentiment_score >= -3 and not news.is_critical
     
-    def _combine_signals(self, trend_bullish: bool, rsi_signal: str, 
+    def _combine_signals(self, trend_bullish: bool, rsi_signal: str,
                         volatility_ok: bool, news_ok: bool) -> tuple:
-        """Kombiniert alle Signale zu einem finalen Signal."""
-        
-        reasons = []
-        
-        # BUY Bedingungen
-        if (trend_bullish and rsi_signal in ['oversold', 'neutral'] and 
-            volatility_ok and news_ok):
-            
-            signal = TradingSignal.BUY
-            confidence = 0.7
-            reasons.extend([
-                "Bullish Trend (MA50 > MA200)",
-                f"RSI {rsi_signal}",
-                "Low Volatility",
-                "Positive News"
-            ])
-            
-            if rsi_signal == 'oversold':
-                confidence += 0.1
-                
-        # SELL Bedingungen
-        elif (not trend_bullish or rsi_signal == 'overbought' or 
-              not volatility_ok or not news_ok):
-            
-            signal = TradingSignal.SELL
-            confidence = 0.6
-            
-            if not trend_bullish:
-                reasons.append("Bearish Trend")
-            if rsi_signal == 'overbought':
-                reasons.append("RSI Overbought")
-            if not volatility_ok:
-                reasons.append("High Volatility")
-            if not news_ok:
-                reasons.append("Negative News")
-        
-        # HOLD als Default
-        else:
-            signal = TradingSignal.HOLD
-            confidence = 0.5
-            reasons.append("No clear signals")
-        
-        reasoning = " | ".join(reasons)
-        return signal, confidence, reasoning
+        """
+        Kombiniert alle Signale zu einem finalen Signal.
+
+        Branchless: die Prädikate werden als Bitmaske kodiert und die
+        fertige (Signal, Confidence, Reasoning)-Kombination aus der beim
+        Import gebauten _SIGNAL_TABLE gelesen — keine if/elif-Leiter und
+        keine String-Konstruktion pro Aufruf.
+        """
+        mask = (
+            trend_bullish
+            | volatility_ok << 1
+            | (rsi_signal == 'oversold') << 2
+            | (rsi_signal == 'overbought') << 3
+            | news_ok << 4
+        )
+        return _SIGNAL_TABLE[mask]
     
     def _calculate_position_size(self, signal: TradingSignal, price: float) -> float:
         """Berechnet Position Size."""
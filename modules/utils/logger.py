@@ -195,6 +195,11 @@ class CryptoAnalysisLogger:
         }
         self.logger.info(f"Portfolio update: €{portfolio_value:.2f} ({change_pct:+.2f}%)", extra=extra_data)
     
+    def isEnabledFor(self, level: int) -> bool:
+        """Delegiert an das stdlib-Level — für Lazy-Logging-Guards in heißen
+        Schleifen, damit f-Strings nur bei aktivem Level gebaut werden."""
+        return self.logger.isEnabledFor(level)
+
     # Standard Logging-Methoden mit Security
     def debug(self, message: str, **kwargs):
         self.logger.debug(SecuritySanitizer.sanitize(message), extra=kwargs)
@@ -33,7 +33,7 @@ from dotenv import load_dotenv
 # .env Datei laden
 load_dotenv()
 
-@dataclass
+@dataclass(slots=True)
 class TradingSignalResult:
     """Repräsentiert das Ergebnis eines Trading-Signals"""
     coin: str
@@ -55,7 +55,10 @@ class PerformanceTracker:
         self.sheet_data = None
         self.processed_signals = []
         self.performance_summary = {}
-        
+        self.worksheet = None
+        # Gesammelte Zellen-Updates für einen einzigen batch_update-Call
+        self._pending_updates = []
+
     def load_data_from_sheets(self) -> bool:
         """Lädt Daten aus Google Sheets"""
         try:
@@ -68,7 +71,8 @@ class PerformanceTracker:
             gc = gspread.service_account_from_dict(credentials_dict)
             spreadsheet = gc.open("Krypto-Analyse-DB")
             worksheet = spreadsheet.worksheet("Market_Data")
-            
+            self.worksheet = worksheet
+
             # Alle Daten laden
             all_records = worksheet.get_all_records()
             self.sheet_data = pd.DataFrame(all_records)
@@ -80,6 +84,34 @@ class PerformanceTracker:
             print(f"❌ Fehler beim Laden der Google Sheets: {e}")
             return False
     
+    def queue_sheet_update(self, range_name: str, values: List[List]) -> None:
+        """Sammelt ein Zellen-Update für den nächsten Batch-Write
+
+        Einzelne `update`/`append_row`-Calls kosten je einen HTTP-Roundtrip
+        und laufen schnell ins 429-Quota. Updates werden daher gesammelt
+        und in `flush_batch` als ein einziger batch_update geschrieben.
+        """
+        self._pending_updates.append({'range': range_name, 'values': values})
+
+    def flush_batch(self) -> bool:
+        """Schreibt alle gesammelten Updates in einem batch_update-Call"""
+        if not self._pending_updates:
+            return True
+
+        if self.worksheet is None:
+            print("❌ Kein Worksheet verbunden - Batch-Updates verworfen")
+            self._pending_updates.clear()
+            return False
+
+        try:
+            self.worksheet.batch_update(self._pending_updates, value_input_option='RAW')
+            print(f"✅ {len(self._pending_updates)} Sheet-Updates in einem Batch geschrieben")
+            self._pending_updates.clear()
+            return True
+        except Exception as e:
+            print(f"❌ Fehler beim Batch-Update der Google Sheets: {e}")
+            return False
+
     def analyze_signals(self) -> List[TradingSignalResult]:
         """Analysiert Trading-Signale und berechnet Performance"""
         if self.sheet_data is None or self.sheet_data.empty:
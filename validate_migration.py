@@ -168,7 +168,7 @@ def test_data_models():
         
         print(f"📊 MarketData: {market_data.symbol} @ {market_data.price}")
         print(f"📈 Indicators: RSI {indicators.rsi}, MACD {indicators.macd}")
-        print(f"🎯 Decision: {decision.signal.value} (confidence: {decision.confidence})")
+        print(f"🎯 Decision: {decision.signal.name} (confidence: {decision.confidence})")
         
         print("✅ Datenmodelle funktionieren")
         return True